@@ -0,0 +1,110 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.deploy_state import node_value
+
+# on-run-end hook submitting the buffered applications
+SUBMIT_HOOK = "deltastream_submit_applications"
+
+
+def application_sql(application_name: str, statements: Iterable[str]) -> str:
+    """Render statements as a single BEGIN APPLICATION ... END APPLICATION block"""
+    lines = [f"BEGIN APPLICATION {application_name}"]
+    lines.extend(f"  {statement.strip().rstrip(';')};" for statement in statements)
+    lines.append("END APPLICATION;")
+    return "\n".join(lines)
+
+
+def has_submit_hook(on_run_end: Optional[Iterable[Any]]) -> bool:
+    """Whether the on-run-end hooks of the project submit the buffered applications"""
+    return any(SUBMIT_HOOK in str(hook) for hook in on_run_end or [])
+
+
+class ApplicationBuffer:
+    """
+    Statements of the models deployed together as applications at the end of the run.
+
+    A model configured with an application name joins that application. A model configured with
+    `application: true` joins the application of its DAG layer, one layer after the deepest layer
+    application creating one of its parents. Applications are submitted in the order they were
+    first buffered, so each layer is created before the layers reading from it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._layers: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, model: Any, application: Any = None) -> Optional[str]:
+        """
+        Return the application deploying the model, None to deploy it on its own.
+
+        Raises when a parent is created by an application at the end of the run that the model
+        cannot follow.
+        """
+        depends_on = node_value(model, "depends_on") or {}
+        parents = set(node_value(depends_on, "nodes") or [])
+        with self._lock:
+            pending = [
+                application_name
+                for application_name, entries in self._entries.items()
+                if any(entry["unique_id"] in parents for entry in entries)
+            ]
+            if application is True and all(name in self._layers for name in pending):
+                layer = 1 + max((self._layers[name] for name in pending), default=0)
+                package = node_value(model, "package_name") or "dbt"
+                application_name = f"{package}_layer_{layer}"
+                self._layers[application_name] = layer
+                return application_name
+            for application_name in pending:
+                if application_name != application:
+                    raise DbtRuntimeError(
+                        f"Model {node_value(model, 'unique_id')} depends on a model deployed by "
+                        f"application '{application_name}' at the end of the run. Add it to the "
+                        f"same application."
+                    )
+        return application or None
+
+    def add(
+        self,
+        application_name: str,
+        model: Any,
+        relation: Any,
+        statements: List[str],
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._entries.setdefault(application_name, []).append(
+                {
+                    "unique_id": node_value(model, "unique_id"),
+                    "model": model,
+                    "relation": relation,
+                    "statements": statements,
+                    "fingerprint": fingerprint,
+                }
+            )
+
+    def statements(self) -> Dict[str, List[str]]:
+        """Return the statements of each pending application, in the order the models ran"""
+        with self._lock:
+            return {
+                application_name: [
+                    statement for entry in entries for statement in entry["statements"]
+                ]
+                for application_name, entries in self._entries.items()
+            }
+
+    def pop(self, application_name: str) -> List[Dict[str, Any]]:
+        """Forget the statements of a submitted application and return its entries"""
+        with self._lock:
+            return self._entries.pop(application_name, [])
+
+    def pending(self) -> Dict[str, int]:
+        """Return how many models each unsubmitted application deploys"""
+        with self._lock:
+            return {
+                application_name: len(entries)
+                for application_name, entries in self._entries.items()
+            }
@@ -0,0 +1,91 @@
+from typing import Any, Dict, Optional
+
+from dbt.adapters.base import BaseRelation
+from dbt.adapters.events.logging import AdapterLogger
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.queries import QueryIndex
+
+logger = AdapterLogger("Deltastream")
+
+COLORS = ("blue", "green")
+
+
+def producer_identifier(identifier: str, color: str) -> str:
+    """Name of the blue/green producer of a relation"""
+    return f"{identifier}__{color}"
+
+
+def _is_written(index: QueryIndex, relation: BaseRelation, identifier: str) -> bool:
+    """Check whether a running query writes to `identifier` in the schema of the relation"""
+    return any(
+        (query.actual_state or "").lower() == "running"
+        for query in index.writing(relation.database, relation.schema, identifier)
+    )
+
+
+def has_running_producer(index: QueryIndex, relation: BaseRelation) -> bool:
+    """Check whether a query writing to the relation or to one of its blue/green producers is running"""
+    return any(
+        _is_written(index, relation, identifier)
+        for identifier in [relation.identifier]
+        + [producer_identifier(relation.identifier, color) for color in COLORS]
+    )
+
+
+def active_color(index: QueryIndex, relation: BaseRelation) -> Optional[str]:
+    """Return the color of the blue/green producer of the relation whose query is running"""
+    running = [
+        color
+        for color in COLORS
+        if _is_written(index, relation, producer_identifier(relation.identifier, color))
+    ]
+    if len(running) > 1:
+        raise DbtRuntimeError(
+            f"Both blue and green producers of {relation} are running, terminate the queries "
+            f"of the one that should not be active before deploying again"
+        )
+    return running[0] if running else None
+
+
+def plan_blue_green(
+    index: QueryIndex,
+    relation: BaseRelation,
+    old_relation: Optional[BaseRelation],
+    migrate: bool = False,
+) -> Dict[str, Any]:
+    """Decide the colors of a blue/green deployment and whether it migrates the existing relation
+
+    The first blue/green deployment of a relation written to by its own query replaces that query
+    with the first producer and the relation with a definition over the topic. This is only done
+    with `migrate`, since downstream queries reading the relation are interrupted when it is
+    dropped. Whenever a previous producer is running, both write to the topic for a while.
+    """
+    active = active_color(index, relation)
+    migrating = old_relation is not None and _is_written(
+        index, old_relation, old_relation.identifier
+    )
+    if migrating and not migrate:
+        raise DbtRuntimeError(
+            f"{relation} is written by its own query: its first blue/green deployment drops it "
+            f"and recreates it as a definition over its topic, which interrupts the queries "
+            f"reading it. Set blue_green_migrate: true to allow it"
+        )
+    if migrating:
+        logger.warning(
+            f"Migrating {relation} to blue/green deployments: its query is replaced by the "
+            f"{producer_identifier(relation.identifier, COLORS[0])} producer and {relation} is "
+            f"dropped and recreated as a definition over its topic, queries reading it must be "
+            f"restarted"
+        )
+    if migrating or active is not None:
+        logger.warning(
+            f"Blue/green deployment of {relation}: the previous and new producers both write to "
+            f"the topic until the previous one is terminated, downstream consumers will see the "
+            f"records of that overlap twice"
+        )
+    return {
+        "active": active,
+        "next": COLORS[1] if active == COLORS[0] else COLORS[0],
+        "migrating": migrating,
+    }
@@ -0,0 +1,88 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from dbt.adapters.deltastream.functions import get_row_value
+from dbt.adapters.deltastream.queries import QueryIndex, parse_sink_name
+
+QualifiedName = Tuple[str, str, str]
+
+
+class CascadeDropPlan(NamedTuple):
+    """Queries to terminate and relations to drop, in layers of independent relations
+
+    `unresolved` lists the (query id, sink name) of the queries writing to a partially qualified
+    relation that the session namespace cannot complete, those relations are not dropped.
+    """
+
+    query_ids: List[str]
+    layers: List[List[QualifiedName]]
+    unresolved: List[Tuple[str, str]]
+
+
+def _key(name: QualifiedName) -> QualifiedName:
+    return (name[0].lower(), name[1].lower(), name[2].lower())
+
+
+def _qualify(
+    name: Tuple[str, ...], namespace: Tuple[str, str]
+) -> Optional[QualifiedName]:
+    # Partially qualified names resolve against the current database and schema of the session
+    parts = namespace[: 3 - len(name[-3:])] + tuple(name[-3:])
+    if not all(parts):
+        return None
+    return (parts[0], parts[1], parts[2])
+
+
+def plan_cascade_drop(
+    relations: Iterable[QualifiedName],
+    index: QueryIndex,
+    namespace: Tuple[str, str] = ("", ""),
+) -> CascadeDropPlan:
+    """
+    Find every relation fed by the given ones through running queries and order their drop.
+
+    Each layer only holds relations whose dependents are all in earlier layers, so the relations of a
+    layer can be dropped concurrently once the previous layers are dropped. Names keep their case,
+    relations are matched case-insensitively. `namespace` is the (database, schema) of the session.
+    """
+    pending = list(relations)
+    names: Dict[QualifiedName, QualifiedName] = {}
+    children: Dict[QualifiedName, Set[QualifiedName]] = {}
+    query_ids: List[str] = []
+    unresolved: List[Tuple[str, str]] = []
+
+    def terminate(query_id: str) -> None:
+        if query_id and query_id not in query_ids:
+            query_ids.append(query_id)
+
+    while pending:
+        name = pending.pop()
+        key = _key(name)
+        if key in children:
+            continue
+        names[key] = name
+        children[key] = set()
+        for query in index.writing(*key):
+            terminate(query.query_id)
+        for query in index.reading(*key):
+            terminate(query.query_id)
+            sink = parse_sink_name(get_row_value(query.row, "Query"))
+            if sink:
+                child = _qualify(sink, namespace)
+                if child is None:
+                    unresolved.append((query.query_id, ".".join(sink)))
+                elif _key(child) != key:
+                    children[key].add(_key(child))
+                    pending.append(child)
+
+    layers: List[List[QualifiedName]] = []
+    dropped: Set[QualifiedName] = set()
+    remaining = set(children)
+    while remaining:
+        layer = sorted(key for key in remaining if children[key] <= dropped)
+        if not layer:
+            # Relations feeding each other are dropped last, together
+            layer = sorted(remaining)
+        layers.append([names[key] for key in layer])
+        dropped.update(layer)
+        remaining.difference_update(layer)
+    return CascadeDropPlan(query_ids, layers, unresolved)
@@ -0,0 +1,163 @@
+import json
+import os
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import agate
+from dbt.adapters.base import BaseRelation
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("Deltastream")
+
+# Id of the catalog statistic holding the change marker of a relation
+LAST_MODIFIED_STAT = "last_modified"
+
+# Catalog columns exposing the change marker as a catalog stat, compared by the next build
+MARKER_COLUMNS = [
+    f"stats:{LAST_MODIFIED_STAT}:label",
+    f"stats:{LAST_MODIFIED_STAT}:value",
+    f"stats:{LAST_MODIFIED_STAT}:description",
+    f"stats:{LAST_MODIFIED_STAT}:include",
+]
+
+CatalogKey = Tuple[str, str, str]
+
+
+class CatalogEntry(NamedTuple):
+    """Columns of a relation as recorded in a previous `catalog.json`"""
+
+    last_modified: Optional[str]
+    table_type: str
+    table_owner: str
+    table_comment: str
+    # (column_index, column_name, column_type, column_comment)
+    columns: List[Tuple[int, str, str, str]]
+
+
+def catalog_key(
+    database: Optional[str], schema: Optional[str], name: Optional[str]
+) -> CatalogKey:
+    return ((database or "").lower(), (schema or "").lower(), (name or "").lower())
+
+
+def load_previous_catalog(path: str) -> Dict[CatalogKey, CatalogEntry]:
+    """Read the relations of a previous `catalog.json`, or nothing if it is missing or unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable catalog {path}: {str(e)}")
+        return {}
+
+    entries: Dict[CatalogKey, CatalogEntry] = {}
+    for section in ("nodes", "sources"):
+        for table in (content.get(section) or {}).values():
+            metadata = table.get("metadata") or {}
+            stat = (table.get("stats") or {}).get(LAST_MODIFIED_STAT) or {}
+            columns = [
+                (
+                    int(column.get("index") or 0),
+                    column.get("name") or "",
+                    column.get("type") or "",
+                    column.get("comment") or "",
+                )
+                for column in (table.get("columns") or {}).values()
+            ]
+            key = catalog_key(
+                metadata.get("database"), metadata.get("schema"), metadata.get("name")
+            )
+            entries[key] = CatalogEntry(
+                last_modified=stat.get("value"),
+                table_type=metadata.get("type") or "TABLE",
+                table_owner=metadata.get("owner") or "",
+                table_comment=metadata.get("comment") or "",
+                columns=sorted(columns),
+            )
+    return entries
+
+
+def previous_catalog_path(target_path: Any) -> Optional[str]:
+    if not isinstance(target_path, str):
+        return None
+    return os.path.join(target_path, "catalog.json")
+
+
+def marker_column_types() -> List[Any]:
+    return [agate.Text(), agate.Text(), agate.Text(), agate.Boolean()]
+
+
+def marker_stats(marker: Optional[str]) -> Dict[str, Any]:
+    """Return the values of the marker columns of a catalog row"""
+    return dict(
+        zip(
+            MARKER_COLUMNS,
+            [
+                "Last Modified",
+                marker,
+                "Last change of the relation in the DeltaStream system catalog",
+                marker is not None,
+            ],
+        )
+    )
+
+
+def catalog_markers(
+    last_modified: Callable[[str, List[BaseRelation]], Tuple[Any, agate.Table]],
+    relations: List[BaseRelation],
+) -> Dict[CatalogKey, Optional[str]]:
+    """Get the change marker of relations with one `last_modified` query per database"""
+    by_database: Dict[str, List[BaseRelation]] = {}
+    for relation in relations:
+        by_database.setdefault(relation.database or "", []).append(relation)
+
+    markers: Dict[CatalogKey, Optional[str]] = {}
+    for database, database_relations in by_database.items():
+        try:
+            (_, table) = last_modified(database, database_relations)
+        except Exception as e:
+            # Without markers every relation is described again
+            logger.debug(f"Unable to get change markers for {database}: {str(e)}")
+            continue
+        for row in table.rows:
+            marker = row[2]
+            markers[catalog_key(database, row[0], row[1])] = (
+                marker.isoformat() if marker is not None else None
+            )
+    return markers
+
+
+def reuse_previous_catalog(
+    relations: List[BaseRelation],
+    markers: Dict[CatalogKey, Optional[str]],
+    previous: Dict[CatalogKey, CatalogEntry],
+) -> Tuple[List[Dict[str, Any]], List[BaseRelation]]:
+    """
+    Return the catalog rows of the relations whose change marker matches the previous catalog, and
+    the relations to describe again.
+    """
+    rows: List[Dict[str, Any]] = []
+    to_describe: List[BaseRelation] = []
+    for relation in relations:
+        key = catalog_key(relation.database, relation.schema, relation.identifier)
+        entry = previous.get(key)
+        marker = markers.get(key)
+        if marker is None or entry is None or entry.last_modified != marker:
+            to_describe.append(relation)
+            continue
+        for column_index, name, data_type, comment in entry.columns:
+            rows.append(
+                {
+                    "table_database": relation.database,
+                    "table_schema": relation.schema,
+                    "table_name": relation.identifier,
+                    "table_type": entry.table_type,
+                    "table_comment": entry.table_comment,
+                    "column_name": name,
+                    "column_index": column_index,
+                    "column_type": data_type,
+                    "column_comment": comment,
+                    "table_owner": entry.table_owner,
+                }
+            )
+    return rows, to_describe
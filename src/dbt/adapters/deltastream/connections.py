@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple, Dict
+from typing import Callable, List, Optional, Tuple, Dict
 from dbt.adapters.events.logging import AdapterLogger
 from dbt.adapters.base import BaseConnectionManager
 from dbt.adapters.contracts.connection import (
@@ -16,9 +16,65 @@ from dbt_common.exceptions import DbtRuntimeError
 import agate
 import asyncio
 import os
+import re
 
 logger = AdapterLogger("deltastream")
 
+_LEADING_COMMENTS = re.compile(r"^\s*(?:/\*.*?\*/\s*|--[^\n]*(?:\n|$)\s*)*", re.DOTALL)
+_DDL_STATEMENT = re.compile(
+    r"^(CREATE|DROP|UPDATE|ALTER|TRUNCATE|TERMINATE|RESTART|BEGIN)\s+(MATERIALIZED\s+VIEW|\w+)\s*",
+    re.IGNORECASE,
+)
+_QUERY_STATEMENT = re.compile(r"^[\s(]*(SELECT|WITH)\b", re.IGNORECASE)
+_NAME_PART = re.compile(r'\s*(?:"((?:[^"]|"")*)"|`([^`]*)`|([\w$]+))')
+
+
+def parse_ddl_statement(sql: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Parse a DDL statement into its verb, object type and the remaining text.
+
+    e.g. 'create stream "db"."schema"."s" as select ...' -> ('CREATE', 'STREAM', '"db"."schema"."s" as select ...')
+    Returns None for statements that do not change metadata (queries, inserts, lists...).
+    """
+    body = _LEADING_COMMENTS.sub("", sql, count=1)
+    match = _DDL_STATEMENT.match(body)
+    if not match:
+        return None
+    verb = match.group(1).upper()
+    object_type = " ".join(match.group(2).upper().split())
+    return verb, object_type, body[match.end() :]
+
+
+def is_query(sql: str) -> bool:
+    """
+    Whether SQL is a query, i.e. starts with SELECT or WITH once leading comments are skipped.
+
+    e.g. '(select ...) union ...' is a query, a model body only mentioning 'selected_at' is not.
+    """
+    body = _LEADING_COMMENTS.sub("", sql, count=1)
+    return _QUERY_STATEMENT.match(body) is not None
+
+
+def parse_qualified_name(text: str) -> List[str]:
+    """Parse the leading (optionally quoted) dotted identifier of a SQL fragment into its parts"""
+    parts: List[str] = []
+    position = 0
+    while True:
+        match = _NAME_PART.match(text, position)
+        if not match:
+            break
+        quoted, backquoted, bare = match.groups()
+        if quoted is not None:
+            parts.append(quoted.replace('""', '"'))
+        else:
+            parts.append(backquoted if backquoted is not None else bare)
+        position = match.end()
+        if position < len(text) and text[position] == ".":
+            position += 1
+        else:
+            break
+    return parts
+
 
 class DeltastreamConnectionManager(BaseConnectionManager):
     TYPE = "deltastream"
@@ -30,6 +86,26 @@ class DeltastreamConnectionManager(BaseConnectionManager):
         SqlState.SQL_STATE_DUPLICATE_RELATION: True,  # Table/relation already exists
     }
 
+    def __init__(self, profile, mp_context) -> None:
+        super().__init__(profile, mp_context)
+        self._ddl_listeners: List[Callable[[str, str, str], None]] = []
+
+    def add_ddl_listener(self, listener: Callable[[str, str, str], None]) -> None:
+        """Register a callback invoked with (verb, object type, remaining sql) after each successful DDL statement"""
+        self._ddl_listeners.append(listener)
+
+    def _notify_ddl(self, sql: str) -> None:
+        if not self._ddl_listeners:
+            return
+        statement = parse_ddl_statement(sql)
+        if statement is None:
+            return
+        for listener in self._ddl_listeners:
+            try:
+                listener(*statement)
+            except Exception as e:
+                logger.debug(f"DDL listener failed: {str(e)}")
+
     @classmethod
     def open(cls, connection):
         if connection.state == ConnectionState.OPEN:
@@ -87,14 +163,15 @@ class DeltastreamConnectionManager(BaseConnectionManager):
 
         # Use appropriate execution method
         if files_to_attach:
-            return self.exec_with_files(sql, files_to_attach)
+            result = self.exec_with_files(sql, files_to_attach)
         else:
             # Check if this is a function creation that might need retry logic
             if self._is_function_creation(sql):
-                return self._query_with_function_retry(sql)
+                result = self._query_with_function_retry(sql)
             else:
                 result = asyncio.run(self.async_query(sql))
-                return result
+        self._notify_ddl(sql)
+        return result
 
     async def async_query(self, sql: str) -> Tuple[AdapterResponse, "agate.Table"]:
         conn = self.get_thread_connection()
@@ -109,6 +186,99 @@ class DeltastreamConnectionManager(BaseConnectionManager):
         table = agate.Table(data, column_names=[col.name for col in columns])
         return response, table
 
+    def query_bounded(
+        self, sql: str, timeout_seconds: float, max_rows: Optional[int] = None
+    ) -> Tuple[AdapterResponse, "agate.Table"]:
+        """
+        Execute a query but only read its results for a bounded amount of time and rows.
+
+        Queries on streams are continuous and never complete on their own, this returns
+        whatever rows were received before the timeout or the row limit was reached.
+        """
+        return asyncio.run(self.async_query_bounded(sql, timeout_seconds, max_rows))
+
+    async def async_query_bounded(
+        self, sql: str, timeout_seconds: float, max_rows: Optional[int] = None
+    ) -> Tuple[AdapterResponse, "agate.Table"]:
+        conn = self.get_thread_connection()
+        api: APIConnection = conn.handle
+        logger.debug(f"Executing (bounded to {timeout_seconds}s): {sql}")
+        column_names: List[str] = []
+        data: List[List] = []
+        rows = None
+
+        async def consume():
+            nonlocal rows
+            rows = await api.query(sql)
+            column_names.extend(col.name for col in rows.columns())
+            async for row in rows:
+                data.append(list(row) if row is not None else [])
+                if max_rows is not None and len(data) >= max_rows:
+                    break
+
+        try:
+            await asyncio.wait_for(consume(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.debug(
+                f"Stopped reading results after {timeout_seconds}s ({len(data)} rows)"
+            )
+        finally:
+            # A continuous query keeps streaming until its result set is closed
+            if rows is not None:
+                await rows.close()
+        response = AdapterResponse("OK", "OK", rows_affected=len(data))
+        table = agate.Table(data, column_names=column_names)
+        return response, table
+
+    def execute_pipelined(self, lanes: List[List[str]], max_in_flight: int) -> int:
+        """
+        Execute statements concurrently and return how many ran.
+
+        Statements of a lane run one after the other, while up to `max_in_flight` lanes have a
+        statement pending at the same time. The first failure stops every lane and is raised.
+        """
+        return asyncio.run(self.async_execute_pipelined(lanes, max_in_flight))
+
+    async def async_execute_pipelined(
+        self, lanes: List[List[str]], max_in_flight: int
+    ) -> int:
+        conn = self.get_thread_connection()
+        # An APIConnection updates its session context from each response, so every in-flight
+        # slot gets its own client and the thread connection only serves the first slot
+        slots = max(1, min(max_in_flight, len(lanes)))
+        apis: List[APIConnection] = [conn.handle] + [
+            create_deltastream_client(conn.credentials) for _ in range(slots - 1)
+        ]
+        pending: asyncio.Queue = asyncio.Queue()
+        for lane in lanes:
+            pending.put_nowait(lane)
+        errors: List[BaseException] = []
+        executed = 0
+
+        async def worker(api: APIConnection):
+            nonlocal executed
+            while not errors and not pending.empty():
+                for sql in pending.get_nowait():
+                    if errors:
+                        return
+                    logger.debug(f"Executing: {sql}")
+                    try:
+                        rows = await api.query(sql)
+                        try:
+                            async for _ in rows:
+                                pass
+                        finally:
+                            await rows.close()
+                    except Exception as e:
+                        errors.append(e)
+                        return
+                    executed += 1
+
+        await asyncio.gather(*(worker(api) for api in apis))
+        if errors:
+            raise errors[0]
+        return executed
+
     def _is_function_creation(self, sql: str) -> bool:
         """Check if the SQL is a function creation statement"""
         return "CREATE FUNCTION" in sql.upper()
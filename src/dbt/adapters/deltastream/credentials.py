@@ -29,6 +29,15 @@ class DeltastreamCredentials(Credentials):
     # Authentication
     token: str = ""  # Required
 
+    # On-disk metadata cache shared across invocations (stored in the target directory)
+    metadata_cache: bool = False
+    metadata_cache_ttl_seconds: int = 300
+    # Discard the persisted metadata and fetch it again
+    metadata_cache_refresh: bool = False
+
+    # File recording the fingerprint of deployed models, defaults to the target directory
+    deploy_state_path: Optional[str] = None
+
     @property
     def type(self):
         return "deltastream"
@@ -41,6 +50,10 @@ class DeltastreamCredentials(Credentials):
         return (
             "compute_pool",
             "database",
+            "deploy_state_path",
+            "metadata_cache",
+            "metadata_cache_refresh",
+            "metadata_cache_ttl_seconds",
             "organization_id",
             "role",
             "schema",
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import time
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from dbt.adapters.events.logging import AdapterLogger
+
+from dbt.adapters.deltastream.state_file import JsonStateFile
+
+logger = AdapterLogger("Deltastream")
+
+# Column properties that change the deployed relation, documentation-only properties are ignored
+_FINGERPRINTED_COLUMN_KEYS = ("type", "data_type", "nullable", "constraints")
+
+
+def node_value(node: Any, key: str, default: Any = None) -> Any:
+    """Read a property of a dbt node given either as a dictionary or an object"""
+    if isinstance(node, Mapping):
+        return node.get(key, default)
+    return getattr(node, key, default)
+
+
+# Config of each materialization that changes a deployment without changing its compiled SQL
+_FINGERPRINTED_CONFIG: Dict[str, Dict[str, Any]] = {
+    "stream": {"deploy_strategy": "recreate"},
+    "changelog": {"primary_key": None, "deploy_strategy": "recreate"},
+}
+
+
+def config_value(config: Any, key: str, default: Any = None) -> Any:
+    """Read a key of a node config given as a dictionary or as a dbt config object"""
+    if isinstance(config, Mapping):
+        return config.get(key, default)
+    getter = getattr(config, "get", None)
+    if callable(getter):
+        return getter(key, default)
+    return getattr(config, key, default)
+
+
+def fingerprint_extra(materialization: str, config: Any) -> Dict[str, Any]:
+    """Return the config of a model that is part of its deployment fingerprint"""
+    return {
+        key: config_value(config, key, default)
+        for key, default in _FINGERPRINTED_CONFIG.get(materialization, {}).items()
+    }
+
+
+def compute_fingerprint(
+    materialization: str,
+    sql: Optional[str],
+    parameters: Optional[Mapping[str, Any]],
+    columns: Optional[Mapping[str, Any]],
+    upstream_fingerprints: Mapping[str, Optional[str]],
+    extra: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """Hash everything that defines a deployed relation into a stable fingerprint"""
+    normalized_columns = {}
+    for name, column in (columns or {}).items():
+        normalized_columns[name] = {
+            key: node_value(column, key)
+            for key in _FINGERPRINTED_COLUMN_KEYS
+            if node_value(column, key) not in (None, [], {})
+        }
+    content = {
+        "materialization": materialization,
+        # Whitespace-only changes of the compiled SQL do not require a redeploy
+        "sql": " ".join((sql or "").split()),
+        "parameters": parameters or {},
+        "columns": normalized_columns,
+        "upstream": dict(sorted(upstream_fingerprints.items())),
+        "extra": extra or {},
+    }
+    serialized = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class DeployStateStore(JsonStateFile):
+    """
+    JSON file recording the fingerprint of the last deployment of each model.
+
+    Records are keyed by node unique id and hold the deployed relation, so that a model is only
+    considered unchanged while it is deployed to the same relation.
+    """
+
+    FILE_NAME = "deltastream_deploy_state.json"
+    SECTION = "nodes"
+    DESCRIPTION = "deploy state"
+    DUMP_OPTIONS = {"default": str, "indent": 2, "sort_keys": True}
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self._records: Dict[str, Dict[str, Any]] = self._read()
+
+    def _snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return self._records
+
+    def get(self, unique_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(unique_id)
+            return dict(record) if record is not None else None
+
+    def records(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                unique_id: dict(record) for unique_id, record in self._records.items()
+            }
+
+    def fingerprint(self, unique_id: str) -> Optional[str]:
+        record = self.get(unique_id)
+        return record.get("fingerprint") if record else None
+
+    def is_deployed(self, unique_id: str, relation: str, fingerprint: str) -> bool:
+        """Check whether the model was last deployed to the relation with the fingerprint"""
+        record = self.get(unique_id)
+        return (
+            record is not None
+            and record.get("relation") == relation
+            and record.get("fingerprint") == fingerprint
+        )
+
+    def put(
+        self, unique_id: str, relation: str, fingerprint: str, **extra: Any
+    ) -> None:
+        with self._lock:
+            self._records[unique_id] = {
+                "relation": relation,
+                "fingerprint": fingerprint,
+                "deployed_at": time.time(),
+                **extra,
+            }
+            self._dirty = True
+
+    def update(self, unique_id: str, **values: Any) -> None:
+        """Merge values into an existing record"""
+        with self._lock:
+            if unique_id in self._records:
+                self._records[unique_id].update(values)
+                self._dirty = True
+
+    def remove(self, unique_id: str) -> None:
+        with self._lock:
+            if self._records.pop(unique_id, None) is not None:
+                self._dirty = True
+
+    def remove_relations(self, relations: Iterable[str]) -> None:
+        """Forget the deployments of relations, e.g. after they were dropped"""
+        targets = {relation.lower() for relation in relations}
+        with self._lock:
+            for unique_id in [
+                unique_id
+                for unique_id, record in self._records.items()
+                if str(record.get("relation", "")).lower() in targets
+            ]:
+                del self._records[unique_id]
+                self._dirty = True
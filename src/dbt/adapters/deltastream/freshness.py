@@ -0,0 +1,181 @@
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, List, Optional, Tuple
+
+import agate
+from dbt.adapters.base import BaseRelation
+from dbt.adapters.contracts.connection import AdapterResponse
+from dbt.adapters.events.logging import AdapterLogger
+from dbt_common.exceptions import DbtRuntimeError
+
+logger = AdapterLogger("Deltastream")
+
+# Freshness reads start this far back from now and widen by this factor while no record is found
+FRESHNESS_FIRST_WINDOW = timedelta(minutes=5)
+FRESHNESS_WINDOW_GROWTH = 6
+
+Query = Callable[[str], Tuple[AdapterResponse, agate.Table]]
+BoundedQuery = Callable[
+    [str, float, Optional[int]], Tuple[AdapterResponse, agate.Table]
+]
+
+
+def to_utc_datetime(value: Any) -> Optional[datetime]:
+    """Convert a timestamp value returned by DeltaStream (datetime, ISO string or epoch) to a UTC datetime"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, (int, float, Decimal)) or (
+        isinstance(value, str) and value.strip().lstrip("-").isdigit()
+    ):
+        epoch = float(value)
+        # Epochs above this bound can only be milliseconds (year 5138 in seconds)
+        if abs(epoch) > 1e11:
+            epoch = epoch / 1000
+        return datetime.fromtimestamp(epoch, tz=timezone.utc)
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).strip())
+        except ValueError:
+            logger.debug(f"Unable to parse timestamp value: {value}")
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _unquote(identifier: str) -> str:
+    if identifier.startswith('"') and identifier.endswith('"'):
+        identifier = identifier[1:-1]
+    return identifier
+
+
+def _quote_list(values: List[str]) -> str:
+    return ", ".join("'{}'".format(value.replace("'", "''")) for value in values)
+
+
+def relations_last_modified(
+    query: Query, database: str, relations: List[BaseRelation]
+) -> Tuple[AdapterResponse, agate.Table]:
+    """
+    Get the time of the last DDL change of many relations with a single system catalog query.
+
+    This is when a relation was created or altered, not when data last arrived: it serves as a
+    change marker for incremental catalogs and deployment plans, not for source freshness.
+    """
+    column_names = ["schema", "identifier", "last_modified", "snapshotted_at"]
+    column_types = [agate.Text(), agate.Text(), agate.DateTime(), agate.DateTime()]
+    if not relations:
+        return AdapterResponse("OK", "OK"), agate.Table([], column_names, column_types)
+
+    requested = {
+        ((relation.schema or "").lower(), (relation.identifier or "").lower())
+        for relation in relations
+    }
+    schemas = sorted({schema for schema, _ in requested})
+    identifiers = sorted({identifier for _, identifier in requested})
+
+    sql = (
+        "select schema_name, name, created_at, updated_at "
+        'from deltastream.sys."relations" '
+        "where database_name = '{}' "
+        "and lower(schema_name) in ({}) "
+        "and lower(name) in ({});".format(
+            database.replace("'", "''"),
+            _quote_list(schemas),
+            _quote_list(identifiers),
+        )
+    )
+    (response, table) = query(sql)
+    snapshotted_at = datetime.now(timezone.utc)
+
+    rows = []
+    for row in table.rows:
+        schema_name = _unquote(str(row[0]))
+        name = _unquote(str(row[1]))
+        # The batched filter is a cross product of schemas and names, keep only requested pairs
+        if (schema_name.lower(), name.lower()) not in requested:
+            continue
+        last_modified = to_utc_datetime(row[3]) or to_utc_datetime(row[2])
+        rows.append([schema_name, name, last_modified, snapshotted_at])
+
+    return response, agate.Table(rows, column_names, column_types)
+
+
+def freshness_windows(lookback_hours: float) -> List[timedelta]:
+    """Return the growing windows read back from now, the last one covering the whole lookback"""
+    lookback = timedelta(hours=lookback_hours)
+    windows = [min(FRESHNESS_FIRST_WINDOW, lookback)]
+    while windows[-1] < lookback:
+        windows.append(min(windows[-1] * FRESHNESS_WINDOW_GROWTH, lookback))
+    return windows
+
+
+def collect_freshness(
+    query_bounded: BoundedQuery,
+    source: BaseRelation,
+    loaded_at_field: str,
+    filter: Optional[str] = None,
+    timeout_seconds: float = 10,
+    lookback_hours: float = 24,
+    max_rows: Optional[int] = 100000,
+) -> Tuple[AdapterResponse, agate.Table]:
+    """Compute the freshness of a source from bounded, time-boxed reads of its latest records.
+
+    Streams never complete, so reads are time-boxed: all reads of a source share `timeout_seconds`,
+    and each read stops at `max_rows`. Reads start close to the tail of the source, and only go
+    further back, up to `lookback_hours`, while no record is found: a busy source is never judged by
+    the oldest records of a long window. A source without records in the whole window is an error.
+    """
+    snapshotted_at = datetime.now(timezone.utc)
+    windows = freshness_windows(lookback_hours)
+
+    deadline = time.monotonic() + max(timeout_seconds, 0)
+    max_loaded_at: Optional[datetime] = None
+    response = AdapterResponse("OK", "OK")
+    for step, window in enumerate(windows):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        starting_ms = int((snapshotted_at - window).timestamp() * 1000)
+        sql = (
+            f"SELECT {loaded_at_field} AS loaded_at FROM {source} "
+            f"WITH ('starting.position' = 'timestamp', "
+            f"'starting.timestamp.ms' = {starting_ms})"
+        )
+        if filter:
+            sql += f" WHERE {filter}"
+        sql += ";"
+
+        # An idle source waits for the whole timeout of every read, split the remaining time
+        (response, table) = query_bounded(
+            sql, remaining / (len(windows) - step), max_rows
+        )
+        for row in table.rows:
+            loaded_at = to_utc_datetime(row[0])
+            if loaded_at is not None and (
+                max_loaded_at is None or loaded_at > max_loaded_at
+            ):
+                max_loaded_at = loaded_at
+        if max_loaded_at is not None:
+            if max_rows is not None and len(table.rows) >= max_rows:
+                logger.debug(
+                    f"Freshness read of {source} stopped at {max_rows} rows, "
+                    f"its freshness may be understated by up to {window}"
+                )
+            break
+
+    if max_loaded_at is None:
+        raise DbtRuntimeError(
+            f"No data in window: no record of {source} with a {loaded_at_field} value "
+            f"in the last {lookback_hours} hours, read for {timeout_seconds} seconds"
+        )
+
+    result = agate.Table(
+        [[max_loaded_at, snapshotted_at]],
+        ["max_loaded_at", "snapshotted_at"],
+        [agate.DateTime(), agate.DateTime()],
+    )
+    return response, result
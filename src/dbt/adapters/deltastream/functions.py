@@ -0,0 +1,168 @@
+import re
+import threading
+from typing import Any, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import agate
+
+# Type names accepted by DeltaStream as synonyms, mapped to their canonical spelling
+TYPE_ALIASES = {
+    "INT": "INTEGER",
+    "BOOL": "BOOLEAN",
+    "STRING": "VARCHAR",
+    "DEC": "DECIMAL",
+    "NUMERIC": "DECIMAL",
+}
+
+_WORD = re.compile(r"[A-Z_][A-Z0-9_]*")
+_SPACES_AROUND_DELIMITERS = re.compile(r"\s*([<>(),])\s*")
+
+
+class FunctionSignature(NamedTuple):
+    """A function overload identified by its lowercased name and canonical argument types"""
+
+    name: str
+    arg_types: Tuple[str, ...]
+
+
+def normalize_type(data_type: str) -> str:
+    """Canonicalize a SQL type: uppercase, collapsed whitespace and resolved aliases"""
+    normalized = " ".join(data_type.upper().split())
+    normalized = _SPACES_AROUND_DELIMITERS.sub(r"\1", normalized)
+    normalized = normalized.replace(",", ", ")
+    return _WORD.sub(lambda m: TYPE_ALIASES.get(m.group(0), m.group(0)), normalized)
+
+
+def split_top_level(text: str, separator: str = ",") -> List[str]:
+    """Split on a separator ignoring separators nested in <>, () or quotes"""
+    parts = []
+    depth = 0
+    quote: Optional[str] = None
+    current: List[str] = []
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ('"', "`", "'"):
+            quote = char
+        elif char in "<(":
+            depth += 1
+        elif char in ">)":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    tail = "".join(current).strip()
+    if tail or parts:
+        parts.append(tail)
+    return parts
+
+
+def _strip_identifier_quotes(identifier: str) -> str:
+    identifier = identifier.strip()
+    if (
+        len(identifier) >= 2
+        and identifier[0] == identifier[-1]
+        and identifier[0] in '"`'
+    ):
+        return identifier[1:-1]
+    return identifier
+
+
+def make_signature(name: str, arg_types: Iterable[str]) -> FunctionSignature:
+    return FunctionSignature(
+        _strip_identifier_quotes(name).lower(),
+        tuple(normalize_type(arg_type) for arg_type in arg_types),
+    )
+
+
+def parse_signature(text: str) -> Optional[FunctionSignature]:
+    """
+    Parse a function signature such as `my_func(a INTEGER, b ARRAY<VARCHAR>) RETURNS ...`.
+
+    Argument names are ignored: overloads are identified by their argument types only.
+    Returns None if the text is not a signature.
+    """
+    open_index = text.find("(")
+    if open_index <= 0:
+        return None
+    depth = 0
+    close_index = -1
+    for index in range(open_index, len(text)):
+        if text[index] == "(":
+            depth += 1
+        elif text[index] == ")":
+            depth -= 1
+            if depth == 0:
+                close_index = index
+                break
+    if close_index < 0:
+        return None
+
+    name = text[:open_index].strip()
+    if not name:
+        return None
+    arg_types = []
+    for argument in split_top_level(text[open_index + 1 : close_index]):
+        tokens = argument.split(None, 1)
+        if not tokens:
+            continue
+        # `name TYPE`, or just `TYPE` for anonymous arguments
+        arg_types.append(tokens[1] if len(tokens) == 2 else tokens[0])
+    return make_signature(name, arg_types)
+
+
+def signature_from_parameters(identifier: str, parameters: dict) -> FunctionSignature:
+    """Build the signature of a function from its dbt `parameters` config"""
+    return make_signature(
+        identifier,
+        [arg.get("type", "VARCHAR") for arg in parameters.get("args", []) or []],
+    )
+
+
+def get_row_value(row: Any, column: str) -> Optional[Any]:
+    """Read a column from a result row which may be an agate row, a dict or an object"""
+    if isinstance(row, dict):
+        return row.get(column)
+    if isinstance(row, agate.MappedSequence):
+        try:
+            return row[column]
+        except KeyError:
+            return None
+    return getattr(row, column, None)
+
+
+class FunctionIndex:
+    """Set of existing function overloads, built once from `LIST FUNCTIONS;` and kept up to date"""
+
+    def __init__(self, signatures: Iterable[FunctionSignature] = ()) -> None:
+        self._lock = threading.Lock()
+        self._signatures: Set[FunctionSignature] = set(signatures)
+
+    @classmethod
+    def from_table(cls, table: Iterable[Any]) -> "FunctionIndex":
+        signatures = []
+        for row in getattr(table, "rows", table) or []:
+            text = get_row_value(row, "Signature")
+            if isinstance(text, str):
+                signature = parse_signature(text)
+                if signature is not None:
+                    signatures.append(signature)
+        return cls(signatures)
+
+    def __contains__(self, signature: FunctionSignature) -> bool:
+        with self._lock:
+            return signature in self._signatures
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._signatures)
+
+    def add(self, signature: FunctionSignature) -> None:
+        with self._lock:
+            self._signatures.add(signature)
+
+    def discard(self, signature: FunctionSignature) -> None:
+        with self._lock:
+            self._signatures.discard(signature)
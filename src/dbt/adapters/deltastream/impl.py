@@ -1,8 +1,11 @@
 from dataclasses import dataclass
+from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.contracts.relation import Path
 from dbt.adapters.events.logging import AdapterLogger
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import concurrent.futures
+import threading
+import time
 
 import dbt_common.exceptions
 from dbt_common.contracts.constraints import (
@@ -18,11 +21,92 @@ from dbt.adapters.capability import (
     Support,
 )
 from deltastream.api.error import SQLError
-from dbt.adapters.deltastream.connections import DeltastreamConnectionManager
+from dbt.adapters.deltastream.applications import (
+    SUBMIT_HOOK,
+    ApplicationBuffer,
+    application_sql,
+    has_submit_hook,
+)
+from dbt.adapters.deltastream.blue_green import (
+    active_color,
+    has_running_producer,
+    plan_blue_green,
+)
+from dbt.adapters.deltastream.cascade import plan_cascade_drop
+from dbt.adapters.deltastream.catalog import (
+    MARKER_COLUMNS,
+    CatalogKey,
+    catalog_key,
+    catalog_markers,
+    load_previous_catalog,
+    marker_column_types,
+    marker_stats,
+    previous_catalog_path,
+    reuse_previous_catalog,
+)
+from dbt.adapters.deltastream.connections import (
+    DeltastreamConnectionManager,
+    is_query,
+    parse_qualified_name,
+)
+from dbt.adapters.deltastream.deploy_state import (
+    DeployStateStore,
+    compute_fingerprint,
+    fingerprint_extra,
+    node_value,
+)
+from dbt.adapters.deltastream.freshness import (
+    collect_freshness,
+    relations_last_modified,
+)
+from dbt.adapters.deltastream.functions import (
+    FunctionIndex,
+    get_row_value,
+    parse_signature,
+    signature_from_parameters,
+)
+from dbt.adapters.deltastream.metadata_cache import DeltastreamMetadataCache
+from dbt.adapters.deltastream.plan import (
+    FINGERPRINTED_MATERIALIZATIONS,
+    RESOURCE_LIST_TYPES,
+    ExistingState,
+    compiled_sql,
+    compute_plan,
+    node_materialization,
+    node_parameters,
+    relation_key,
+    relation_keys_by_database,
+    write_plan,
+)
+from dbt.adapters.deltastream.monitor import query_metrics, sample_queries
+from dbt.adapters.deltastream.queries import (
+    QUERY_ACTIONS,
+    QueryIndex,
+    QueryInfo,
+    poll_queries,
+    summarize_query_action,
+)
 from dbt.adapters.deltastream.relation import (
     DeltastreamRelation,
     DeltastreamRelationType,
 )
+from dbt.adapters.deltastream.resource_parameters import (
+    diff_parameters,
+    parameter_digests,
+    properties_from_rows,
+    updatable_parameters,
+)
+from dbt.adapters.deltastream.seeds import (
+    DEFAULT_CHUNK_SIZE,
+    SeedDelta,
+    SeedStateStore,
+    encode_table_records,
+    insert_statements,
+    partition_by_key,
+    profile_column_types,
+    read_csv_chunks,
+)
+from dbt.adapters.deltastream.sources import plan_source_layers
 from dbt.adapters.base import (
     BaseAdapter,
     BaseRelation,
@@ -60,15 +144,255 @@ class DeltastreamAdapter(BaseAdapter):
             Capability.SchemaMetadataByRelations: CapabilitySupport(
                 support=Support.NotImplemented
             ),
+            # The system catalog only knows when a relation was last altered, not when data last
+            # arrived, so freshness always needs a `loaded_at_field`
             Capability.TableLastModifiedMetadata: CapabilitySupport(
-                support=Support.NotImplemented
+                support=Support.Unsupported
+            ),
+            Capability.TableLastModifiedMetadataBatch: CapabilitySupport(
+                support=Support.Unsupported
             ),
         }
     )
 
+    # DDL object types that change the relations of a schema
+    RELATION_OBJECT_TYPES = {
+        "STREAM",
+        "CHANGELOG",
+        "TABLE",
+        "MATERIALIZED VIEW",
+        "VIEW",
+        "RELATION",
+    }
+
+    # DDL object types mapped to the LIST statement returning them
+    LIST_OBJECT_TYPES = {
+        "COMPUTE_POOL": "COMPUTE_POOLS",
+        "DESCRIPTOR_SOURCE": "DESCRIPTOR_SOURCES",
+        "ENTITY": "ENTITIES",
+        "FUNCTION": "FUNCTIONS",
+        "FUNCTION_SOURCE": "FUNCTION_SOURCES",
+        "SCHEMA_REGISTRY": "SCHEMA_REGISTRIES",
+        "STORE": "STORES",
+    }
+
     def __init__(self, config, mp_context: SpawnContext) -> None:
         super().__init__(config, mp_context)
         self.connections: DeltastreamConnectionManager = self.connections
+        self._metadata_cache: Optional[DeltastreamMetadataCache] = None
+        self._metadata_cache_loaded = False
+        self._metadata_cache_lock = threading.Lock()
+        # Run-scoped memo of DESCRIBE RELATION COLUMNS results keyed by fully qualified relation
+        self._columns_cache: Dict[Tuple[str, str, str], List[DeltastreamColumn]] = {}
+        self._columns_cache_lock = threading.Lock()
+        # Run-scoped set of relations known not to exist, cleared when the adapter creates them
+        self._absent_relations: Set[Tuple[str, str, str]] = set()
+        self._absent_relations_lock = threading.Lock()
+        # Existing function overloads, built once from LIST FUNCTIONS and updated on CREATE/DROP FUNCTION
+        self._function_index: Optional[FunctionIndex] = None
+        self._function_index_lock = threading.Lock()
+        # Snapshot of LIST QUERIES, refreshed after statements starting or stopping queries
+        self._query_index: Optional[QueryIndex] = None
+        self._query_index_lock = threading.Lock()
+        self._deploy_state: Optional[DeployStateStore] = None
+        self._deploy_state_loaded = False
+        self._deploy_state_lock = threading.Lock()
+        self._seed_state: Optional[SeedStateStore] = None
+        self._seed_state_loaded = False
+        self._seed_state_lock = threading.Lock()
+        # Row hashes of delta seeds, recorded in the seed state once the seed is loaded
+        self._pending_seed_deltas: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        # Statements of models deployed together as one application at the end of the run
+        self._applications = ApplicationBuffer()
+        self.connections.add_ddl_listener(self._on_ddl)
+
+    @staticmethod
+    def _relation_key(
+        database: Optional[str], schema: Optional[str], identifier: Optional[str]
+    ) -> Tuple[str, str, str]:
+        return (
+            (database or "").lower(),
+            (schema or "").lower(),
+            (identifier or "").lower(),
+        )
+
+    def _forget_columns(
+        self,
+        database: Optional[str],
+        schema: Optional[str],
+        identifier: Optional[str],
+    ) -> None:
+        """Drop the memoized columns of a relation whose definition changed"""
+        with self._columns_cache_lock:
+            self._columns_cache.pop(
+                self._relation_key(database, schema, identifier), None
+            )
+
+    def _forget_absent(
+        self,
+        database: Optional[str],
+        schema: Optional[str],
+        identifier: Optional[str],
+    ) -> None:
+        """Stop treating a relation as known-absent, e.g. because it was just created"""
+        with self._absent_relations_lock:
+            self._absent_relations.discard(
+                self._relation_key(database, schema, identifier)
+            )
+
+    def _get_metadata_cache(self) -> Optional[DeltastreamMetadataCache]:
+        """Return the on-disk metadata cache if enabled with `metadata_cache: true` in the profile"""
+        with self._metadata_cache_lock:
+            if not self._metadata_cache_loaded:
+                self._metadata_cache_loaded = True
+                credentials = self.config.credentials
+                target_path = getattr(self.config, "project_target_path", None)
+                if credentials.metadata_cache is True and isinstance(target_path, str):
+                    self._metadata_cache = DeltastreamMetadataCache(
+                        target_path,
+                        credentials.organization_id,
+                        credentials.metadata_cache_ttl_seconds,
+                        refresh=credentials.metadata_cache_refresh is True,
+                    )
+            return self._metadata_cache
+
+    def _get_deploy_state(self) -> Optional[DeployStateStore]:
+        """Return the store of deployment fingerprints, or None if there is no place to keep it"""
+        with self._deploy_state_lock:
+            if not self._deploy_state_loaded:
+                self._deploy_state_loaded = True
+                path = self.config.credentials.deploy_state_path
+                target_path = getattr(self.config, "project_target_path", None)
+                if not isinstance(path, str) and isinstance(target_path, str):
+                    path = os.path.join(target_path, DeployStateStore.FILE_NAME)
+                if isinstance(path, str):
+                    self._deploy_state = DeployStateStore(path)
+            return self._deploy_state
+
+    def _get_seed_state(self) -> Optional[SeedStateStore]:
+        """Return the store of delta seed row hashes, or None if there is no place to keep it"""
+        with self._seed_state_lock:
+            if not self._seed_state_loaded:
+                self._seed_state_loaded = True
+                target_path = getattr(self.config, "project_target_path", None)
+                if isinstance(target_path, str):
+                    self._seed_state = SeedStateStore(
+                        os.path.join(target_path, SeedStateStore.FILE_NAME)
+                    )
+            return self._seed_state
+
+    def _on_ddl(self, verb: str, object_type: str, remainder: str) -> None:
+        """Invalidate cached metadata affected by a DDL statement issued through the adapter"""
+        parts = parse_qualified_name(remainder)
+        if object_type in self.RELATION_OBJECT_TYPES:
+            if len(parts) == 3:
+                self._forget_columns(*parts)
+                self._forget_absent(*parts)
+            else:
+                with self._columns_cache_lock:
+                    self._columns_cache.clear()
+                with self._absent_relations_lock:
+                    self._absent_relations.clear()
+        elif object_type in ("APPLICATION", "DATABASE") or (
+            object_type == "SCHEMA" and verb == "DROP"
+        ):
+            with self._columns_cache_lock:
+                self._columns_cache.clear()
+            if object_type == "APPLICATION":
+                # Relations created inside an application block are not parsed individually
+                with self._absent_relations_lock:
+                    self._absent_relations.clear()
+
+        if object_type == "FUNCTION":
+            self._update_function_index(verb, remainder)
+        elif object_type == "APPLICATION":
+            self._function_index = None
+
+        if (
+            object_type in ("QUERY", "APPLICATION")
+            or object_type in self.RELATION_OBJECT_TYPES
+        ):
+            self._query_index = None
+
+        if verb == "DROP" and object_type in self.RELATION_OBJECT_TYPES:
+            deploy_state = self._deploy_state
+            if deploy_state is not None and len(parts) == 3:
+                deploy_state.remove_relations([".".join(self._relation_key(*parts))])
+
+        cache = self._get_metadata_cache()
+        if cache is None:
+            return
+        if object_type in self.RELATION_OBJECT_TYPES:
+            if len(parts) == 3:
+                database, schema, identifier = parts
+                cache.invalidate("relations", database, schema)
+                cache.invalidate(f"columns:{identifier.lower()}", database, schema)
+            else:
+                cache.invalidate_kind_everywhere("relations")
+                cache.invalidate_kind_everywhere("columns:")
+        elif object_type in self.LIST_OBJECT_TYPES:
+            cache.invalidate(f"list:{self.LIST_OBJECT_TYPES[object_type]}")
+        elif object_type == "SCHEMA" and verb == "DROP":
+            if len(parts) == 2:
+                cache.invalidate(None, parts[0], parts[1])
+            else:
+                cache.invalidate_kind_everywhere("")
+        elif object_type in ("APPLICATION", "DATABASE"):
+            cache.clear()
+
+    def cache_added(self, relation: Optional[BaseRelation]) -> str:
+        # Called by dbt once a materialization (re)created the relation
+        if relation is not None:
+            self._forget_columns(
+                relation.database, relation.schema, relation.identifier
+            )
+            self._forget_absent(relation.database, relation.schema, relation.identifier)
+        return super().cache_added(relation)
+
+    def cleanup_connections(self) -> None:
+        cache = self._metadata_cache
+        if cache is not None:
+            cache.flush()
+        deploy_state = self._deploy_state
+        if deploy_state is not None:
+            deploy_state.flush()
+        seed_state = self._seed_state
+        if seed_state is not None:
+            seed_state.flush()
+        pending = self._applications.pending()
+        if pending:
+            logger.warning(
+                "Applications were never submitted, their models were not created: "
+                + ", ".join(
+                    f"{application_name} ({count} models)"
+                    for application_name, count in pending.items()
+                )
+                + ". Add `{{ deltastream_submit_applications() }}` to the on-run-end hooks"
+            )
+        super().cleanup_connections()
+
+    def _query_list(self, object_type: str) -> "agate.Table":
+        """Run a `LIST <object_type>;` statement, served from the metadata cache when enabled"""
+        cache = self._get_metadata_cache()
+        kind = f"list:{object_type}"
+        if cache is not None:
+            cached = cache.get(kind)
+            if cached is not None:
+                return agate.Table(cached["rows"], cached["columns"])
+
+        (_, table) = self.connections.query(f"LIST {object_type};")
+        if cache is not None and table is not None:
+            cache.put(
+                kind,
+                {
+                    "columns": list(table.column_names),
+                    "rows": [
+                        [None if value is None else str(value) for value in row]
+                        for row in table.rows
+                    ],
+                },
+            )
+        return table
 
     @classmethod
     def is_cancelable(cls) -> bool:
@@ -78,6 +402,7 @@ class DeltastreamAdapter(BaseAdapter):
         is_cached = self._schema_is_cached(relation.database, relation.schema or "")
         if is_cached:
             self.cache_dropped(relation)
+        self._forget_columns(relation.database, relation.schema, relation.identifier)
 
         table_ref = self.get_fully_qualified_relation_str(relation)
         try:
@@ -87,8 +412,22 @@ class DeltastreamAdapter(BaseAdapter):
                 f"Error dropping relation {relation}: {str(e)}"
             )
 
+    def _drop_relation_if_exists(self, relation: DeltastreamRelation) -> None:
+        """Drop a relation, ignoring it if it is already gone"""
+        if self._schema_is_cached(relation.database, relation.schema or ""):
+            self.cache_dropped(relation)
+        self._forget_columns(relation.database, relation.schema, relation.identifier)
+        try:
+            self.connections.query(
+                f"DROP RELATION {self.get_fully_qualified_relation_str(relation)};"
+            )
+        except SQLError as e:
+            if e.code != SqlState.SQL_STATE_INVALID_RELATION:
+                raise
+
     def truncate_relation(self, relation: DeltastreamRelation) -> None:
         """Truncate a relation in DeltaStream"""
+        self._forget_columns(relation.database, relation.schema, relation.identifier)
         table_ref = self.get_fully_qualified_relation_str(relation)
         try:
             self.connections.query(f"TRUNCATE RELATION {table_ref};")
@@ -177,21 +516,36 @@ class DeltastreamAdapter(BaseAdapter):
     ) -> List[BaseRelation]:
         """Return a list of relations in the schema without using the cache"""
         try:
-            (_, agate_table) = self.connections.query(
-                'SHOW RELATIONS IN SCHEMA "{}"."{}";'.format(
-                    schema_relation.database, schema_relation.schema
-                )
+            cache = self._get_metadata_cache()
+            identifiers = (
+                cache.get("relations", schema_relation.database, schema_relation.schema)
+                if cache is not None
+                else None
             )
+            if identifiers is None:
+                (_, agate_table) = self.connections.query(
+                    'SHOW RELATIONS IN SCHEMA "{}"."{}";'.format(
+                        schema_relation.database, schema_relation.schema
+                    )
+                )
+                identifiers = [self._strip_quotes(row[0]) for row in agate_table.rows]
+                if cache is not None:
+                    cache.put(
+                        "relations",
+                        identifiers,
+                        schema_relation.database,
+                        schema_relation.schema,
+                    )
             relations = [
                 DeltastreamRelation(
                     Path(
                         database=schema_relation.database,
                         schema=schema_relation.schema,
-                        identifier=self._strip_quotes(row[0]),
+                        identifier=identifier,
                     ),
                     type=DeltastreamRelationType.Table,
                 )
-                for row in agate_table.rows
+                for identifier in identifiers
             ]
             logger.debug(f"Found relations: {relations}")
             return relations  # type: ignore
@@ -202,22 +556,45 @@ class DeltastreamAdapter(BaseAdapter):
     def get_columns_in_relation(
         self, relation: DeltastreamRelation
     ) -> List[DeltastreamColumn]:
-        """Get the column definitions for a relation"""
+        """Get the column definitions for a relation, memoized for the run"""
+        key = self._relation_key(
+            relation.database, relation.schema, relation.identifier
+        )
+        with self._columns_cache_lock:
+            memoized = self._columns_cache.get(key)
+        if memoized is not None:
+            return list(memoized)
         try:
-            (_, agate_table) = self.connections.query(
-                'DESCRIBE RELATION COLUMNS "{}"."{}"."{}";'.format(
-                    relation.database, relation.schema, relation.identifier
-                )
+            cache = self._get_metadata_cache()
+            kind = f"columns:{(relation.identifier or '').lower()}"
+            definitions = (
+                cache.get(kind, relation.database, relation.schema)
+                if cache is not None
+                else None
             )
-            columns = []
-            for row in agate_table.rows:
-                column_info = DeltastreamColumn(
-                    column=row[0],  # column name
-                    dtype=row[1],  # data type
-                    mode="NULLABLE" if row[2] else "REQUIRED",  # mode (nullable or not)
+            if definitions is None:
+                (_, agate_table) = self.connections.query(
+                    'DESCRIBE RELATION COLUMNS "{}"."{}"."{}";'.format(
+                        relation.database, relation.schema, relation.identifier
+                    )
                 )
-                columns.append(column_info)
-            return columns
+                definitions = [
+                    [
+                        row[0],  # column name
+                        row[1],  # data type
+                        "NULLABLE" if row[2] else "REQUIRED",  # mode (nullable or not)
+                    ]
+                    for row in agate_table.rows
+                ]
+                if cache is not None:
+                    cache.put(kind, definitions, relation.database, relation.schema)
+            columns = [
+                DeltastreamColumn(column=name, dtype=dtype, mode=mode)
+                for name, dtype, mode in definitions
+            ]
+            with self._columns_cache_lock:
+                self._columns_cache[key] = columns
+            return list(columns)
         except Exception as e:
             logger.error(f"get_columns_in_relation error: {str(e)}")
             return []
@@ -253,6 +630,11 @@ class DeltastreamAdapter(BaseAdapter):
                 database=database, schema=schema, identifier=identifier
             )
 
+        key = self._relation_key(database, schema, identifier)
+        with self._absent_relations_lock:
+            if key in self._absent_relations:
+                return None
+
         try:
             (response, table) = self.connections.query(
                 sql='DESCRIBE RELATION "{}"."{}"."{}";'.format(
@@ -272,6 +654,8 @@ class DeltastreamAdapter(BaseAdapter):
                 SqlState.SQL_STATE_INVALID_RELATION,
                 SqlState.SQL_STATE_INVALID_SCHEMA,
             ]:
+                with self._absent_relations_lock:
+                    self._absent_relations.add(key)
                 return None
             raise
 
@@ -281,13 +665,20 @@ class DeltastreamAdapter(BaseAdapter):
         identifier: str
         resource_type: str
         parameters: Dict[str, Any]
+        # Properties reported by DESCRIBE or LIST for an existing resource, keyed by normalized name
+        properties: Dict[str, Any]
 
         def __init__(
-            self, identifier: str, resource_type: str, parameters: Dict[str, Any]
+            self,
+            identifier: str,
+            resource_type: str,
+            parameters: Dict[str, Any],
+            properties: Optional[Dict[str, Any]] = None,
         ):
             self.identifier = identifier
             self.resource_type = resource_type
             self.parameters = parameters
+            self.properties = properties or {}
 
     @available
     def create_deltastream_resource(
@@ -415,6 +806,420 @@ class DeltastreamAdapter(BaseAdapter):
 
         return f" WITH ({', '.join(param_parts)})" if param_parts else ""
 
+    def _resolve_max_workers(self, max_workers: Optional[int]) -> int:
+        if isinstance(max_workers, int) and max_workers > 0:
+            return max_workers
+        threads = getattr(self.config, "threads", 4)
+        return threads if isinstance(threads, int) and threads > 0 else 4
+
+    def _run_in_parallel(
+        self,
+        name: str,
+        items: List[Any],
+        action: Callable[[Any], None],
+        label: Callable[[Any], str],
+        max_workers: int,
+    ) -> Dict[str, str]:
+        """Run an action on each item in a thread pool, each with its own named connection, and return the errors by label"""
+        failures: Dict[str, str] = {}
+        if not items:
+            return failures
+
+        def run(item: Any) -> None:
+            with self.connection_named(f"{name}.{label(item)}"):
+                action(item)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(items))
+        ) as executor:
+            future_to_item = {executor.submit(run, item): item for item in items}
+            for future in concurrent.futures.as_completed(future_to_item):
+                try:
+                    future.result()
+                except Exception as e:
+                    failures[label(future_to_item[future])] = str(e)
+        return failures
+
+    @staticmethod
+    def _format_failures(failures: Dict[str, str]) -> str:
+        return "\n".join(
+            f"{label}: {error}" for label, error in sorted(failures.items())
+        )
+
+    @available
+    def create_sources_parallel(
+        self, nodes: List[Any], max_workers: Optional[int] = None
+    ) -> int:
+        """Deploy sources with the create_source macro, layer by layer with independent sources in parallel"""
+        max_workers = self._resolve_max_workers(max_workers)
+        deployed = 0
+        for layer in plan_source_layers(list(nodes)):
+            failures = self._run_in_parallel(
+                "create_source",
+                layer,
+                lambda node: self.execute_macro("create_source", kwargs={"node": node}),
+                lambda node: node_value(node, "identifier"),
+                max_workers,
+            )
+            if failures:
+                # Later layers depend on this one, stop here
+                raise dbt_common.exceptions.DbtRuntimeError(
+                    "Error creating sources:\n" + self._format_failures(failures)
+                )
+            deployed += len(layer)
+        return deployed
+
+    @available
+    def cascade_drop_relations(
+        self,
+        relations: List[BaseRelation],
+        max_workers: Optional[int] = None,
+        timeout_seconds: float = 300,
+    ) -> List[str]:
+        """Drop relations and the relations fed by them, after terminating the queries involved"""
+        max_workers = self._resolve_max_workers(max_workers)
+        plan = plan_cascade_drop(
+            [(r.database, r.schema, r.identifier) for r in relations],
+            self._get_query_index(refresh=True),
+            (self.config.credentials.database, self.config.credentials.schema),
+        )
+        for query_id, sink in plan.unresolved:
+            logger.warning(
+                f"Query {query_id} writes to {sink}, which is not fully qualified and is not "
+                f"resolved without a database and schema in the profile: it is not dropped"
+            )
+        failures = self._run_in_parallel(
+            "terminate_query",
+            plan.query_ids,
+            lambda query_id: self.connections.query(f"TERMINATE QUERY {query_id};"),
+            str,
+            max_workers,
+        )
+        if failures:
+            raise dbt_common.exceptions.DbtRuntimeError(
+                "Error terminating queries:\n" + self._format_failures(failures)
+            )
+
+        deadline = time.monotonic() + timeout_seconds
+
+        def drop(key: Tuple[str, str, str]) -> None:
+            relation = DeltastreamRelation.create(
+                database=key[0], schema=key[1], identifier=key[2]
+            )
+            interval = 0.5
+            while True:
+                try:
+                    self._drop_relation_if_exists(relation)
+                    return
+                except SQLError:
+                    # Terminated queries release their relations asynchronously
+                    if time.monotonic() + interval > deadline:
+                        raise
+                    time.sleep(interval)
+                    interval = min(interval * 2, 5)
+
+        dropped: List[str] = []
+        for layer in plan.layers:
+            failures = self._run_in_parallel(
+                "drop_relation", layer, drop, ".".join, max_workers
+            )
+            if failures:
+                # Relations of later layers are still read by the ones that failed
+                raise dbt_common.exceptions.DbtRuntimeError(
+                    "Error dropping relations:\n" + self._format_failures(failures)
+                )
+            dropped.extend(".".join(key) for key in layer)
+        return dropped
+
+    @available
+    def cascade_drop_schema(
+        self,
+        database: str,
+        schema: str,
+        max_workers: Optional[int] = None,
+        timeout_seconds: float = 300,
+    ) -> List[str]:
+        """Drop all relations of a schema, ordered by their dependencies"""
+        schema_relation = DeltastreamRelation.create(database=database, schema=schema)
+        return self.cascade_drop_relations(
+            self.list_relations_without_caching(schema_relation),
+            max_workers,
+            timeout_seconds,
+        )
+
+    def _list_names(self, table: "agate.Table") -> Set[str]:
+        names = set()
+        for row in getattr(table, "rows", table) or []:
+            name = get_row_value(row, "Name")
+            if isinstance(name, str):
+                names.add(self._strip_quotes(name).lower())
+        return names
+
+    def _get_existing_state(self, nodes: List[Any]) -> ExistingState:
+        """Gather the deployed state of many nodes with one listing per resource type and database"""
+        materializations = {node_materialization(node) for node in nodes}
+        resources = {
+            materialization: self._list_names(self._query_list(list_type))
+            for materialization, list_type in RESOURCE_LIST_TYPES.items()
+            if materialization in materializations
+        }
+
+        entities = {}
+        for node in nodes:
+            if node_materialization(node) != "entity":
+                continue
+            store = node_parameters(node).get("store")
+            if store not in entities:
+                sql = (
+                    f'LIST ENTITIES IN STORE "{store}";' if store else "LIST ENTITIES;"
+                )
+                (_, table) = self.connections.query(sql)
+                entities[store] = self._list_names(table)
+
+        deploy_state = self._get_deploy_state()
+        deployments = deploy_state.records() if deploy_state is not None else {}
+
+        # Relations of the project and of previous deployments, looked up per database
+        relations = set()
+        for database, keys in relation_keys_by_database(nodes, deployments).items():
+            (_, table) = self.get_relations_last_modified(
+                database,
+                [
+                    DeltastreamRelation.create(
+                        database=key[0], schema=key[1], identifier=key[2]
+                    )
+                    for key in keys
+                ],
+            )
+            for row in table.rows:
+                relations.add((database.lower(), row[0].lower(), row[1].lower()))
+
+        return ExistingState(
+            resources=resources,
+            entities=entities,
+            functions=(
+                self._get_function_index() if "function" in materializations else None
+            ),
+            databases=(
+                self._list_names(self._query_list("DATABASES"))
+                if "database" in materializations
+                else None
+            ),
+            relations=relations,
+            deployments=deployments,
+        )
+
+    @available
+    def plan_deployment(
+        self, nodes: List[Any], output_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Decide how each source and model would be deployed, without running any DDL
+
+        Models are fingerprinted from their compiled SQL like `dbt run` does, and a query model is
+        only unchanged while a query writing to its relation is running.
+        """
+        nodes = list(nodes)
+        state = self._get_existing_state(nodes)
+        fingerprints: Dict[str, Optional[str]] = {}
+        for node in nodes:
+            materialization = node_materialization(node)
+            if (
+                node_value(node, "resource_type") != "model"
+                or materialization not in FINGERPRINTED_MATERIALIZATIONS
+            ):
+                continue
+            sql = compiled_sql(node, getattr(self.config, "project_target_path", None))
+            unique_id = node_value(node, "unique_id")
+            fingerprints[unique_id] = (
+                self.get_deploy_fingerprint(
+                    node, sql, node_parameters(node), materialization
+                )
+                if sql is not None
+                else None
+            )
+            key = relation_key(node)
+            if (
+                sql is not None
+                and is_query(sql)
+                and state.has_relation(key)
+                and state.deployments.get(unique_id, {}).get("fingerprint")
+                == fingerprints[unique_id]
+                and not has_running_producer(
+                    self._get_query_index(),
+                    DeltastreamRelation.create(
+                        database=key[0], schema=key[1], identifier=key[2]
+                    ),
+                )
+            ):
+                state.stopped.add(key)
+        return write_plan(compute_plan(nodes, state, fingerprints), output_path)
+
+    @available
+    def encode_seed_records(
+        self, agate_table: "agate.Table", json_booleans: bool = False
+    ) -> List[str]:
+        """Encode the rows of a seed table as JSON records, converting one column at a time"""
+        return encode_table_records(agate_table, bool(json_booleans))
+
+    def _execute_seed_records(
+        self,
+        entity: str,
+        store: Optional[str],
+        json_values: List[str],
+        max_in_flight: int,
+        keys: Optional[List[Any]],
+    ) -> int:
+        if keys is None:
+            lanes = [
+                [statement]
+                for statement in insert_statements(entity, store, json_values)
+            ]
+        else:
+            if len(keys) != len(json_values):
+                raise dbt_common.exceptions.DbtRuntimeError(
+                    f"Expected one key per seed record, got {len(keys)} keys for {len(json_values)} records"
+                )
+            lanes = [
+                insert_statements(entity, store, partition)
+                for partition in partition_by_key(json_values, keys, max_in_flight)
+            ]
+        try:
+            return self.connections.execute_pipelined(lanes, max_in_flight)
+        except Exception as e:
+            raise dbt_common.exceptions.DbtRuntimeError(
+                f"Failed to insert seed records into entity {entity}: {str(e)}"
+            )
+
+    def _seed_load_report(
+        self, entity: str, rows: int, statements: int, started: float
+    ) -> Dict[str, Any]:
+        seconds = time.monotonic() - started
+        rows_per_second = rows / seconds if seconds > 0 else 0.0
+        logger.info(
+            f"Inserted {rows} rows into {entity} with {statements} statements "
+            f"in {seconds:.2f}s ({rows_per_second:.0f} rows/s)"
+        )
+        return {
+            "rows": rows,
+            "statements": statements,
+            "seconds": seconds,
+            "rows_per_second": rows_per_second,
+        }
+
+    @available
+    def insert_seed_records(
+        self,
+        entity: str,
+        store: Optional[str],
+        json_values: List[str],
+        max_in_flight: Optional[int] = None,
+        keys: Optional[List[Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Insert seed records one per statement, keeping up to `max_in_flight` INSERT statements pending.
+
+        Without `keys` the records are sent in any order. With `keys`, one key per record, the records
+        of a key are inserted in their original order.
+        """
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            max_in_flight = 1
+        started = time.monotonic()
+        statements = self._execute_seed_records(
+            entity, store, json_values, max_in_flight, keys
+        )
+        return self._seed_load_report(entity, len(json_values), statements, started)
+
+    @available
+    def insert_seed_file(
+        self,
+        path: str,
+        entity: str,
+        store: Optional[str],
+        max_in_flight: Optional[int] = None,
+        ordering_key: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        text_columns: Optional[List[str]] = None,
+        delimiter: Optional[str] = None,
+        json_booleans: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Insert the rows of a seed CSV file without loading it whole, one chunk of `chunk_size` rows at a time.
+
+        Each chunk is typed, encoded and inserted like `insert_seed_records` before the next one is read.
+        """
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            max_in_flight = 1
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            chunk_size = DEFAULT_CHUNK_SIZE
+        if not os.path.exists(path):
+            raise dbt_common.exceptions.DbtRuntimeError(f"Seed file not found: {path}")
+        started = time.monotonic()
+        rows = 0
+        statements = 0
+        for chunk in read_csv_chunks(
+            path, chunk_size, text_columns or (), delimiter or ","
+        ):
+            keys = None
+            if ordering_key:
+                if ordering_key not in chunk.column_names:
+                    raise dbt_common.exceptions.DbtRuntimeError(
+                        f"Seed ordering_key '{ordering_key}' is not a column of the seed"
+                    )
+                keys = list(chunk.columns[ordering_key].values())
+            json_values = encode_table_records(chunk, bool(json_booleans))
+            statements += self._execute_seed_records(
+                entity, store, json_values, max_in_flight, keys
+            )
+            rows += len(json_values)
+        return self._seed_load_report(entity, rows, statements, started)
+
+    @available
+    def seed_delta(
+        self,
+        unique_id: str,
+        entity: str,
+        store: Optional[str],
+        agate_table: "agate.Table",
+        unique_key: Optional[Any] = None,
+        full_refresh: bool = False,
+    ) -> "agate.Table":
+        """
+        Keep only the seed rows that are new or changed since the last successful run of the seed.
+
+        The row hashes are recorded by `record_seed_delta` once the rows are loaded.
+        """
+        if isinstance(unique_key, str):
+            unique_key = [unique_key]
+        target = f"{store}.{entity}" if store else entity
+        seed_state = self._get_seed_state()
+        if seed_state is None:
+            logger.warning(
+                f"No target path to keep the state of delta seed {unique_id}, loading all rows"
+            )
+        previous = (
+            seed_state.rows(unique_id, target)
+            if seed_state is not None and not full_refresh
+            else {}
+        )
+        delta = SeedDelta(previous, unique_key)
+        changed = delta.changed(agate_table)
+        with self._seed_state_lock:
+            self._pending_seed_deltas[unique_id] = (target, delta.hashes)
+        logger.info(
+            f"Delta seed {unique_id}: {len(changed.rows)} of {len(agate_table.rows)} rows "
+            f"to load into {target}"
+        )
+        return changed
+
+    @available
+    def record_seed_delta(self, unique_id: str) -> None:
+        """Record the row hashes of a delta seed after it was loaded successfully"""
+        with self._seed_state_lock:
+            pending = self._pending_seed_deltas.pop(unique_id, None)
+        seed_state = self._get_seed_state()
+        if pending is not None and seed_state is not None:
+            seed_state.put(unique_id, *pending)
+
     @available
     def get_resource(
         self, resource_type: str, identifier: str, parameters: Dict[str, Any]
@@ -440,18 +1245,65 @@ class DeltastreamAdapter(BaseAdapter):
                 f"Unsupported resource type: {resource_type}"
             )
 
+    @available
+    def get_resource_parameter_changes(
+        self,
+        node: Any,
+        resource_type: str,
+        identifier: str,
+        parameters: Dict[str, Any],
+        force: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Get the parameters to update on an existing resource, or None if it does not exist"""
+        resource = self.get_resource(resource_type, identifier, parameters)
+        if resource is None:
+            return None
+        if force:
+            return updatable_parameters(resource_type, parameters)
+        deploy_state = self._get_deploy_state()
+        record = (
+            deploy_state.get(node_value(node, "unique_id")) if deploy_state else None
+        )
+        applied = record.get("parameters") if record else None
+        return diff_parameters(resource_type, parameters, resource.properties, applied)
+
+    @available
+    def record_resource_parameters(
+        self,
+        node: Any,
+        resource_type: str,
+        identifier: str,
+        parameters: Dict[str, Any],
+    ) -> str:
+        """Remember digests of the parameters just applied to a resource"""
+        deploy_state = self._get_deploy_state()
+        if deploy_state is not None:
+            digests = parameter_digests(parameters)
+            deploy_state.put(
+                node_value(node, "unique_id"),
+                f"{resource_type}:{identifier}",
+                compute_fingerprint(resource_type, None, digests, None, {}),
+                parameters=digests,
+            )
+        return ""
+
     @available
     def get_compute_pool(self, identifier: str) -> Optional["DeltastreamResource"]:
         """Get a compute pool configuration if it exists"""
         try:
             # List all compute pools and check if the requested one exists
             # DESCRIBE COMPUTE_POOL doesn't exist so we need to list compute pools and check if there's the one we look for that exists
-            (_, table) = self.connections.query("LIST COMPUTE_POOLS;")
+            table = self._query_list("COMPUTE_POOLS")
             if table and len(table) > 0:
                 # Extract names from the result and check if our identifier exists
-                compute_pool_names = [row["Name"] for row in table]
-                if identifier in compute_pool_names:
-                    return self.DeltastreamResource(identifier, "compute_pool", {})
+                for row in table:
+                    if row["Name"] == identifier:
+                        return self.DeltastreamResource(
+                            identifier,
+                            "compute_pool",
+                            {},
+                            properties_from_rows(table.column_names, [row]),
+                        )
             return None
         except SQLError as e:
             if e.code == SqlState.SQL_STATE_INVALID_RELATION:
@@ -464,7 +1316,12 @@ class DeltastreamAdapter(BaseAdapter):
         try:
             (_, table) = self.connections.query(f'DESCRIBE STORE "{identifier}";')
             if table and len(table) > 0:
-                return self.DeltastreamResource(identifier, "store", {})
+                return self.DeltastreamResource(
+                    identifier,
+                    "store",
+                    {},
+                    properties_from_rows(table.column_names, table.rows),
+                )
             return None
         except SQLError as e:
             if e.code in [
@@ -487,7 +1344,12 @@ class DeltastreamAdapter(BaseAdapter):
             (_, table) = self.connections.query(sql)
             if table and len(table) > 0:
                 parameters = {"store": store} if store else {}
-                return self.DeltastreamResource(identifier, "entity", parameters)
+                return self.DeltastreamResource(
+                    identifier,
+                    "entity",
+                    parameters,
+                    properties_from_rows(table.column_names, table.rows),
+                )
             return None
         except SQLError as e:
             if e.code in [
@@ -497,46 +1359,513 @@ class DeltastreamAdapter(BaseAdapter):
                 return None
             raise
 
+    def _get_function_index(self) -> FunctionIndex:
+        """Return the index of existing function overloads, listing functions on first use only"""
+        with self._function_index_lock:
+            if self._function_index is None:
+                table = self._query_list("FUNCTIONS")
+                self._function_index = FunctionIndex.from_table(table)
+                logger.debug(f"Indexed {len(self._function_index)} function signatures")
+            return self._function_index
+
+    def _update_function_index(self, verb: str, remainder: str) -> None:
+        """Keep the function index in sync with CREATE/DROP FUNCTION statements issued by the adapter"""
+        index = self._function_index
+        if index is None:
+            return
+        signature = parse_signature(remainder)
+        if signature is None:
+            # Unable to tell which overload changed, rebuild the index on next use
+            self._function_index = None
+        elif verb == "CREATE":
+            index.add(signature)
+        elif verb == "DROP":
+            index.discard(signature)
+        else:
+            self._function_index = None
+
+    @available
+    def sql_is_query(self, sql: str) -> bool:
+        """Whether a model's SQL is a query deployed with CREATE ... AS SELECT, rather than a definition"""
+        return is_query(sql)
+
+    @available
+    def get_deploy_fingerprint(
+        self,
+        model: Any,
+        sql: Optional[str],
+        parameters: Optional[Dict[str, Any]],
+        materialization: str,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Fingerprint a model deployment from its compiled SQL, parameters, columns and upstream fingerprints
+
+        Without `extra`, the config of the materialization that is part of the fingerprint is read from
+        the model, so `dbt run` and `deltastream_plan` fingerprint a model the same way.
+        """
+        if extra is None:
+            extra = fingerprint_extra(materialization, node_value(model, "config"))
+        deploy_state = self._get_deploy_state()
+        depends_on = node_value(model, "depends_on") or {}
+        upstream = {
+            unique_id: deploy_state.fingerprint(unique_id) if deploy_state else None
+            for unique_id in node_value(depends_on, "nodes") or []
+        }
+        return compute_fingerprint(
+            materialization,
+            sql,
+            parameters,
+            node_value(model, "columns"),
+            upstream,
+            extra,
+        )
+
+    @available
+    def is_deployment_unchanged(
+        self,
+        model: Any,
+        relation: BaseRelation,
+        fingerprint: str,
+        expect_running_query: bool = True,
+    ) -> bool:
+        """Check whether the relation was last deployed by this model with the same fingerprint
+
+        The fingerprint is local state: with `expect_running_query`, the deployment also counts as
+        unchanged only while a query writing to the relation, or to its blue/green producer, is running.
+        """
+        deploy_state = self._get_deploy_state()
+        if deploy_state is None:
+            return False
+        relation_key = ".".join(
+            self._relation_key(relation.database, relation.schema, relation.identifier)
+        )
+        if not deploy_state.is_deployed(
+            node_value(model, "unique_id"), relation_key, fingerprint
+        ):
+            return False
+        if expect_running_query and not has_running_producer(
+            self._get_query_index(), relation
+        ):
+            logger.info(
+                f"{relation} is unchanged but no query writing to it is running, redeploying it"
+            )
+            return False
+        return True
+
+    @available
+    def record_deployment(
+        self,
+        model: Any,
+        relation: BaseRelation,
+        fingerprint: str,
+        blue_green_color: Optional[str] = None,
+    ) -> str:
+        """Remember the fingerprint of a model that was just deployed to a relation"""
+        deploy_state = self._get_deploy_state()
+        if deploy_state is not None:
+            checksum = node_value(model, "checksum") or {}
+            extra = {"checksum": node_value(checksum, "checksum")}
+            if blue_green_color:
+                extra["blue_green_color"] = blue_green_color
+            deploy_state.put(
+                node_value(model, "unique_id"),
+                ".".join(
+                    self._relation_key(
+                        relation.database, relation.schema, relation.identifier
+                    )
+                ),
+                fingerprint,
+                **extra,
+            )
+        return ""
+
+    @available
+    def get_blue_green_color(self, relation: BaseRelation) -> Optional[str]:
+        """Return the color of the blue/green producer of the relation whose query is running
+
+        The color is read from the server rather than from the local deploy state, which may be
+        missing or stale, e.g. after a deployment from another machine or a terminated query.
+        """
+        return active_color(self._get_query_index(refresh=True), relation)
+
+    @available
+    def get_blue_green_plan(
+        self,
+        relation: BaseRelation,
+        old_relation: Optional[BaseRelation],
+        migrate: bool = False,
+    ) -> Dict[str, Any]:
+        """Decide the colors of a blue/green deployment and whether it migrates the existing relation"""
+        return plan_blue_green(
+            self._get_query_index(refresh=True), relation, old_relation, migrate
+        )
+
+    @available
+    def resolve_application(self, model: Any, application: Any = None) -> Optional[str]:
+        """Return the application deploying a model configured with `application`, None to deploy it on its own
+
+        `application: true` groups the model with the other models of its DAG layer. Raises when a
+        parent is created by an application at the end of the run that the model cannot follow.
+        """
+        return self._applications.resolve(model, application)
+
+    @available
+    def buffer_application_statement(
+        self,
+        application_name: str,
+        model: Any,
+        relation: BaseRelation,
+        statement: str,
+        fingerprint: Optional[str] = None,
+        replaces: Optional[BaseRelation] = None,
+    ) -> str:
+        """Defer a model's CREATE statement to the application submitted at the end of the run
+
+        The relation it `replaces`, if any, is dropped by the same application right before it is
+        created again, so it keeps existing until the application is submitted.
+        """
+        if not has_submit_hook(self.config.on_run_end):
+            raise dbt_common.exceptions.DbtRuntimeError(
+                f"Model {node_value(model, 'unique_id')} is deployed by application "
+                f"'{application_name}', which is only submitted by the {SUBMIT_HOOK} hook. Add "
+                f"`{{{{ {SUBMIT_HOOK}() }}}}` to the on-run-end hooks of dbt_project.yml"
+            )
+        statements = []
+        if replaces is not None:
+            statements.append(
+                f"DROP RELATION {self.get_fully_qualified_relation_str(replaces)}"
+            )
+        statements.append(statement.strip().rstrip(";").strip())
+        self._applications.add(
+            application_name, model, relation, statements, fingerprint
+        )
+        return ""
+
+    @available
+    def get_buffered_applications(self) -> Dict[str, List[str]]:
+        """Return the statements of each pending application, in the order the models ran"""
+        return self._applications.statements()
+
+    @available
+    def complete_application(self, application_name: str) -> int:
+        """Record the deployments of a submitted application and forget its statements"""
+        entries = self._applications.pop(application_name)
+        for entry in entries:
+            self.cache_added(entry["relation"])
+            if entry["fingerprint"]:
+                self.record_deployment(
+                    entry["model"], entry["relation"], entry["fingerprint"]
+                )
+        return len(entries)
+
+    @available
+    def submit_applications(self) -> Dict[str, int]:
+        """Submit each buffered application as one BEGIN APPLICATION block, return the models deployed by each"""
+        submitted = {}
+        for application_name, statements in self.get_buffered_applications().items():
+            self.execute(application_sql(application_name, statements))
+            submitted[application_name] = self.complete_application(application_name)
+            logger.info(
+                f"Created application: {application_name} with "
+                f"{submitted[application_name]} models"
+            )
+        return submitted
+
+    def _get_query_index(
+        self, refresh: bool = False, newer_than: Optional[float] = None
+    ) -> QueryIndex:
+        """Return the index of continuous queries, listing queries on first use only
+
+        With `newer_than` (a `time.monotonic()` value), a snapshot taken before that time is refreshed.
+        Threads asking concurrently wait for a single LIST QUERIES and share its result.
+        """
+        with self._query_index_lock:
+            index = self._query_index
+            if (
+                index is None
+                or refresh
+                or (newer_than is not None and index.created_at <= newer_than)
+            ):
+                (_, table) = self.connections.query("LIST QUERIES;")
+                index = QueryIndex.from_table(table)
+                self._query_index = index
+                logger.debug(f"Indexed {len(index.queries)} queries")
+            return index
+
+    @available
+    def get_queries(
+        self, state: Optional[str] = None, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """List the queries of the organization, optionally only those in an actual state"""
+        return [query.row for query in self._get_query_index(refresh).in_state(state)]
+
+    @available
+    def get_queries_writing(
+        self, relation: BaseRelation, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """List the queries whose sink is the relation"""
+        index = self._get_query_index(refresh)
+        return [
+            query.row
+            for query in index.writing(
+                relation.database, relation.schema, relation.identifier
+            )
+        ]
+
+    @available
+    def get_queries_reading(
+        self, relation: BaseRelation, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """List the queries reading from the relation"""
+        index = self._get_query_index(refresh)
+        return [
+            query.row
+            for query in index.reading(
+                relation.database, relation.schema, relation.identifier
+            )
+        ]
+
+    @available
+    def get_queries_on_compute_pool(
+        self, compute_pool: str, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """List the queries running on a compute pool"""
+        return [
+            query.row
+            for query in self._get_query_index(refresh).on_compute_pool(compute_pool)
+        ]
+
+    @available
+    def wait_for_queries_running(
+        self,
+        relation: BaseRelation,
+        timeout_seconds: float = 300,
+        initial_interval_seconds: float = 0.5,
+        max_interval_seconds: float = 10,
+    ) -> List[Dict[str, Any]]:
+        """Wait until every query writing to the relation is running, failing if one errors or on timeout
+
+        Query states are polled with exponential backoff from a LIST QUERIES snapshot shared by all
+        threads, so models waiting concurrently do not each list every query of the organization.
+        """
+        states: List[str] = []
+
+        def running(index: QueryIndex) -> bool:
+            queries = index.writing(
+                relation.database, relation.schema, relation.identifier
+            )
+            states[:] = [(query.actual_state or "").lower() for query in queries]
+            for query, state in zip(queries, states):
+                if state in ("errored", "failed"):
+                    error = self._describe_query_error(query.query_id)
+                    raise dbt_common.exceptions.DbtRuntimeError(
+                        f"Query {query.query_id} writing to {relation} is {state}"
+                        + (f": {error}" if error else "")
+                    )
+            return bool(queries) and all(state == "running" for state in states)
+
+        # The CREATE statement invalidated the snapshot, the first poll lists the new query
+        index = poll_queries(
+            self._get_query_index,
+            running,
+            timeout_seconds,
+            initial_interval_seconds,
+            max_interval_seconds,
+        )
+        if index is None:
+            raise dbt_common.exceptions.DbtRuntimeError(
+                f"Timed out after {timeout_seconds}s waiting for the queries writing to "
+                f"{relation} to be running (states: {', '.join(states) or 'no query'})"
+            )
+        return [
+            query.row
+            for query in index.writing(
+                relation.database, relation.schema, relation.identifier
+            )
+        ]
+
+    @available
+    def wait_for_queries_stopped(
+        self,
+        relation: BaseRelation,
+        timeout_seconds: float = 300,
+        initial_interval_seconds: float = 0.5,
+        max_interval_seconds: float = 10,
+    ) -> None:
+        """Wait until no query writing to the relation is running, failing on timeout
+
+        Used before dropping a relation: queries may still be running right after TERMINATE QUERY.
+        """
+        running: List[str] = []
+
+        def stopped(index: QueryIndex) -> bool:
+            running[:] = [
+                query.query_id
+                for query in index.writing(
+                    relation.database, relation.schema, relation.identifier
+                )
+                if (query.actual_state or "").lower() == "running"
+            ]
+            return not running
+
+        if (
+            poll_queries(
+                self._get_query_index,
+                stopped,
+                timeout_seconds,
+                initial_interval_seconds,
+                max_interval_seconds,
+                refresh=True,
+            )
+            is None
+        ):
+            raise dbt_common.exceptions.DbtRuntimeError(
+                f"Timed out after {timeout_seconds}s waiting for the queries writing to "
+                f"{relation} to stop (still running: {', '.join(running)})"
+            )
+
+    @available
+    def run_bulk_query_action(
+        self,
+        action: str,
+        state: Optional[str] = None,
+        compute_pool: Optional[str] = None,
+        relation: Optional[Any] = None,
+        name_pattern: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        wait: bool = False,
+        timeout_seconds: float = 300,
+    ) -> "agate.Table":
+        """TERMINATE or RESTART the queries matching the filters in parallel and summarize the outcome
+
+        `relation` is a relation or a `database.schema.name` string and selects the queries writing
+        to or reading from it. With `wait`, query states are polled until every query reached the
+        target state (terminated or running), errored, or the timeout expired.
+        """
+        if action not in QUERY_ACTIONS:
+            raise dbt_common.exceptions.DbtRuntimeError(
+                f"Unsupported query action: {action}. Supported actions are: "
+                + ", ".join(QUERY_ACTIONS)
+            )
+        statement, target_state = QUERY_ACTIONS[action]
+        relation_name = None
+        if isinstance(relation, str):
+            parts = parse_qualified_name(relation)
+            if len(parts) != 3:
+                raise dbt_common.exceptions.DbtRuntimeError(
+                    f"Expected a fully qualified relation name, got: {relation}"
+                )
+            relation_name = (parts[0], parts[1], parts[2])
+        elif relation is not None:
+            relation_name = (relation.database, relation.schema, relation.identifier)
+
+        selected = self._get_query_index(refresh=True)
+        queries = selected.select(state, compute_pool, relation_name, name_pattern)
+        failures = self._run_in_parallel(
+            f"{action}_query",
+            queries,
+            lambda query: self.connections.query(
+                f"{statement} QUERY {query.query_id};"
+            ),
+            lambda query: query.query_id,
+            self._resolve_max_workers(max_workers),
+        )
+
+        final_states = {query.query_id: query.actual_state for query in queries}
+        pending = {query.query_id for query in queries} - set(failures)
+
+        def reached(index: QueryIndex) -> bool:
+            current = {query.query_id: query.actual_state for query in index.queries}
+            for query_id in list(pending):
+                # Terminated queries may no longer be listed at all
+                observed = current.get(query_id) or (
+                    target_state if action == "terminate" else None
+                )
+                final_states[query_id] = observed
+                if (observed or "").lower() in (target_state, "errored", "failed"):
+                    pending.discard(query_id)
+            return not pending
+
+        if wait and pending:
+            # The snapshot the queries were selected from predates the action, skip it
+            poll_queries(
+                self._get_query_index,
+                lambda index: index is not selected and reached(index),
+                timeout_seconds,
+            )
+        return summarize_query_action(
+            queries, target_state, final_states, failures, pending, wait
+        )
+
+    @available
+    def monitor_queries(
+        self,
+        relations: List[List[str]],
+        output_path: str,
+        output_format: str = "jsonl",
+        interval_seconds: float = 60,
+        iterations: int = 1,
+        describe: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> int:
+        """Periodically sample the queries writing to the project's relations and schemas to a file
+
+        Each sample holds the query state and the numeric DESCRIBE QUERY properties (e.g. throughput
+        or lag counters). JSON lines are appended, a Prometheus text file is replaced at every
+        iteration. With `iterations` 0, sampling continues until interrupted.
+        """
+        max_workers = self._resolve_max_workers(max_workers)
+
+        def describe_queries(queries: List[QueryInfo]) -> Dict[str, Dict[str, float]]:
+            metrics: Dict[str, Dict[str, float]] = {}
+
+            def describe_query(query: QueryInfo) -> None:
+                (_, table) = self.connections.query(f"DESCRIBE QUERY {query.query_id};")
+                metrics[query.query_id] = query_metrics(table.rows)
+
+            failures = self._run_in_parallel(
+                "describe_query",
+                queries,
+                describe_query,
+                lambda query: query.query_id,
+                max_workers,
+            )
+            for query_id, error in sorted(failures.items()):
+                logger.debug(f"Unable to describe query {query_id}: {error}")
+            return metrics
+
+        return sample_queries(
+            lambda: self._get_query_index(refresh=True).queries,
+            describe_queries if describe else None,
+            {self._relation_key(*relation) for relation in relations},
+            output_path,
+            output_format,
+            interval_seconds,
+            iterations,
+        )
+
+    def _describe_query_error(self, query_id: str) -> Optional[str]:
+        """Get the error of a failed query from DESCRIBE QUERY, if available"""
+        try:
+            (_, table) = self.connections.query(f"DESCRIBE QUERY {query_id};")
+        except Exception as e:
+            logger.debug(f"Unable to describe query {query_id}: {str(e)}")
+            return None
+        for row in table.rows:
+            if row[0] == "error" and row[1]:
+                return str(row[1])
+        return None
+
     @available
     def get_function(
         self, identifier: str, parameters: Dict[str, Any]
     ) -> Optional["DeltastreamResource"]:
         """Get a function configuration if it exists"""
         try:
-            # List all functions and check if the requested one exists
-            # We need to check by function signature since functions can be overloaded
-            (_, table) = self.connections.query("LIST FUNCTIONS;")
-            if table and len(table) > 0:
-                # Build the function signature to match
-                args = parameters.get("args", [])
-                if args:
-                    # For signature matching, we need both arg names and types
-                    arg_signature_parts = []
-                    for arg in args:
-                        arg_name = arg.get("name", "arg")
-                        arg_type = arg.get("type", "VARCHAR")
-                        arg_signature_parts.append(f"{arg_name} {arg_type}")
-                    signature = f"{identifier}({', '.join(arg_signature_parts)})"
-                else:
-                    signature = f"{identifier}()"
-
-                # Check if our function signature exists in the list
-                for row in table:
-                    if hasattr(row, "Signature") and row.Signature.startswith(
-                        signature
-                    ):
-                        return self.DeltastreamResource(
-                            identifier, "function", parameters
-                        )
-                    # Handle case where the row is a dict
-                    elif (
-                        isinstance(row, dict)
-                        and "Signature" in row
-                        and row["Signature"].startswith(signature)
-                    ):
-                        return self.DeltastreamResource(
-                            identifier, "function", parameters
-                        )
+            # Functions can be overloaded so they are matched by name and argument types
+            signature = signature_from_parameters(identifier, parameters)
+            if signature in self._get_function_index():
+                return self.DeltastreamResource(identifier, "function", parameters)
             return None
         except SQLError as e:
             if e.code == SqlState.SQL_STATE_INVALID_RELATION:
@@ -548,7 +1877,7 @@ class DeltastreamAdapter(BaseAdapter):
         """Get a function source configuration if it exists"""
         try:
             # List all function sources and check if the requested one exists
-            (_, table) = self.connections.query("LIST FUNCTION_SOURCES;")
+            table = self._query_list("FUNCTION_SOURCES")
             logger.debug(
                 f"LIST FUNCTION_SOURCES returned {len(table) if table else 0} rows"
             )
@@ -598,7 +1927,7 @@ class DeltastreamAdapter(BaseAdapter):
         """Get a descriptor source configuration if it exists"""
         try:
             # List all descriptor sources and check if the requested one exists
-            (_, table) = self.connections.query("LIST DESCRIPTOR_SOURCES;")
+            table = self._query_list("DESCRIPTOR_SOURCES")
             if table and len(table) > 0:
                 # Check if our descriptor source exists in the list
                 for row in table:
@@ -631,7 +1960,7 @@ class DeltastreamAdapter(BaseAdapter):
         """Get a schema registry configuration if it exists"""
         try:
             # List all schema registries and check if the requested one exists
-            (_, table) = self.connections.query("LIST SCHEMA_REGISTRIES;")
+            table = self._query_list("SCHEMA_REGISTRIES")
             if table and len(table) > 0:
                 # Check if our schema registry exists in the list
                 for row in table:
@@ -651,7 +1980,10 @@ class DeltastreamAdapter(BaseAdapter):
                         clean_name = self._strip_quotes(row_name)
                         if clean_name == identifier:
                             return self.DeltastreamResource(
-                                identifier, "schema_registry", {}
+                                identifier,
+                                "schema_registry",
+                                {},
+                                properties_from_rows(table.column_names, [row]),
                             )
             return None
         except SQLError as e:
@@ -754,8 +2086,12 @@ class DeltastreamAdapter(BaseAdapter):
     @classmethod
     def convert_number_type(cls, agate_table: "agate.Table", col_idx: int) -> str:
         """Convert number type to DeltaStream type"""
-        decimals = agate_table.aggregate(agate.MaxPrecision(col_idx))
-        return "DOUBLE" if decimals else "BIGINT"
+        return profile_column_types(agate_table)[col_idx]
+
+    @classmethod
+    def convert_integer_type(cls, agate_table: "agate.Table", col_idx: int) -> str:
+        """Convert integer type to DeltaStream type"""
+        return profile_column_types(agate_table)[col_idx]
 
     @classmethod
     def convert_boolean_type(cls, agate_table: "agate.Table", col_idx: int) -> str:
@@ -781,45 +2117,91 @@ class DeltastreamAdapter(BaseAdapter):
     def date_function(cls) -> str:
         return "current_date()"
 
+    @available
+    def get_relations_last_modified(
+        self, database: str, relations: List[BaseRelation]
+    ) -> Tuple[AdapterResponse, "agate.Table"]:
+        """Get the time of the last DDL change of many relations with a single system catalog query"""
+        return relations_last_modified(self.connections.query, database, relations)
+
+    @available
+    def collect_freshness_bounded(
+        self,
+        source: BaseRelation,
+        loaded_at_field: str,
+        filter: Optional[str] = None,
+        timeout_seconds: float = 10,
+        lookback_hours: float = 24,
+        max_rows: Optional[int] = 100000,
+    ) -> Tuple[AdapterResponse, "agate.Table"]:
+        """Compute the freshness of a source from bounded, time-boxed reads of its latest records"""
+        return collect_freshness(
+            self.connections.query_bounded,
+            source,
+            loaded_at_field,
+            filter,
+            timeout_seconds,
+            lookback_hours,
+            max_rows,
+        )
+
     @available
     def get_catalog_relations_parallel(
-        self, relations: List[BaseRelation]
+        self, relations: List[BaseRelation], incremental: bool = False
     ) -> "agate.Table":
-        """Get catalog information for relations using parallel DESCRIBE RELATION COLUMNS calls"""
+        """Get catalog information for relations using parallel DESCRIBE RELATION COLUMNS calls
+
+        In incremental mode, relations whose change marker in the system catalog matches the previous
+        `catalog.json` are not described again and their columns are reused.
+        """
         import agate
 
+        column_names = [
+            "table_database",
+            "table_schema",
+            "table_name",
+            "table_type",
+            "table_comment",
+            "column_name",
+            "column_index",
+            "column_type",
+            "column_comment",
+            "table_owner",
+        ]
+        column_types = [
+            agate.Text(),
+            agate.Text(),
+            agate.Text(),
+            agate.Text(),
+            agate.Text(),
+            agate.Text(),
+            agate.Number(),
+            agate.Text(),
+            agate.Text(),
+            agate.Text(),
+        ]
+        if incremental:
+            column_names += MARKER_COLUMNS
+            column_types += marker_column_types()
+
         # Handle empty relations case early
         if not relations:
             # Return empty table with correct schema
-            column_names = [
-                "table_database",
-                "table_schema",
-                "table_name",
-                "table_type",
-                "table_comment",
-                "column_name",
-                "column_index",
-                "column_type",
-                "column_comment",
-                "table_owner",
-            ]
-            column_types = [
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-                agate.Number(),
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-            ]
             return agate.Table([], column_names, column_types)
 
-        # Get the number of threads to use for parallel processing
-        # Use min of relations count and thread count from config
-        max_workers = min(len(relations), getattr(self.config, "threads", 4))
+        all_rows: List[Dict[str, Any]] = []
+        to_describe = list(relations)
+        markers: Dict[CatalogKey, Optional[str]] = {}
+        if incremental:
+            markers = catalog_markers(self.get_relations_last_modified, relations)
+            previous = load_previous_catalog(
+                previous_catalog_path(getattr(self.config, "project_target_path", None))
+                or ""
+            )
+            all_rows, to_describe = reuse_previous_catalog(relations, markers, previous)
+            logger.debug(
+                f"Incremental catalog: describing {len(to_describe)} of {len(relations)} relations"
+            )
 
         def describe_relation_columns(relation: BaseRelation) -> List[Dict[str, Any]]:
             """Describe columns for a single relation"""
@@ -854,12 +2236,14 @@ class DeltastreamAdapter(BaseAdapter):
                 logger.error(f"Error describing relation {relation}: {str(e)}")
                 return []
 
-        # Process relations in parallel
-        all_rows = []
+        # Get the number of threads to use for parallel processing
+        # Use min of relations count and thread count from config
+        max_workers = max(1, min(len(to_describe), getattr(self.config, "threads", 4)))
 
+        # Process relations in parallel
         if max_workers == 1:
             # Single-threaded execution
-            for relation in relations:
+            for relation in to_describe:
                 rows = describe_relation_columns(relation)
                 all_rows.extend(rows)
         else:
@@ -869,7 +2253,7 @@ class DeltastreamAdapter(BaseAdapter):
             ) as executor:
                 future_to_relation = {
                     executor.submit(describe_relation_columns, relation): relation
-                    for relation in relations
+                    for relation in to_describe
                 }
 
                 for future in concurrent.futures.as_completed(future_to_relation):
@@ -883,52 +2267,20 @@ class DeltastreamAdapter(BaseAdapter):
         # Create agate table from collected rows
         if not all_rows:
             # Return empty table with correct schema (this shouldn't happen with valid relations)
-            column_names = [
-                "table_database",
-                "table_schema",
-                "table_name",
-                "table_type",
-                "table_comment",
-                "column_name",
-                "column_index",
-                "column_type",
-                "column_comment",
-                "table_owner",
-            ]
-            column_types = [
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-                agate.Number(),
-                agate.Text(),
-                agate.Text(),
-                agate.Text(),
-            ]
             return agate.Table([], column_names, column_types)
 
-        # Extract column names and types from first row
-        column_names = list(all_rows[0].keys())
+        if incremental:
+            for row_dict in all_rows:
+                key = catalog_key(
+                    row_dict["table_database"],
+                    row_dict["table_schema"],
+                    row_dict["table_name"],
+                )
+                row_dict.update(marker_stats(markers.get(key)))
 
         # Convert rows to list of lists for agate
         table_rows = []
         for row_dict in all_rows:
             table_rows.append([row_dict[col] for col in column_names])
 
-        # Define column types
-        column_types = [
-            agate.Text(),  # table_database
-            agate.Text(),  # table_schema
-            agate.Text(),  # table_name
-            agate.Text(),  # table_type
-            agate.Text(),  # table_comment
-            agate.Text(),  # column_name
-            agate.Number(),  # column_index
-            agate.Text(),  # column_type
-            agate.Text(),  # column_comment
-            agate.Text(),  # table_owner
-        ]
-
         return agate.Table(table_rows, column_names, column_types)
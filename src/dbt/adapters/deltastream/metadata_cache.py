@@ -0,0 +1,126 @@
+import os
+import time
+from typing import Any, Dict, Optional
+
+from dbt.adapters.events.logging import AdapterLogger
+
+from dbt.adapters.deltastream.state_file import JsonStateFile
+
+logger = AdapterLogger("Deltastream")
+
+
+class DeltastreamMetadataCache(JsonStateFile):
+    """
+    On-disk cache of DeltaStream metadata (relations, columns, resource lists) shared across dbt invocations.
+
+    Entries are grouped by scope (organization, database, schema) and kind (e.g. `relations`,
+    `columns:<identifier>`, `list:FUNCTIONS`), and expire after `ttl_seconds`.
+    The cache is loaded once and written back with `flush`, typically at the end of the invocation.
+    """
+
+    FILE_NAME = "deltastream_metadata_cache.json"
+    SECTION = "scopes"
+    DESCRIPTION = "metadata cache"
+    DUMP_OPTIONS = {"default": str}
+
+    def __init__(
+        self,
+        directory: str,
+        organization_id: str,
+        ttl_seconds: float,
+        refresh: bool = False,
+    ) -> None:
+        super().__init__(os.path.join(directory, self.FILE_NAME))
+        self.organization_id = organization_id
+        self.ttl_seconds = ttl_seconds
+        self._scopes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        if refresh:
+            logger.debug("Metadata cache refresh requested, ignoring persisted entries")
+            # Persist the reset even if nothing gets cached during this invocation
+            self._dirty = True
+        else:
+            self._load()
+
+    def _scope_key(self, database: Optional[str], schema: Optional[str]) -> str:
+        return "/".join(
+            part.lower()
+            for part in (self.organization_id, database or "", schema or "")
+        )
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return now - entry.get("cached_at", 0) > self.ttl_seconds
+
+    def _load(self) -> None:
+        now = time.time()
+        for scope_key, entries in self._read().items():
+            fresh = {
+                kind: entry
+                for kind, entry in entries.items()
+                if not self._is_expired(entry, now)
+            }
+            if fresh:
+                self._scopes[scope_key] = fresh
+
+    def _snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        return self._scopes
+
+    def _write_failed(self, error: OSError) -> None:
+        # The cache is only an optimization, the next invocation fetches the metadata again
+        logger.debug(f"Unable to write metadata cache {self.path}: {str(error)}")
+
+    def get(
+        self, kind: str, database: Optional[str] = None, schema: Optional[str] = None
+    ) -> Optional[Any]:
+        """Return the cached value for a kind in a scope, or None if missing or expired"""
+        with self._lock:
+            entries = self._scopes.get(self._scope_key(database, schema), {})
+            entry = entries.get(kind)
+            if entry is None:
+                return None
+            if self._is_expired(entry, time.time()):
+                del entries[kind]
+                self._dirty = True
+                return None
+            return entry["value"]
+
+    def put(
+        self,
+        kind: str,
+        value: Any,
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            entries = self._scopes.setdefault(self._scope_key(database, schema), {})
+            entries[kind] = {"cached_at": time.time(), "value": value}
+            self._dirty = True
+
+    def invalidate(
+        self,
+        kind: Optional[str] = None,
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+    ) -> None:
+        """Drop a kind (or every kind when None) from a scope"""
+        with self._lock:
+            scope_key = self._scope_key(database, schema)
+            if scope_key not in self._scopes:
+                return
+            if kind is None:
+                del self._scopes[scope_key]
+            elif self._scopes[scope_key].pop(kind, None) is None:
+                return
+            self._dirty = True
+
+    def invalidate_kind_everywhere(self, kind_prefix: str) -> None:
+        """Drop every entry whose kind starts with the prefix, in all scopes"""
+        with self._lock:
+            for entries in self._scopes.values():
+                for kind in [k for k in entries if k.startswith(kind_prefix)]:
+                    del entries[kind]
+                    self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes = {}
+            self._dirty = True
@@ -0,0 +1,166 @@
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.queries import QueryInfo, RelationName
+
+logger = AdapterLogger("Deltastream")
+
+FORMATS = ("jsonl", "prometheus")
+
+_NON_IDENTIFIER = re.compile(r"[^a-z0-9]+")
+# Numeric DESCRIBE QUERY properties that are not counters
+_NON_METRIC_PROPERTIES = ("id", "version")
+
+
+def in_scope(
+    sink: Optional[RelationName],
+    schemas: Set[Tuple[str, str]],
+    relations: Set[Tuple[str, str, str]],
+) -> bool:
+    """Check whether a query writes to a relation of the project or to a schema of the project"""
+    if not sink:
+        return False
+    if len(sink) >= 3 and (sink[-3], sink[-2]) in schemas:
+        return True
+    # Partially qualified sinks are matched against the relations of the project by name
+    return any(relation[len(relation) - len(sink) :] == sink for relation in relations)
+
+
+def metric_name(name: str) -> str:
+    return _NON_IDENTIFIER.sub("_", name.lower()).strip("_")
+
+
+def query_metrics(rows: Iterable[Any]) -> Dict[str, float]:
+    """Numeric properties of a DESCRIBE QUERY result, such as throughput or lag counters"""
+    metrics: Dict[str, float] = {}
+    for row in rows:
+        values = list(row)
+        if len(values) < 2 or values[1] is None or isinstance(values[1], bool):
+            continue
+        name = metric_name(str(values[0]))
+        if not name or name in _NON_METRIC_PROPERTIES:
+            continue
+        try:
+            metrics[name] = float(str(values[1]).strip())
+        except ValueError:
+            continue
+    return metrics
+
+
+def build_sample(
+    query: QueryInfo, metrics: Dict[str, float], timestamp: float
+) -> Dict[str, Any]:
+    return {
+        "timestamp": timestamp,
+        "query_id": query.query_id,
+        "name": query.row.get("Name"),
+        "state": query.actual_state,
+        "compute_pool": query.compute_pool,
+        "sink": ".".join(query.sink) if query.sink else None,
+        "metrics": metrics,
+    }
+
+
+def _label_value(value: Any) -> str:
+    text = "" if value is None else str(value)
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_prometheus(samples: List[Dict[str, Any]]) -> str:
+    """Render samples as Prometheus text exposition format gauges"""
+    lines = [
+        "# HELP deltastream_query_state Actual state of a continuous query (1 for the current state)",
+        "# TYPE deltastream_query_state gauge",
+    ]
+    metrics: Dict[str, List[str]] = {}
+    for sample in samples:
+        labels = f'query_id="{_label_value(sample["query_id"])}",name="{_label_value(sample["name"])}"'
+        lines.append(
+            f'deltastream_query_state{{{labels},state="{_label_value(sample["state"])}",'
+            f'sink="{_label_value(sample["sink"])}"}} 1'
+        )
+        for name, value in sorted(sample["metrics"].items()):
+            metrics.setdefault(name, []).append(
+                f"deltastream_query_{name}{{{labels}}} {value}"
+            )
+    for name, metric_lines in sorted(metrics.items()):
+        lines.append(f"# TYPE deltastream_query_{name} gauge")
+        lines.extend(metric_lines)
+    if samples:
+        lines.append("# TYPE deltastream_query_sample_timestamp_seconds gauge")
+        lines.append(
+            f"deltastream_query_sample_timestamp_seconds {max(s['timestamp'] for s in samples)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_samples(path: str, output_format: str, samples: List[Dict[str, Any]]) -> None:
+    """Append samples as JSON lines, or atomically replace a Prometheus text file"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    if output_format == "jsonl":
+        with open(path, "a", encoding="utf-8") as f:
+            for sample in samples:
+                f.write(json.dumps(sample, default=str, sort_keys=True) + "\n")
+        return
+    # Scrapers (e.g. the node exporter textfile collector) must never read a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(format_prometheus(samples))
+    os.replace(tmp_path, path)
+
+
+def sample_queries(
+    list_queries: Callable[[], List[QueryInfo]],
+    describe: Optional[Callable[[List[QueryInfo]], Dict[str, Dict[str, float]]]],
+    relations: Set[Tuple[str, str, str]],
+    output_path: str,
+    output_format: str = "jsonl",
+    interval_seconds: float = 60,
+    iterations: int = 1,
+) -> int:
+    """
+    Periodically write a sample of the queries writing to the relations, or to their schemas, and
+    return the number of samples written.
+
+    `describe` returns the metrics of the listed queries by query id. With `iterations` 0, sampling
+    continues until interrupted.
+    """
+    if output_format not in FORMATS:
+        raise DbtRuntimeError(
+            f"Unsupported monitoring format: {output_format}. Supported formats are: "
+            + ", ".join(FORMATS)
+        )
+    schemas = {(relation[0], relation[1]) for relation in relations}
+
+    written = 0
+    iteration = 0
+    while True:
+        queries = [
+            query
+            for query in list_queries()
+            if in_scope(query.sink, schemas, relations)
+        ]
+        metrics = describe(queries) if describe else {}
+        timestamp = time.time()
+        write_samples(
+            output_path,
+            output_format,
+            [
+                build_sample(query, metrics.get(query.query_id, {}), timestamp)
+                for query in queries
+            ],
+        )
+        written += len(queries)
+        iteration += 1
+        logger.info(f"Sampled {len(queries)} queries into {output_path}")
+        if iterations and iteration >= iterations:
+            return written
+        time.sleep(interval_seconds)
@@ -0,0 +1,293 @@
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from dbt.adapters.deltastream.deploy_state import config_value, node_value
+from dbt.adapters.deltastream.functions import FunctionIndex, signature_from_parameters
+from dbt.adapters.deltastream.resource_parameters import parameter_digests
+from dbt.adapters.deltastream.sources import (
+    source_materialization as node_materialization,
+)
+
+CREATE = "create"
+UPDATE = "update"
+RECREATE = "recreate"
+NOOP = "no-op"
+DROP_ORPHAN = "drop-orphan"
+
+ACTIONS = (CREATE, UPDATE, RECREATE, NOOP, DROP_ORPHAN)
+
+# Resources altered in place when they exist, the others are dropped and created again
+UPDATABLE_RESOURCES = ("compute_pool", "store", "entity", "schema_registry")
+RECREATABLE_RESOURCES = ("function_source", "descriptor_source", "function")
+# Models skipped by `skip_unchanged` when their fingerprint is unchanged, the others are always redeployed
+FINGERPRINTED_MATERIALIZATIONS = ("stream", "changelog", "materialized_view", "table")
+RESOURCE_LIST_TYPES = {
+    "compute_pool": "COMPUTE_POOLS",
+    "store": "STORES",
+    "schema_registry": "SCHEMA_REGISTRIES",
+    "function_source": "FUNCTION_SOURCES",
+    "descriptor_source": "DESCRIPTOR_SOURCES",
+}
+
+RelationKey = Tuple[str, str, str]
+
+
+class ExistingState:
+    """Snapshot of the deployed resources and relations a plan is computed against"""
+
+    def __init__(
+        self,
+        resources: Optional[Dict[str, Set[str]]] = None,
+        entities: Optional[Dict[Optional[str], Set[str]]] = None,
+        functions: Optional[FunctionIndex] = None,
+        databases: Optional[Set[str]] = None,
+        relations: Optional[Set[RelationKey]] = None,
+        deployments: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        stopped: Optional[Set[RelationKey]] = None,
+    ) -> None:
+        # Names are lowercased, DeltaStream identifiers are matched case-insensitively
+        self.resources = resources or {}
+        self.entities = entities or {}
+        self.functions = functions or FunctionIndex()
+        self.databases = databases or set()
+        self.relations = relations or set()
+        self.deployments = deployments or {}
+        # Relations of query models without a running query writing to them
+        self.stopped = stopped or set()
+
+    def has_relation(self, key: Optional[RelationKey]) -> bool:
+        return key is not None and key in self.relations
+
+
+def node_identifier(node: Any) -> str:
+    return (
+        node_value(node, "identifier")
+        or node_value(node, "alias")
+        or node_value(node, "name")
+    )
+
+
+def node_parameters(node: Any) -> Dict[str, Any]:
+    config = node_value(node, "config") or {}
+    return node_value(config, "parameters") or {}
+
+
+def is_resource(materialization: str) -> bool:
+    return (
+        materialization in UPDATABLE_RESOURCES
+        or materialization in RECREATABLE_RESOURCES
+    )
+
+
+def relation_key(node: Any) -> Optional[RelationKey]:
+    """Lowercased database, schema and name of the relation a node deploys, None for resources"""
+    materialization = node_materialization(node)
+    if is_resource(materialization) or materialization == "database":
+        return None
+    database = node_value(node, "database")
+    schema = node_value(node, "schema")
+    identifier = node_identifier(node)
+    if not (database and schema and identifier):
+        return None
+    return (database.lower(), schema.lower(), identifier.lower())
+
+
+def _format_key(key: Optional[RelationKey]) -> Optional[str]:
+    return ".".join(key) if key else None
+
+
+def _resource_exists(node: Any, state: ExistingState) -> bool:
+    materialization = node_materialization(node)
+    identifier = node_identifier(node)
+    parameters = node_parameters(node)
+    if materialization == "function":
+        return signature_from_parameters(identifier, parameters) in state.functions
+    if materialization == "entity":
+        return identifier.lower() in state.entities.get(parameters.get("store"), set())
+    return identifier.lower() in state.resources.get(materialization, set())
+
+
+def _plan_source(node: Any, state: ExistingState) -> Tuple[str, str]:
+    materialization = node_materialization(node)
+    if materialization == "database":
+        if node_identifier(node).lower() in state.databases:
+            return NOOP, "database exists"
+        return CREATE, "database does not exist"
+    if is_resource(materialization):
+        if not _resource_exists(node, state):
+            return CREATE, f"{materialization} does not exist"
+        if materialization in UPDATABLE_RESOURCES:
+            record = state.deployments.get(node_value(node, "unique_id")) or {}
+            if record.get("parameters") == parameter_digests(node_parameters(node)):
+                return NOOP, "parameters unchanged since the last deployment"
+            return UPDATE, f"{materialization} exists and is updated in place"
+        return RECREATE, f"{materialization} exists and cannot be updated"
+    if state.has_relation(relation_key(node)):
+        return RECREATE, "source relation exists and is dropped first"
+    return CREATE, "relation does not exist"
+
+
+def _plan_model(
+    node: Any,
+    state: ExistingState,
+    upstream_actions: Iterable[str],
+    fingerprints: Mapping[str, Optional[str]],
+) -> Tuple[str, str]:
+    materialization = node_materialization(node)
+    if is_resource(materialization) or materialization == "database":
+        # Resource models are deployed like resource sources
+        return _plan_source(node, state)
+    key = relation_key(node)
+    if not state.has_relation(key):
+        return CREATE, "relation does not exist"
+    if materialization not in FINGERPRINTED_MATERIALIZATIONS:
+        return RECREATE, f"{materialization} models are always redeployed"
+    if not config_value(node_value(node, "config") or {}, "skip_unchanged", False):
+        return RECREATE, "skip_unchanged is not enabled"
+    unique_id = node_value(node, "unique_id")
+    record = state.deployments.get(unique_id)
+    if record is None:
+        return RECREATE, "no recorded deployment"
+    if record.get("relation") != _format_key(key):
+        return RECREATE, f"last deployed to {record.get('relation')}"
+    fingerprint = fingerprints.get(unique_id)
+    if fingerprint is None:
+        return RECREATE, "compiled SQL not found, run dbt compile before planning"
+    if record.get("fingerprint") != fingerprint:
+        return RECREATE, "definition changed since the last deployment"
+    if any(action in (CREATE, RECREATE) for action in upstream_actions):
+        return RECREATE, "upstream relation is redeployed"
+    if key in state.stopped:
+        return RECREATE, "no query writing to the relation is running"
+    return NOOP, "unchanged since the last deployment"
+
+
+def compute_plan(
+    nodes: List[Any],
+    state: ExistingState,
+    fingerprints: Optional[Mapping[str, Optional[str]]] = None,
+) -> List[Dict[str, Any]]:
+    """Decide the action of every node and of deployed relations no longer in the project
+
+    `fingerprints` are the deployment fingerprints of the models, computed from their compiled SQL.
+    """
+    fingerprints = fingerprints or {}
+    by_id = {
+        node_value(node, "unique_id"): node
+        for node in nodes
+        # Ephemeral models are inlined in their children and never deployed
+        if node_materialization(node) != "ephemeral"
+    }
+    actions: Dict[str, str] = {}
+    entries: List[Dict[str, Any]] = []
+
+    def visit(unique_id: str, visiting: Set[str]) -> Optional[str]:
+        if unique_id in actions:
+            return actions[unique_id]
+        node = by_id.get(unique_id)
+        if node is None or unique_id in visiting:
+            return None
+        visiting.add(unique_id)
+        if node_value(node, "resource_type") == "source":
+            action, reason = _plan_source(node, state)
+        else:
+            depends_on = node_value(node, "depends_on") or {}
+            upstream = [
+                visit(parent, visiting)
+                for parent in node_value(depends_on, "nodes") or []
+            ]
+            action, reason = _plan_model(
+                node, state, [action for action in upstream if action], fingerprints
+            )
+        actions[unique_id] = action
+        entries.append(
+            {
+                "unique_id": unique_id,
+                "resource_type": node_value(node, "resource_type"),
+                "materialization": node_materialization(node),
+                "name": node_identifier(node),
+                "relation": _format_key(relation_key(node)),
+                "action": action,
+                "reason": reason,
+            }
+        )
+        return action
+
+    for unique_id in by_id:
+        visit(unique_id, set())
+
+    for unique_id, record in sorted(state.deployments.items()):
+        if unique_id in by_id:
+            continue
+        relation = record.get("relation")
+        parts = tuple(str(relation or "").lower().split("."))
+        if len(parts) == 3 and parts in state.relations:
+            entries.append(
+                {
+                    "unique_id": unique_id,
+                    "resource_type": "model",
+                    "materialization": None,
+                    "name": parts[2],
+                    "relation": relation,
+                    "action": DROP_ORPHAN,
+                    "reason": "deployed by a model no longer in the project",
+                }
+            )
+    return entries
+
+
+def summarize_plan(entries: List[Dict[str, Any]]) -> Dict[str, int]:
+    summary = {action: 0 for action in ACTIONS}
+    for entry in entries:
+        summary[entry["action"]] += 1
+    return summary
+
+
+def compiled_sql(node: Any, target_path: Any) -> Optional[str]:
+    """Return the compiled SQL of a model, from the node or from the last `dbt compile` or `dbt run`"""
+    compiled_code = node_value(node, "compiled_code")
+    if compiled_code:
+        return compiled_code
+    package_name = node_value(node, "package_name")
+    original_file_path = node_value(node, "original_file_path")
+    if not (isinstance(target_path, str) and package_name and original_file_path):
+        return None
+    path = os.path.join(target_path, "compiled", package_name, original_file_path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def relation_keys_by_database(
+    nodes: Iterable[Any], deployments: Mapping[str, Mapping[str, Any]]
+) -> Dict[str, List[RelationKey]]:
+    """Group the relations of the project and of previous deployments by database"""
+    keys: Set[Optional[Tuple[str, ...]]] = {relation_key(node) for node in nodes}
+    keys.update(
+        tuple(str(record.get("relation", "")).split("."))
+        for record in deployments.values()
+    )
+    by_database: Dict[str, List[RelationKey]] = {}
+    for key in keys:
+        if key is not None and len(key) == 3:
+            by_database.setdefault(key[0], []).append((key[0], key[1], key[2]))
+    return dict(sorted(by_database.items()))
+
+
+def write_plan(
+    entries: List[Dict[str, Any]], output_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the plan document of the entries, and write it to `output_path` as JSON"""
+    plan = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "summary": summarize_plan(entries),
+        "actions": entries,
+    }
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(plan, f, indent=2, default=str)
+    return plan
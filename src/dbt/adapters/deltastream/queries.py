@@ -0,0 +1,245 @@
+import fnmatch
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import agate
+
+from dbt.adapters.deltastream.connections import parse_qualified_name
+from dbt.adapters.deltastream.functions import get_row_value
+
+# Statement creating the sink of a continuous query, e.g. CREATE STREAM x AS SELECT ... / INSERT INTO x SELECT ...
+_SINK = re.compile(
+    r"^\s*(?:CREATE\s+(?:STREAM|CHANGELOG|TABLE|MATERIALIZED\s+VIEW)|INSERT\s+INTO)\s+",
+    re.IGNORECASE,
+)
+_SOURCE = re.compile(r"\b(?:FROM|JOIN)\s+", re.IGNORECASE)
+_COMPUTE_POOL = re.compile(
+    r"""['"]compute_pool['"]\s*=\s*['"]([^'"]+)['"]""", re.IGNORECASE
+)
+
+RelationName = Tuple[str, ...]
+
+# Statement and target state of the bulk query actions
+QUERY_ACTIONS = {
+    "terminate": ("TERMINATE", "terminated"),
+    "restart": ("RESTART", "running"),
+}
+
+
+class QueryInfo(NamedTuple):
+    """A continuous query from `LIST QUERIES;` with the relations it writes and reads"""
+
+    query_id: str
+    actual_state: Optional[str]
+    compute_pool: Optional[str]
+    sink: Optional[RelationName]
+    sources: Tuple[RelationName, ...]
+    row: Dict[str, Any]
+
+
+def _relation_name(text: str) -> Optional[RelationName]:
+    parts = parse_qualified_name(text)
+    if not parts:
+        return None
+    return tuple(part.lower() for part in parts)
+
+
+def parse_sink_name(sql: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Extract the sink name of a continuous query's SQL, keeping the case of its parts"""
+    match = _SINK.match(sql) if sql else None
+    if not match:
+        return None
+    return tuple(parse_qualified_name(sql[match.end() :])) or None
+
+
+def parse_query_relations(
+    sql: Optional[str],
+) -> Tuple[Optional[RelationName], Tuple[RelationName, ...]]:
+    """Extract the sink and source relation names of a continuous query's SQL"""
+    if not sql:
+        return None, ()
+    sink_name = parse_sink_name(sql)
+    sink = tuple(part.lower() for part in sink_name) if sink_name else None
+    sources = []
+    for match in _SOURCE.finditer(sql):
+        name = _relation_name(sql[match.end() :])
+        # Skip subqueries (`FROM (SELECT ...)`) and duplicates
+        if name is not None and name not in sources:
+            sources.append(name)
+    return sink, tuple(sources)
+
+
+def _matches(name: RelationName, relation: RelationName) -> bool:
+    """Check whether a possibly partially qualified name refers to a fully qualified relation"""
+    return len(name) <= len(relation) and relation[len(relation) - len(name) :] == name
+
+
+class QueryIndex:
+    """Lookups over a single `LIST QUERIES;` snapshot by sink, source, state and compute pool"""
+
+    def __init__(self, queries: Iterable[QueryInfo] = ()) -> None:
+        self.created_at = time.monotonic()
+        self.queries: List[QueryInfo] = list(queries)
+        self._by_identifier: Dict[str, List[QueryInfo]] = {}
+        self._by_state: Dict[str, List[QueryInfo]] = {}
+        self._by_compute_pool: Dict[str, List[QueryInfo]] = {}
+        for query in self.queries:
+            names = ([query.sink] if query.sink else []) + list(query.sources)
+            for identifier in {name[-1] for name in names}:
+                self._by_identifier.setdefault(identifier, []).append(query)
+            if query.actual_state:
+                self._by_state.setdefault(query.actual_state.lower(), []).append(query)
+            if query.compute_pool:
+                self._by_compute_pool.setdefault(query.compute_pool.lower(), []).append(
+                    query
+                )
+
+    @classmethod
+    def from_table(cls, table: Iterable[Any]) -> "QueryIndex":
+        queries = []
+        column_names = list(getattr(table, "column_names", None) or [])
+        for row in getattr(table, "rows", table) or []:
+            sql = get_row_value(row, "Query")
+            sink, sources = parse_query_relations(sql if isinstance(sql, str) else None)
+            compute_pool = get_row_value(row, "ComputePool")
+            if not compute_pool and isinstance(sql, str):
+                match = _COMPUTE_POOL.search(sql)
+                compute_pool = match.group(1) if match else None
+            query_id = get_row_value(row, "ID")
+            queries.append(
+                QueryInfo(
+                    query_id=str(query_id) if query_id is not None else "",
+                    actual_state=get_row_value(row, "ActualState"),
+                    compute_pool=compute_pool,
+                    sink=sink,
+                    sources=sources,
+                    row={name: get_row_value(row, name) for name in column_names},
+                )
+            )
+        return cls(queries)
+
+    @staticmethod
+    def _key(database: str, schema: str, identifier: str) -> RelationName:
+        return (database.lower(), schema.lower(), identifier.lower())
+
+    def writing(self, database: str, schema: str, identifier: str) -> List[QueryInfo]:
+        relation = self._key(database, schema, identifier)
+        return [
+            query
+            for query in self._by_identifier.get(relation[-1], [])
+            if query.sink and _matches(query.sink, relation)
+        ]
+
+    def reading(self, database: str, schema: str, identifier: str) -> List[QueryInfo]:
+        relation = self._key(database, schema, identifier)
+        return [
+            query
+            for query in self._by_identifier.get(relation[-1], [])
+            if any(_matches(source, relation) for source in query.sources)
+        ]
+
+    def in_state(self, state: Optional[str] = None) -> List[QueryInfo]:
+        if state is None:
+            return list(self.queries)
+        return list(self._by_state.get(state.lower(), []))
+
+    def on_compute_pool(self, compute_pool: str) -> List[QueryInfo]:
+        return list(self._by_compute_pool.get(compute_pool.lower(), []))
+
+    def select(
+        self,
+        state: Optional[str] = None,
+        compute_pool: Optional[str] = None,
+        relation: Optional[Tuple[str, str, str]] = None,
+        name_pattern: Optional[str] = None,
+    ) -> List[QueryInfo]:
+        """Queries matching all the given filters, the relation one matching queries writing or reading it"""
+        selected = self.in_state(state)
+        if compute_pool is not None:
+            selected = [
+                query
+                for query in selected
+                if (query.compute_pool or "").lower() == compute_pool.lower()
+            ]
+        if relation is not None:
+            involved = {
+                id(query) for query in self.writing(*relation) + self.reading(*relation)
+            }
+            selected = [query for query in selected if id(query) in involved]
+        if name_pattern is not None:
+            selected = [
+                query
+                for query in selected
+                if fnmatch.fnmatchcase(
+                    str(query.row.get("Name") or "").lower(), name_pattern.lower()
+                )
+            ]
+        return selected
+
+
+def poll_queries(
+    get_index: Callable[..., QueryIndex],
+    done: Callable[[QueryIndex], bool],
+    timeout_seconds: float,
+    initial_interval_seconds: float = 0.5,
+    max_interval_seconds: float = 10,
+    refresh: bool = False,
+) -> Optional[QueryIndex]:
+    """
+    Poll `LIST QUERIES;` snapshots with exponential backoff until `done` holds, None on timeout.
+
+    `get_index(refresh=..., newer_than=...)` returns a snapshot, shared with the threads polling
+    concurrently: each poll only asks for a snapshot taken after its sleep.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    interval = initial_interval_seconds
+    index = get_index(refresh=refresh)
+    while not done(index):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        slept_from = time.monotonic()
+        time.sleep(min(interval, remaining))
+        index = get_index(newer_than=slept_from)
+        interval = min(interval * 2, max_interval_seconds)
+    return index
+
+
+def summarize_query_action(
+    queries: List[QueryInfo],
+    target_state: str,
+    final_states: Dict[str, Optional[str]],
+    failures: Dict[str, str],
+    pending: Set[str],
+    wait: bool,
+) -> agate.Table:
+    """Summarize the outcome of a bulk query action, one row per selected query"""
+    rows = []
+    for query in queries:
+        final_state = final_states.get(query.query_id)
+        if query.query_id in failures:
+            result = "failed"
+        elif not wait:
+            result = "submitted"
+        elif (final_state or "").lower() == target_state:
+            result = "done"
+        elif query.query_id in pending:
+            result = "timed out"
+        else:
+            result = "errored"
+        rows.append(
+            [
+                query.query_id,
+                query.row.get("Name"),
+                query.actual_state,
+                final_state,
+                result,
+                failures.get(query.query_id),
+            ]
+        )
+    return agate.Table(
+        rows,
+        ["ID", "Name", "PreviousState", "State", "Result", "Error"],
+        [agate.Text()] * 6,
+    )
@@ -0,0 +1,85 @@
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+# Parameters that are fixed at creation, or identify the resource, and are never sent in an UPDATE
+NON_UPDATABLE_PARAMETERS: Dict[str, tuple] = {
+    "compute_pool": (),
+    "store": ("type", "access_region"),
+    "entity": ("store",),
+    "schema_registry": ("type", "access_region"),
+}
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]")
+
+
+def updatable_parameters(
+    resource_type: str, parameters: Mapping[str, Any]
+) -> Dict[str, Any]:
+    excluded = NON_UPDATABLE_PARAMETERS.get(resource_type, ())
+    return {key: value for key, value in parameters.items() if key not in excluded}
+
+
+def _property_key(name: str) -> str:
+    # DESCRIBE and LIST columns name parameters differently, e.g. `kafka.sasl.username` and `KafkaSaslUsername`
+    return _NON_ALPHANUMERIC.sub("", str(name).lower())
+
+
+def _normalize_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    text = str(value).strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in ("'", '"'):
+        text = text[1:-1]
+    return text
+
+
+def parameter_digest(value: Any) -> str:
+    """Hash a parameter value, so that secrets are never written to the deploy state"""
+    serialized = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def parameter_digests(parameters: Mapping[str, Any]) -> Dict[str, str]:
+    return {key: parameter_digest(value) for key, value in parameters.items()}
+
+
+def properties_from_rows(
+    column_names: Iterable[str], rows: Iterable[Any]
+) -> Dict[str, Any]:
+    """Collect the properties of a described resource from wide rows or property/value rows"""
+    column_names = list(column_names)
+    properties: Dict[str, Any] = {}
+    for row in rows:
+        values = list(row)
+        for column, value in zip(column_names, values):
+            properties[_property_key(column)] = value
+        if len(values) == 2 and isinstance(values[0], str):
+            properties[_property_key(values[0])] = values[1]
+    return properties
+
+
+def diff_parameters(
+    resource_type: str,
+    parameters: Mapping[str, Any],
+    described: Mapping[str, Any],
+    applied_digests: Optional[Mapping[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Return the updatable parameters that differ from the existing resource.
+
+    A parameter is compared with the described property of the same name when the resource reports it,
+    otherwise (e.g. credentials) with the digest of the value last applied by dbt. Parameters known to
+    neither are assumed changed.
+    """
+    changes = {}
+    for key, value in updatable_parameters(resource_type, parameters).items():
+        property_key = _property_key(key)
+        if property_key in described and described[property_key] is not None:
+            if _normalize_value(described[property_key]) == _normalize_value(value):
+                continue
+        elif applied_digests and applied_digests.get(key) == parameter_digest(value):
+            continue
+        changes[key] = value
+    return changes
@@ -0,0 +1,424 @@
+import csv
+import datetime
+import decimal
+import hashlib
+import json
+import math
+import threading
+import weakref
+import zlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import agate
+from dbt.adapters.events.logging import AdapterLogger
+from dbt_common.clients.agate_helper import BOM, Integer, Number, build_type_tester
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.state_file import JsonStateFile
+
+logger = AdapterLogger("Deltastream")
+
+# Number of CSV rows held in memory at once by streaming seeds
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _encode_boolean(value: Any) -> Any:
+    # Seeds have always published booleans as 1 and 0
+    return int(value)
+
+
+def _encode_json_boolean(value: Any) -> Any:
+    return bool(value)
+
+
+def _encode_number(value: Any) -> Any:
+    if isinstance(value, bool):
+        return _encode_boolean(value)
+    if isinstance(value, decimal.Decimal):
+        if not value.is_finite():
+            return None
+        # Integral values without a fractional part in the CSV are published as integers
+        return float(value) if "." in str(value) else int(value)
+    return value
+
+
+def _encode_bigint(value: Any) -> Any:
+    if isinstance(value, decimal.Decimal) and not value.is_finite():
+        return None
+    return int(value)
+
+
+def _encode_double(value: Any) -> Any:
+    if isinstance(value, decimal.Decimal) and not value.is_finite():
+        return None
+    return float(value)
+
+
+def _encode_date(value: Any) -> Any:
+    return value.isoformat()
+
+
+def _encode_datetime(value: Any) -> Any:
+    return value.isoformat(sep=" ")
+
+
+def _encode_text(value: Any) -> Any:
+    return str(value)
+
+
+def _encode_untyped(value: Any) -> Any:
+    if isinstance(value, (bool, int, float, decimal.Decimal)):
+        return _encode_number(value)
+    if isinstance(value, datetime.datetime):
+        return _encode_datetime(value)
+    if isinstance(value, datetime.date):
+        return _encode_date(value)
+    return _encode_text(value)
+
+
+def column_encoder(
+    data_type: Any, deltastream_type: Optional[str] = None, json_booleans: bool = False
+) -> Callable[[Any], Any]:
+    """
+    Converter of the values of an agate column to JSON-serializable values.
+
+    Booleans are published as 1 and 0, or as JSON `true` and `false` with `json_booleans`.
+    """
+    # Every value of a profiled numeric column is published with the column's type
+    if deltastream_type == "BIGINT":
+        return _encode_bigint
+    if deltastream_type == "DOUBLE":
+        return _encode_double
+    if isinstance(data_type, agate.Boolean):
+        return _encode_json_boolean if json_booleans else _encode_boolean
+    if isinstance(data_type, agate.Number):
+        return _encode_number
+    # DateTime before Date, agate.DateTime is not a subclass of agate.Date but datetime is of date
+    if isinstance(data_type, agate.DateTime):
+        return _encode_datetime
+    if isinstance(data_type, agate.Date):
+        return _encode_date
+    if isinstance(data_type, agate.Text):
+        return _encode_text
+    return _encode_untyped
+
+
+def encode_records(
+    column_names: List[str],
+    data_types: List[Any],
+    columns: List[Iterable[Any]],
+    deltastream_types: Optional[List[str]] = None,
+    json_booleans: bool = False,
+) -> List[str]:
+    """Encode the rows of a table, given column by column, as JSON records"""
+    encoders = [
+        column_encoder(data_type, deltastream_type, json_booleans)
+        for data_type, deltastream_type in zip(
+            data_types, deltastream_types or [None] * len(data_types)
+        )
+    ]
+    encoded = [
+        [None if value is None else encoder(value) for value in values]
+        for encoder, values in zip(encoders, columns)
+    ]
+    return [
+        json.dumps(dict(zip(column_names, row)), default=str) for row in zip(*encoded)
+    ]
+
+
+def encode_table_records(
+    agate_table: "agate.Table", json_booleans: bool = False
+) -> List[str]:
+    return encode_records(
+        list(agate_table.column_names),
+        list(agate_table.column_types),
+        [column.values() for column in agate_table.columns],
+        profile_column_types(agate_table),
+        json_booleans,
+    )
+
+
+# Profiles of the seed tables, computed once per table for all the convert_*_type hooks and the encoder
+_TYPE_PROFILES: "weakref.WeakKeyDictionary[agate.Table, List[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_TYPE_PROFILES_LOCK = threading.Lock()
+
+
+def _has_fraction(value: Any) -> bool:
+    # Like agate.MaxPrecision, trailing zeros are not significant: 2.0 is integral
+    if isinstance(value, decimal.Decimal):
+        return value.is_finite() and value.normalize().as_tuple().exponent < 0
+    if isinstance(value, float):
+        return math.isfinite(value) and not value.is_integer()
+    return False
+
+
+def _deltastream_type(data_type: Any, fractional: bool) -> str:
+    if isinstance(data_type, Integer):
+        return "BIGINT"
+    if isinstance(data_type, agate.Number):
+        return "DOUBLE" if fractional else "BIGINT"
+    if isinstance(data_type, agate.Boolean):
+        return "BOOLEAN"
+    if isinstance(data_type, agate.DateTime):
+        return "TIMESTAMP"
+    if isinstance(data_type, agate.Date):
+        return "DATE"
+    if isinstance(data_type, agate.TimeDelta):
+        return "TIME"
+    return "VARCHAR"
+
+
+def profile_column_types(agate_table: "agate.Table") -> List[str]:
+    """
+    DeltaStream type of every column of a seed table.
+
+    The precision of all numeric columns is found in a single scan of the rows, that stops once every
+    numeric column holds a fractional value.
+    """
+    with _TYPE_PROFILES_LOCK:
+        profile = _TYPE_PROFILES.get(agate_table)
+    if profile is not None:
+        return list(profile)
+    data_types = list(agate_table.column_types)
+    pending = [
+        index
+        for index, data_type in enumerate(data_types)
+        if isinstance(data_type, agate.Number)
+    ]
+    fractional = set()
+    for row in agate_table.rows:
+        if not pending:
+            break
+        found = [index for index in pending if _has_fraction(row[index])]
+        if found:
+            fractional.update(found)
+            pending = [index for index in pending if index not in fractional]
+    profile = [
+        _deltastream_type(data_type, index in fractional)
+        for index, data_type in enumerate(data_types)
+    ]
+    with _TYPE_PROFILES_LOCK:
+        _TYPE_PROFILES[agate_table] = profile
+    return list(profile)
+
+
+def insert_entity_prefix(entity: str, store: Optional[str]) -> str:
+    store_clause = f' IN STORE "{store}"' if store else ""
+    return f'INSERT INTO ENTITY "{entity}"{store_clause} VALUE('
+
+
+def insert_statements(
+    entity: str, store: Optional[str], json_values: Iterable[str]
+) -> List[str]:
+    """Build one INSERT INTO ENTITY ... VALUE('{...}') statement per JSON record"""
+    prefix = insert_entity_prefix(entity, store)
+    return [prefix + "'" + value.replace("'", "''") + "');" for value in json_values]
+
+
+def partition_by_key(
+    json_values: Iterable[str], keys: Iterable[Any], lanes: int
+) -> List[List[str]]:
+    """Spread records over lanes, all the records of a key staying in one lane in their original order"""
+    partitions: List[List[str]] = [[] for _ in range(max(1, lanes))]
+    for value, key in zip(json_values, keys):
+        # A stable hash, so that a key lands in the same lane on every run
+        lane = zlib.crc32(str(key).encode("utf-8")) % len(partitions)
+        partitions[lane].append(value)
+    return [partition for partition in partitions if partition]
+
+
+def _csv_rows(path: str, delimiter: str) -> Iterator[List[str]]:
+    # The header first, then the rows, read one at a time
+    with open(path, encoding="utf-8", newline="") as fp:
+        if fp.read(1) != BOM:
+            fp.seek(0)
+        yield from csv.reader(fp, delimiter=delimiter)
+
+
+def infer_csv_types(
+    path: str, text_columns: Iterable[str] = (), delimiter: str = ","
+) -> Tuple[List[str], List[Any], List[str]]:
+    """
+    Column names, agate types and DeltaStream types of a seed CSV file, reading one row at a time.
+
+    This replays the type inference dbt runs when it loads the whole file, so a column gets the first
+    type of dbt's type tester that fits all its values, and is published as DOUBLE when any of its
+    numeric values has a fractional part.
+    """
+    tester = build_type_tester(text_columns=list(text_columns))
+    # agate only infers types from rows held in memory, test the tester's own types value by value
+    possible_types = list(tester._possible_types)
+    forced = tester._force
+    numeric = Number(null_values=("null", ""))
+    rows = _csv_rows(path, delimiter)
+    column_names = next(rows, None)
+    if column_names is None:
+        return [], [], []
+    hypotheses = [
+        None if name in forced else set(possible_types) for name in column_names
+    ]
+    fractional: Set[int] = set()
+    for row in rows:
+        for index, value in enumerate(row[: len(column_names)]):
+            candidates = hypotheses[index]
+            if candidates is None:
+                continue
+            if len(candidates) > 1:
+                for data_type in list(candidates):
+                    if not data_type.test(value):
+                        candidates.discard(data_type)
+            if index not in fractional and any(
+                isinstance(data_type, agate.Number) for data_type in candidates
+            ):
+                try:
+                    if _has_fraction(numeric.cast(value)):
+                        fractional.add(index)
+                except agate.exceptions.CastError:
+                    pass
+    data_types = [
+        forced[name]
+        if candidates is None
+        else next(t for t in possible_types if t in candidates)
+        for name, candidates in zip(column_names, hypotheses)
+    ]
+    profile = [
+        _deltastream_type(data_type, index in fractional)
+        for index, data_type in enumerate(data_types)
+    ]
+    return column_names, data_types, profile
+
+
+def _table_chunk(
+    rows: List[List[str]],
+    column_names: List[str],
+    data_types: List[Any],
+    profile: List[str],
+) -> "agate.Table":
+    table = agate.Table(rows, column_names, data_types)
+    with _TYPE_PROFILES_LOCK:
+        _TYPE_PROFILES[table] = list(profile)
+    return table
+
+
+def read_csv_chunks(
+    path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    text_columns: Iterable[str] = (),
+    delimiter: str = ",",
+) -> Iterator["agate.Table"]:
+    """
+    Read a seed CSV file as tables of up to `chunk_size` rows, typed like dbt types seed columns.
+
+    The file is read twice: once to type its columns from all their values, then chunk by chunk, so
+    only one chunk is held in memory and every chunk is typed and encoded like the whole file.
+    """
+    column_names, data_types, profile = infer_csv_types(path, text_columns, delimiter)
+    if not column_names:
+        return
+    reader = _csv_rows(path, delimiter)
+    next(reader)
+    rows: List[List[str]] = []
+    for row in reader:
+        rows.append(row)
+        if len(rows) >= chunk_size:
+            yield _table_chunk(rows, column_names, data_types, profile)
+            rows = []
+    if rows:
+        yield _table_chunk(rows, column_names, data_types, profile)
+
+
+def row_digest(values: Iterable[Any]) -> str:
+    serialized = json.dumps(list(values), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:32]
+
+
+class SeedDelta:
+    """
+    Rows of a seed that are new or changed since its previous successful run.
+
+    Rows are identified by the values of their `unique_key` columns, or by their whole content
+    without one. The content hash of every row is kept to compare the next run against.
+    """
+
+    def __init__(
+        self, previous: Mapping[str, str], unique_key: Optional[List[str]] = None
+    ) -> None:
+        self.previous = previous
+        self.unique_key = unique_key or []
+        self.hashes: Dict[str, str] = {}
+
+    def _key_indexes(self, table: "agate.Table") -> List[int]:
+        missing = [name for name in self.unique_key if name not in table.column_names]
+        if missing:
+            raise DbtRuntimeError(
+                f"Seed unique_key columns not found in the seed: {', '.join(missing)}"
+            )
+        return [table.column_names.index(name) for name in self.unique_key]
+
+    def changed(self, table: "agate.Table") -> "agate.Table":
+        key_indexes = self._key_indexes(table)
+        rows = []
+        for row in table.rows:
+            digest = row_digest(row)
+            key = (
+                json.dumps([row[index] for index in key_indexes], default=str)
+                if key_indexes
+                else digest
+            )
+            if key_indexes and key in self.hashes:
+                raise DbtRuntimeError(
+                    f"Seed unique_key {', '.join(self.unique_key)} is not unique, "
+                    f"several rows have the key {key}"
+                )
+            self.hashes[key] = digest
+            if self.previous.get(key) != digest:
+                rows.append(row)
+        changed = agate.Table(rows, table.column_names, table.column_types)
+        # The changed rows are published with the types of the whole seed, e.g. 1.0 and not 1
+        # when another row of the column holds 2.5
+        profile = profile_column_types(table)
+        with _TYPE_PROFILES_LOCK:
+            _TYPE_PROFILES[changed] = profile
+        return changed
+
+
+class SeedStateStore(JsonStateFile):
+    """JSON file recording the row hashes of the last successful run of each delta seed"""
+
+    FILE_NAME = "deltastream_seed_state.json"
+    SECTION = "seeds"
+    DESCRIPTION = "seed state"
+    DUMP_OPTIONS = {"sort_keys": True}
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self._records: Dict[str, Dict[str, Any]] = self._read()
+
+    def _snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return self._records
+
+    def rows(self, unique_id: str, target: str) -> Dict[str, str]:
+        """Row hashes of the last run of a seed, empty when it was loaded into another entity"""
+        with self._lock:
+            record = self._records.get(unique_id)
+            if record is None or record.get("target") != target:
+                return {}
+            return dict(record.get("rows", {}))
+
+    def put(self, unique_id: str, target: str, rows: Mapping[str, str]) -> None:
+        with self._lock:
+            self._records[unique_id] = {"target": target, "rows": dict(rows)}
+            self._dirty = True
@@ -0,0 +1,35 @@
+from typing import Any, Dict, List
+
+from dbt.adapters.deltastream.deploy_state import node_value
+
+# Deployment layer of each source materialization: a source only depends on sources of earlier layers
+# (e.g. a store may use a schema registry, an entity lives in a store, a function is loaded from a
+# function source and streams read from stores with descriptors)
+SOURCE_LAYERS: Dict[str, int] = {
+    "database": 0,
+    "compute_pool": 0,
+    "schema_registry": 0,
+    "function_source": 0,
+    "descriptor_source": 0,
+    "store": 1,
+    "function": 1,
+    "entity": 2,
+    "stream": 3,
+    "changelog": 3,
+}
+
+
+def source_materialization(node: Any) -> str:
+    config = node_value(node, "config") or {}
+    return node_value(config, "materialized") or "stream"
+
+
+def plan_source_layers(nodes: List[Any]) -> List[List[Any]]:
+    """Group source nodes into layers that can each be deployed concurrently, in dependency order"""
+    layers: Dict[int, List[Any]] = {}
+    last_layer = max(SOURCE_LAYERS.values())
+    for node in nodes:
+        # Unknown materializations are deployed last, create_source reports them as unsupported
+        layer = SOURCE_LAYERS.get(source_materialization(node), last_layer)
+        layers.setdefault(layer, []).append(node)
+    return [layers[layer] for layer in sorted(layers)]
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict
+
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("Deltastream")
+
+
+class JsonStateFile:
+    """
+    Versioned JSON file kept across dbt invocations, read once and written back atomically by `flush`.
+
+    The file holds `{"version": VERSION, SECTION: ...}`, a file of another version is ignored.
+    Subclasses read their section with `_read`, return it from `_snapshot` and set `_dirty` when it
+    changes, holding `_lock`.
+    """
+
+    VERSION = 1
+    # Key of the persisted records in the file
+    SECTION = ""
+    # Name of the file in log messages
+    DESCRIPTION = ""
+    # Options of `json.dump` when writing the file
+    DUMP_OPTIONS: Dict[str, Any] = {}
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._dirty = False
+
+    def _read(self) -> Dict[str, Any]:
+        """Return the persisted section, empty when the file is missing, unreadable or of another version"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(
+                f"Ignoring unreadable {self.DESCRIPTION} {self.path}: {str(e)}"
+            )
+            return {}
+        if not isinstance(content, dict) or content.get("version") != self.VERSION:
+            return {}
+        return content.get(self.SECTION, {})
+
+    def _snapshot(self) -> Any:
+        raise NotImplementedError
+
+    def _write_failed(self, error: OSError) -> None:
+        logger.warning(f"Unable to write {self.DESCRIPTION} {self.path}: {str(error)}")
+
+    def flush(self) -> None:
+        """Atomically write the file to disk if it changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            content = {"version": self.VERSION, self.SECTION: self._snapshot()}
+            directory = os.path.dirname(self.path) or "."
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(content, f, **self.DUMP_OPTIONS)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                self._write_failed(e)
@@ -269,11 +269,8 @@
 {% endmacro %}
 
 {% macro deltastream__sql_contains_select(sql) -%}
-  {% if "select" in (sql | lower) %}
-    {{ return(true) }}
-  {% else %}
-    {{ return(false) }}
-  {% endif %}
+  {#- Whether the model is a query, i.e. its SQL starts with SELECT or WITH -#}
+  {{ return(adapter.sql_is_query(sql)) }}
 {% endmacro %}
 
 {% macro create_deltastream_database(database_name) -%}
@@ -11,3 +11,30 @@
   {{ log('Created application: ' ~ application_name ~ ' with ' ~ statements|length ~ ' statements', info = True) }}
   {{ return(result) }}
 {% endmacro %}
+
+
+{% macro deltastream__model_application(application=none) %}
+  {#- The application deploying the model, `true` groups it with the other models of its DAG layer.
+      Fails when a parent is created by an application at the end of the run that the model cannot follow -#}
+  {{ return(adapter.resolve_application(model, application)) }}
+{% endmacro %}
+
+{% macro deltastream__buffer_application_model(application_name, old_relation, target_relation, statement, fingerprint, relation_label) %}
+  {#- An existing relation is dropped by the application itself, right before it is created again -#}
+  {%- if old_relation -%}
+    {{ log(relation_label ~ " " ~ old_relation ~ " already exists. It will be dropped by application " ~ application_name, info = True) }}
+  {%- endif -%}
+  {{ adapter.buffer_application_statement(application_name, model, target_relation, statement, fingerprint, old_relation) }}
+  {{ log(relation_label ~ " " ~ target_relation ~ " will be created by application " ~ application_name ~ " at the end of the run", info = True) }}
+  {% call noop_statement('main', 'DEFERRED', 'DEFERRED') -%}
+    {{ statement }}
+  {%- endcall %}
+{% endmacro %}
+
+{% macro deltastream_submit_applications() %}
+  {#- on-run-end hook submitting the models configured with `application` as one application each -#}
+  {% if execute %}
+    {% do adapter.submit_applications() %}
+  {% endif %}
+  {{ return('') }}
+{% endmacro %}
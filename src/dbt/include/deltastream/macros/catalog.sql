@@ -24,5 +24,9 @@
 {%- endmacro %}
 
 {% macro deltastream__get_catalog_relations(information_schema, relations) -%}
-    {{ return(adapter.get_catalog_relations_parallel(relations)) }}
+    {#- With deltastream_incremental_catalog, only relations changed since the previous catalog.json are described -#}
+    {{ return(adapter.get_catalog_relations_parallel(
+        relations,
+        incremental=var('deltastream_incremental_catalog', false)
+    )) }}
 {%- endmacro %}
\ No newline at end of file
@@ -0,0 +1,146 @@
+{% macro deltastream__deployment_fingerprint(materialization, sql, parameters, extra=none) -%}
+  {{ return(adapter.get_deploy_fingerprint(model, sql, parameters, materialization, extra)) }}
+{%- endmacro %}
+
+{% macro deltastream__deployment_is_unchanged(old_relation, target_relation, fingerprint) -%}
+  {#-
+    With `skip_unchanged`, a model is skipped when its relation exists, was deployed with the same
+    fingerprint and, for a query, is still written to by a running query
+  -#}
+  {%- if not old_relation or should_full_refresh() or not config.get('skip_unchanged', false) -%}
+    {{ return(false) }}
+  {%- endif -%}
+  {{ return(adapter.is_deployment_unchanged(model, target_relation, fingerprint, deltastream__sql_contains_select(sql))) }}
+{%- endmacro %}
+
+{% macro deltastream__skip_unchanged_deployment(target_relation, relation_label) -%}
+  {{ log(relation_label ~ " " ~ target_relation ~ " is unchanged since its last deployment. Skipping.", info = True) }}
+  {% call noop_statement('main', 'SKIP', 'SKIP') -%}
+    -- {{ target_relation }} is unchanged
+  {%- endcall %}
+{%- endmacro %}
+
+{% macro deltastream__blue_green_deploy(target_relation, old_relation, sql, parameters, relation_type, primary_key=none) -%}
+  {#-
+    Zero-downtime redeploy of a stream or changelog.
+
+    The query runs in a producer relation alternating between `<name>__blue` and `<name>__green`, both
+    writing to the same topic. `<name>` itself is a plain definition over that topic, so downstream
+    models keep reading it while producers are swapped: the new producer is started, and the previous
+    one is only terminated and dropped once the new query is running.
+
+    The active color is the producer whose query is running on the server. Between the start of the
+    new producer and the termination of the previous one, both write to the topic: downstream models
+    see the records of that overlap twice. A relation is only dropped once no query writes to it.
+
+    A relation still written to by its own query is only migrated to a definition over its topic with
+    `blue_green_migrate`, since dropping it interrupts the queries reading it.
+  -#}
+  {%- if relation_type == 'changelog' and not primary_key -%}
+    {{ exceptions.raise_compiler_error("The blue_green deploy_strategy of changelog " ~ target_relation ~ " requires a primary_key") }}
+  {%- endif -%}
+
+  {%- set topic = parameters.get('topic', target_relation.identifier) -%}
+  {%- set producer_parameters = {} -%}
+  {%- do producer_parameters.update(parameters) -%}
+  {%- do producer_parameters.update({'topic': topic}) -%}
+  {%- set definition_parameters = {'topic': topic} -%}
+  {%- for key, value in parameters.items() -%}
+    {%- if key.startswith('value.') or key.startswith('key.') or key in ('store', 'timestamp') -%}
+      {%- do definition_parameters.update({key: value}) -%}
+    {%- endif -%}
+  {%- endfor -%}
+
+  {%- set plan = adapter.get_blue_green_plan(target_relation, old_relation, config.get('blue_green_migrate', false)) -%}
+  {%- set next_color = plan['next'] -%}
+  {%- set previous_color = 'blue' if next_color == 'green' else 'green' -%}
+  {%- set next_producer = api.Relation.create(identifier=target_relation.identifier ~ '__' ~ next_color,
+                                              schema=target_relation.schema,
+                                              database=target_relation.database,
+                                              type=relation_type) -%}
+  {%- set previous_producer = adapter.get_relation(identifier=target_relation.identifier ~ '__' ~ previous_color,
+                                                   schema=target_relation.schema,
+                                                   database=target_relation.database) -%}
+
+  {#- Leftover of an interrupted deployment -#}
+  {%- set stale_producer = adapter.get_relation(identifier=next_producer.identifier,
+                                                schema=next_producer.schema,
+                                                database=next_producer.database) -%}
+  {%- if stale_producer -%}
+    {{ deltastream__drop_producer(stale_producer) }}
+  {%- endif -%}
+
+  {{ log("Starting " ~ next_producer ~ " writing to topic " ~ topic, info = True) }}
+  {%- if relation_type == 'changelog' -%}
+    {%- do run_query(deltastream__create_changelog_as(next_producer, sql, producer_parameters)) -%}
+  {%- else -%}
+    {%- do run_query(deltastream__create_stream_as(next_producer, sql, producer_parameters)) -%}
+  {%- endif -%}
+  {%- do adapter.wait_for_queries_running(next_producer, config.get('blue_green_timeout_seconds', 300)) -%}
+
+  {#- The new producer is running: stop the previous ones -#}
+  {%- set ns = namespace(recreate_definition=true) -%}
+  {%- if old_relation -%}
+    {%- if plan['migrating'] -%}
+      {{ terminate_relation_queries(old_relation) }}
+    {%- else -%}
+      {%- set old_columns = adapter.get_columns_in_relation(old_relation) | map(attribute='name') | list -%}
+      {%- set new_columns = adapter.get_columns_in_relation(next_producer) | map(attribute='name') | list -%}
+      {%- set ns.recreate_definition = old_columns != new_columns -%}
+    {%- endif -%}
+  {%- endif -%}
+  {%- if previous_producer -%}
+    {{ deltastream__drop_producer(previous_producer) }}
+  {%- endif -%}
+
+  {%- if old_relation and ns.recreate_definition -%}
+    {{ deltastream__drop_producer(old_relation) }}
+  {%- endif -%}
+
+  {%- set columns = {} -%}
+  {%- for column in adapter.get_columns_in_relation(next_producer) -%}
+    {%- do columns.update({column.name: {'type': column.dtype}}) -%}
+  {%- endfor -%}
+  {%- if ns.recreate_definition %}
+    {% call statement('main') -%}
+      {%- if relation_type == 'changelog' %}
+        {{ deltastream__create_changelog(target_relation, columns, definition_parameters, primary_key) }}
+      {%- else %}
+        {{ deltastream__create_stream(target_relation, columns, definition_parameters) }}
+      {%- endif %}
+    {%- endcall %}
+  {%- else %}
+    {% call noop_statement('main', 'OK', 'OK') -%}
+      -- {{ target_relation }} already reads topic {{ topic }}
+    {%- endcall %}
+  {%- endif %}
+
+  {{ return(next_color) }}
+{%- endmacro %}
+
+{% macro deltastream__drop_producer(relation) -%}
+  {#- Terminate the queries writing to a relation and drop it once none of them is running -#}
+  {{ terminate_relation_queries(relation) }}
+  {%- do adapter.wait_for_queries_stopped(relation, config.get('blue_green_timeout_seconds', 300)) -%}
+  {{ adapter.drop_relation(relation) }}
+{%- endmacro %}
+
+{% macro deltastream__wait_until_running(relation) -%}
+  {#- With `wait_until_running`, the model only succeeds once the query it launched is running -#}
+  {%- if config.get('wait_until_running', false) and deltastream__sql_contains_select(sql) -%}
+    {{ log("Waiting for the query writing to " ~ relation ~ " to be running", info = True) }}
+    {%- do adapter.wait_for_queries_running(relation, config.get('wait_timeout_seconds', 300)) -%}
+  {%- endif -%}
+{%- endmacro %}
+
+{% macro deltastream__resource_parameter_changes(resource_type, identifier, parameters) -%}
+  {#- None when the resource does not exist, otherwise the updatable parameters that changed -#}
+  {{ return(adapter.get_resource_parameter_changes(model, resource_type, identifier, parameters, should_full_refresh())) }}
+{%- endmacro %}
+
+{% macro deltastream__skip_unchanged_resource(resource_label, identifier) -%}
+  {{ log(resource_label ~ " " ~ identifier ~ " parameters are unchanged. Skipping update.", info = True) }}
+  {% call noop_statement('main', 'SKIP', 'SKIP') -%}
+    -- {{ identifier }} is unchanged
+  {%- endcall %}
+{%- endmacro %}
@@ -1,9 +1,13 @@
 {% macro deltastream__collect_freshness(source, loaded_at_field, filter) %}
-    {{ exceptions.raise_compiler_error(
-        """
-        dbt-deltastream does not implement source freshness checks.
-
-        If this feature is important to you, please reach out!
-        """
-    )}}
+  {#- Streams never complete: read the recent records of the source for a bounded amount of time -#}
+  {%- set result = adapter.collect_freshness_bounded(
+      source,
+      loaded_at_field,
+      filter,
+      timeout_seconds=var('deltastream_freshness_timeout_seconds', 10),
+      lookback_hours=var('deltastream_freshness_lookback_hours', 24),
+      max_rows=var('deltastream_freshness_max_rows', 100000)
+  ) -%}
+  {%- do store_result('collect_freshness', response=result[0], agate_table=result[1]) -%}
+  {{ return(load_result('collect_freshness')) }}
 {% endmacro %}
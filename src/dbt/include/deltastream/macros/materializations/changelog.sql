@@ -8,6 +8,32 @@
                                                 schema=schema,
                                                 database=database,
                                                 type='changelog') -%}
+  {%- set fingerprint = deltastream__deployment_fingerprint('changelog', sql, parameters) -%}
+
+  {%- set application_name = deltastream__model_application(config.get('application')) -%}
+
+  {% if deltastream__deployment_is_unchanged(old_relation, target_relation, fingerprint) %}
+    {{ run_hooks(pre_hooks) }}
+    {{ deltastream__skip_unchanged_deployment(target_relation, 'Changelog') }}
+    {{ run_hooks(post_hooks) }}
+    {{ return({'relations': [target_relation]}) }}
+  {% endif %}
+
+  {% if application_name and deltastream__sql_contains_select(sql) %}
+    {{ run_hooks(pre_hooks) }}
+    {{ deltastream__buffer_application_model(application_name, old_relation, target_relation, deltastream__create_changelog_as(target_relation, sql, parameters), fingerprint, 'Changelog') }}
+    {{ run_hooks(post_hooks) }}
+    {{ return({'relations': []}) }}
+  {% endif %}
+
+  {%- set blue_green = config.get('deploy_strategy', 'recreate') == 'blue_green' and deltastream__sql_contains_select(sql) -%}
+  {% if blue_green %}
+    {{ run_hooks(pre_hooks) }}
+    {%- set color = deltastream__blue_green_deploy(target_relation, old_relation, sql, parameters, 'changelog', config.get('primary_key')) -%}
+    {{ adapter.record_deployment(model, target_relation, fingerprint, color) }}
+    {{ run_hooks(post_hooks) }}
+    {{ return({'relations': [target_relation]}) }}
+  {% endif %}
 
   {% if old_relation %}
     {{ log("Changelog " ~ old_relation ~ " already exists. Dropping.", info = True) }}
@@ -25,6 +51,9 @@
     {%- endif %}
   {%- endcall %}
 
+  {{ deltastream__wait_until_running(target_relation) }}
+  {{ adapter.record_deployment(model, target_relation, fingerprint) }}
+
   {{ run_hooks(post_hooks) }}
 
   {{ return({'relations': [target_relation]}) }}
@@ -9,15 +9,22 @@
 
   {{ run_hooks(pre_hooks) }}
 
-  {% call statement('main') -%}
-    {% if adapter.get_compute_pool(identifier) is not none %}
-      {{ deltastream__update_compute_pool(resource, parameters) }}
-      {{ log('Updated compute pool: ' ~ identifier) }}
-    {% else %}
+  {%- set changes = deltastream__resource_parameter_changes('compute_pool', identifier, parameters) -%}
+  {% if changes is none %}
+    {% call statement('main') -%}
       {{ deltastream__create_compute_pool(resource, parameters) }}
       {{ log('Created compute pool: ' ~ identifier) }}
-    {% endif %}
-  {%- endcall %}
+    {%- endcall %}
+  {% elif changes %}
+    {#- Only the parameters that differ from the existing compute pool are updated -#}
+    {% call statement('main') -%}
+      {{ deltastream__update_compute_pool(resource, changes) }}
+      {{ log('Updated compute pool: ' ~ identifier) }}
+    {%- endcall %}
+  {% else %}
+    {{ deltastream__skip_unchanged_resource('Compute pool', identifier) }}
+  {% endif %}
+  {% do adapter.record_resource_parameters(model, 'compute_pool', identifier, parameters) %}
 
   {{ run_hooks(post_hooks) }}
 
@@ -10,15 +10,22 @@
 
   {{ run_hooks(pre_hooks) }}
 
-  {% call statement('main') -%}
-    {% if adapter.get_entity(identifier, store) is not none %}
-      {{ deltastream__update_entity(resource, parameters, store) }}
-      {{ log('Updated entity: ' ~ identifier) }}
-    {% else %}
+  {%- set changes = deltastream__resource_parameter_changes('entity', identifier, parameters) -%}
+  {% if changes is none %}
+    {% call statement('main') -%}
       {{ deltastream__create_entity(resource, parameters, store) }}
       {{ log('Created entity: ' ~ identifier) }}
-    {% endif %}
-  {%- endcall %}
+    {%- endcall %}
+  {% elif changes %}
+    {#- Only the parameters that differ from the existing entity are updated -#}
+    {% call statement('main') -%}
+      {{ deltastream__update_entity(resource, changes, store) }}
+      {{ log('Updated entity: ' ~ identifier) }}
+    {%- endcall %}
+  {% else %}
+    {{ deltastream__skip_unchanged_resource('Entity', identifier) }}
+  {% endif %}
+  {% do adapter.record_resource_parameters(model, 'entity', identifier, parameters) %}
 
   {{ run_hooks(post_hooks) }}
 
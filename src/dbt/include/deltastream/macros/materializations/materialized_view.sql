@@ -8,6 +8,23 @@
                                                 schema=schema,
                                                 database=database,
                                                 type='materialized_view') -%}
+  {%- set fingerprint = deltastream__deployment_fingerprint('materialized_view', sql, parameters) -%}
+
+  {%- set application_name = deltastream__model_application(config.get('application')) -%}
+
+  {% if deltastream__deployment_is_unchanged(old_relation, target_relation, fingerprint) %}
+    {{ run_hooks(pre_hooks) }}
+    {{ deltastream__skip_unchanged_deployment(target_relation, 'Materialized view') }}
+    {{ run_hooks(post_hooks) }}
+    {{ return({'relations': [target_relation]}) }}
+  {% endif %}
+
+  {% if application_name and deltastream__sql_contains_select(sql) %}
+    {{ run_hooks(pre_hooks) }}
+    {{ deltastream__buffer_application_model(application_name, old_relation, target_relation, deltastream__create_materialized_view_as(target_relation, sql, parameters), fingerprint, 'Materialized view') }}
+    {{ run_hooks(post_hooks) }}
+    {{ return({'relations': []}) }}
+  {% endif %}
 
   {% if old_relation %}
     {{ adapter.drop_relation(old_relation) }}
@@ -19,6 +36,9 @@
     {{ deltastream__create_materialized_view_as(target_relation, sql, parameters) }}
   {%- endcall %}
 
+  {{ deltastream__wait_until_running(target_relation) }}
+  {{ adapter.record_deployment(model, target_relation, fingerprint) }}
+
   {{ run_hooks(post_hooks) }}
 
   {{ return({'relations': [target_relation]}) }}
@@ -9,15 +9,22 @@
 
   {{ run_hooks(pre_hooks) }}
 
-  {% call statement('main') -%}
-    {% if adapter.get_schema_registry(identifier) is not none %}
-      {{ deltastream__update_schema_registry_filtered(resource, parameters) }}
-      {{ log('Updated schema registry: ' ~ identifier) }}
-    {% else %}
+  {%- set changes = deltastream__resource_parameter_changes('schema_registry', identifier, parameters) -%}
+  {% if changes is none %}
+    {% call statement('main') -%}
       {{ deltastream__create_schema_registry(resource, parameters) }}
       {{ log('Created schema registry: ' ~ identifier) }}
-    {% endif %}
-  {%- endcall %}
+    {%- endcall %}
+  {% elif changes %}
+    {#- Only the parameters that differ from the existing schema registry are updated -#}
+    {% call statement('main') -%}
+      {{ deltastream__update_schema_registry(resource, changes) }}
+      {{ log('Updated schema registry: ' ~ identifier) }}
+    {%- endcall %}
+  {% else %}
+    {{ deltastream__skip_unchanged_resource('Schema registry', identifier) }}
+  {% endif %}
+  {% do adapter.record_resource_parameters(model, 'schema_registry', identifier, parameters) %}
 
   {{ run_hooks(post_hooks) }}
 
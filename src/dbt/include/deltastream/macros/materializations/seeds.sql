@@ -9,10 +9,14 @@
   {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
 
   {%- set grant_config = config.get('grants') -%}
-  {%- set agate_table = load_agate_table() -%}
-  -- grab current tables grants config for comparison later on
-
-  {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
+  {%- set streaming = config.get('streaming') or model['config'].get('streaming') -%}
+  {%- if streaming -%}
+    -- streaming seeds read the CSV file in chunks while inserting it, the rows are not shown
+    {%- do store_result('agate_table', response='OK') -%}
+  {%- else -%}
+    {%- set agate_table = load_agate_table() -%}
+    {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
+  {%- endif -%}
 
   {{ run_hooks(pre_hooks, inside_transaction=False) }}
 
@@ -39,15 +43,11 @@
 
   -- build model
   {% set code = 'INSERT' %}
-  {% set rows_affected = (agate_table.rows | length) %}
-  {% set statements_list = deltastream__load_csv_rows_as_list(model, agate_table, entity, store) %}
-
-  {% for sql_statement in statements_list %}
-    {% set result = run_query(sql_statement) %}
-  {% endfor %}
+  {% set load_result = deltastream__load_seed(model, none if streaming else agate_table, entity, store) %}
+  {% set rows_affected = load_result['rows'] %}
 
   {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
-    Executed {{ statements_list | length }} INSERT statements
+    Executed {{ load_result['statements'] }} INSERT statements ({{ load_result['rows_per_second'] | round | int }} rows/s)
   {% endcall %}
 
   {% set target_relation = this.incorporate(type='table') %}
@@ -25,85 +25,58 @@
     {%- endif -%}
 {% endmacro %}
 
-{# Helper macro to convert a value to JSON-serializable type #}
-{% macro deltastream__convert_value_to_json_type(value) %}
-  {% if value is number %}
-    {% set value_str = value | string %}
-    {% if '.' in value_str %}
-      {% set converted_value = value | float %}
-    {% else %}
-      {% set converted_value = value | int %}
-    {% endif %}
-  {% elif value is none %}
-    {% set converted_value = null %}
-  {% else %}
-    {% set converted_value = value | string %}
-  {% endif %}
-  {{ return(converted_value) }}
-{% endmacro %}
-
-{# Helper macro to convert a row to a record dictionary #}
-{% macro deltastream__row_to_record_dict(row, column_names) %}
-  {% set record_dict = {} %}
-  {% for col_name in column_names %}
-    {% set idx = loop.index0 %}
-    {% set value = row[idx] %}
-    {% set converted_value = deltastream__convert_value_to_json_type(value) %}
-    {% set record_dict = record_dict.update({col_name: converted_value}) %}
-  {% endfor %}
-  {{ return(record_dict) }}
-{% endmacro %}
-
-{# Helper macro to process agate table rows into JSON records #}
-{% macro deltastream__process_agate_rows(agate_table) %}
-  {%- set batch_size = deltastream__get_batch_size() -%}
-  {% set all_json_records = [] %}
-  
-  {% for chunk in agate_table.rows | batch(batch_size) %}
-    {% for row in chunk %}
-      {% set record_dict = deltastream__row_to_record_dict(row, agate_table.column_names) %}
-      {% do all_json_records.append(record_dict) %}
-    {% endfor %}
-  {% endfor %}
-  
-  {{ return(all_json_records) }}
+{# Booleans are published as 1 and 0 unless `json_booleans` publishes them as JSON true and false #}
+{% macro deltastream__get_seed_json_booleans(model) %}
+  {{ return(config.get('json_booleans') or model['config'].get('json_booleans') or false) }}
 {% endmacro %}
 
-{# Helper macro to generate INSERT statement for a record #}
-{% macro deltastream__generate_insert_statement(record, entity, store, with_params, include_with_params) %}
-  {% set json_value = record | tojson | replace("'", "''") %}
-  {% set insert_sql -%}
-INSERT INTO ENTITY "{{ entity }}"{% if store %} IN STORE "{{ store }}"{% endif %} VALUE('{{ json_value }}'){% if include_with_params %}
-{{ deltastream__with_parameters(with_params) }}{% else %};{% endif %}
-  {%- endset %}
-  {{ return(insert_sql) }}
+{# Helper macro to insert the CSV rows one per statement, with up to `max_in_flight` INSERT statements pending at once #}
+{% macro deltastream__insert_csv_rows(model, agate_table, entity, store) %}
+  {%- set max_in_flight = config.get('max_in_flight') or model['config'].get('max_in_flight') or 1 -%}
+  {%- set ordering_key = config.get('ordering_key') or model['config'].get('ordering_key') -%}
+  {% set keys = none %}
+  {% if ordering_key %}
+    {% if ordering_key not in agate_table.column_names %}
+      {{ exceptions.raise_compiler_error("Seed ordering_key '" ~ ordering_key ~ "' is not a column of the seed") }}
+    {% endif %}
+    {% set keys = agate_table.columns[ordering_key].values() | list %}
+  {% endif %}
+  {% set json_values = adapter.encode_seed_records(agate_table, deltastream__get_seed_json_booleans(model)) %}
+  {{ return(adapter.insert_seed_records(entity, store, json_values, max_in_flight | int, keys)) }}
 {% endmacro %}
 
-{% macro deltastream__load_csv_rows(model, agate_table, entity, store) %}
-  {%- set with_params = config.get('with_params', {}) or model['config'].get('with_params', {}) -%}
-  {% set json_records = deltastream__process_agate_rows(agate_table) %}
-  {% set statements = [] %}
-
-  {% for record in json_records %}
-    {% set single_sql = deltastream__generate_insert_statement(record, entity, store, with_params, true) %}
-    {% do statements.append(single_sql) %}
-  {% endfor %}
-
-  {# Return all SQL statements joined together #}
-  {% set all_sql = statements | join(';\\n') %}
-  {{ return(all_sql) }}
+{# Helper macro to insert the rows of the seed CSV file chunk by chunk, without loading the whole file #}
+{% macro deltastream__insert_csv_file(model, entity, store) %}
+  {%- set max_in_flight = config.get('max_in_flight') or model['config'].get('max_in_flight') or 1 -%}
+  {%- set ordering_key = config.get('ordering_key') or model['config'].get('ordering_key') -%}
+  {%- set chunk_size = config.get('chunk_size') or model['config'].get('chunk_size') -%}
+  {%- set column_types = config.get('column_types') or model['config'].get('column_types') or {} -%}
+  {%- set delimiter = config.get('delimiter') or model['config'].get('delimiter') -%}
+  {%- set seed_path = model['root_path'] ~ '/' ~ model['original_file_path'] -%}
+  {{ return(adapter.insert_seed_file(seed_path, entity, store, max_in_flight | int, ordering_key, chunk_size, column_types.keys() | list, delimiter, deltastream__get_seed_json_booleans(model))) }}
 {% endmacro %}
 
-{% macro deltastream__load_csv_rows_as_list(model, agate_table, entity, store) %}
-  {% set json_records = deltastream__process_agate_rows(agate_table) %}
-  {% set statements = [] %}
+{# Helper macro to load the seed rows, streaming the CSV file when `agate_table` is none #}
+{% macro deltastream__load_seed(model, agate_table, entity, store) %}
+  {%- set delta = config.get('delta') or model['config'].get('delta') -%}
+  {% if delta %}
+    {% if agate_table is none %}
+      {{ exceptions.raise_compiler_error("Delta seeds compare the whole seed with its previous run and cannot be streamed, disable 'streaming'") }}
+    {% endif %}
+    {%- set unique_key = config.get('unique_key') or model['config'].get('unique_key') -%}
+    {%- set agate_table = adapter.seed_delta(model['unique_id'], entity, store, agate_table, unique_key, should_full_refresh()) -%}
+  {% endif %}
 
-  {% for record in json_records %}
-    {% set single_sql = deltastream__generate_insert_statement(record, entity, store, {}, false) %}
-    {% do statements.append(single_sql.strip()) %}
-  {% endfor %}
+  {% if agate_table is none %}
+    {% set load_result = deltastream__insert_csv_file(model, entity, store) %}
+  {% else %}
+    {% set load_result = deltastream__insert_csv_rows(model, agate_table, entity, store) %}
+  {% endif %}
 
-  {{ return(statements) }}
+  {% if delta %}
+    {% do adapter.record_seed_delta(model['unique_id']) %}
+  {% endif %}
+  {{ return(load_result) }}
 {% endmacro %}
 
 {% macro deltastream__get_seed_column_quoted_csv(model, column_names) %}
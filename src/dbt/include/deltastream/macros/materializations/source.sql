@@ -8,24 +8,32 @@
 
   {%- if is_resource %}
     {%- set resource = adapter.create_deltastream_resource(materialized, identifier, parameters) -%}
-    {%- set existing_resource = adapter.get_resource(materialized, identifier, parameters) -%}
-    {%- set has_existing_resource = existing_resource is not none -%}
 
     {# Define which resources can be updated vs need to be recreated #}
     {%- set updatable_resources = ['compute_pool', 'store', 'entity', 'schema_registry'] -%}
     {%- set recreatable_resources = ['function_source', 'descriptor_source', 'function'] -%}
 
+    {%- if materialized in updatable_resources %}
+      {#- Existing resources are only updated with the parameters that changed -#}
+      {%- set changes = adapter.get_resource_parameter_changes(node, materialized, identifier, parameters) -%}
+      {%- set has_existing_resource = changes is not none -%}
+    {%- else %}
+      {%- set existing_resource = adapter.get_resource(materialized, identifier, parameters) -%}
+      {%- set has_existing_resource = existing_resource is not none -%}
+    {%- endif %}
+
     {%- set source_sql %}
       {%- if materialized in updatable_resources %}
         {%- if has_existing_resource %}
-          {%- if materialized == 'compute_pool' %}
-            {{ deltastream__update_compute_pool(resource, parameters) }}
+          {%- if not changes %}
+          {%- elif materialized == 'compute_pool' %}
+            {{ deltastream__update_compute_pool(resource, changes) }}
           {%- elif materialized == 'store' %}
-            {{ deltastream__update_store(resource, parameters) }}
+            {{ deltastream__update_store(resource, changes) }}
           {%- elif materialized == 'entity' %}
-            {{ deltastream__update_entity(resource, parameters) }}
+            {{ deltastream__update_entity(resource, changes, parameters.get('store')) }}
           {%- elif materialized == 'schema_registry' %}
-            {{ deltastream__update_schema_registry_filtered(resource, parameters) }}
+            {{ deltastream__update_schema_registry(resource, changes) }}
           {%- endif %}
         {%- else %}
           {%- if materialized == 'compute_pool' %}
@@ -109,17 +117,31 @@
     {%- set operation = "Creating" -%}
   {%- endif %}
 
-  {{ log(operation ~ " " ~ materialized ~ " " ~ node.identifier ~ "...", info = True) }}
-  {% set source_creation_results = run_query(source_sql) %}
-  {{ log(operation | replace("ing", "ed") ~ " " ~ materialized ~ " " ~ node.identifier ~ "!", info = True) }}
+  {%- if is_resource and has_existing_resource and materialized in updatable_resources and not changes %}
+    {{ log(materialized ~ " " ~ node.identifier ~ " parameters are unchanged. Skipping update.", info = True) }}
+  {%- else %}
+    {{ log(operation ~ " " ~ materialized ~ " " ~ node.identifier ~ "...", info = True) }}
+    {% set source_creation_results = run_query(source_sql) %}
+    {{ log(operation | replace("ing", "ed") ~ " " ~ materialized ~ " " ~ node.identifier ~ "!", info = True) }}
+  {%- endif %}
+  {%- if is_resource and materialized in updatable_resources %}
+    {% do adapter.record_resource_parameters(node, materialized, identifier, parameters) %}
+  {%- endif %}
 {% endmacro %}
 
-{% macro create_sources() %}
+{% macro create_sources(parallel=false, max_workers=none) %}
 {% if execute %}
+{% if parallel %}
+  {#- Dependency layers (e.g. stores before entities and streams) are deployed one after the other,
+      the sources of a layer concurrently -#}
+  {% set count = adapter.create_sources_parallel(graph.sources.values() | list, max_workers) %}
+  {{ log("Created " ~ count ~ " sources", info = True) }}
+{% else %}
 {% for node in graph.sources.values() -%}
   {{ create_source(node) }}
 {%- endfor %}
 {% endif %}
+{% endif %}
 {% endmacro %}
 
 {% macro create_source_by_name(source_name) %}
@@ -9,15 +9,22 @@
 
   {{ run_hooks(pre_hooks) }}
 
-  {% call statement('main') -%}
-    {% if adapter.get_store(identifier) is not none %}
-      {{ deltastream__update_store(resource, parameters) }}
-      {{ log('Updated store: ' ~ identifier) }}
-    {% else %}
+  {%- set changes = deltastream__resource_parameter_changes('store', identifier, parameters) -%}
+  {% if changes is none %}
+    {% call statement('main') -%}
       {{ deltastream__create_store(resource, parameters) }}
       {{ log('Created store: ' ~ identifier) }}
-    {% endif %}
-  {%- endcall %}
+    {%- endcall %}
+  {% elif changes %}
+    {#- Only the parameters that differ from the existing store are updated -#}
+    {% call statement('main') -%}
+      {{ deltastream__update_store(resource, changes) }}
+      {{ log('Updated store: ' ~ identifier) }}
+    {%- endcall %}
+  {% else %}
+    {{ deltastream__skip_unchanged_resource('Store', identifier) }}
+  {% endif %}
+  {% do adapter.record_resource_parameters(model, 'store', identifier, parameters) %}
 
   {{ run_hooks(post_hooks) }}
 
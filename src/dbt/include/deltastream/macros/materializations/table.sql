@@ -8,6 +8,16 @@
                                                 schema=schema,
                                                 database=database,
                                                 type='table') -%}
+  {%- set fingerprint = deltastream__deployment_fingerprint('table', sql, parameters) -%}
+
+  {%- do deltastream__model_application() -%}
+
+  {% if deltastream__deployment_is_unchanged(old_relation, target_relation, fingerprint) %}
+    {{ run_hooks(pre_hooks) }}
+    {{ deltastream__skip_unchanged_deployment(target_relation, 'Table') }}
+    {{ run_hooks(post_hooks) }}
+    {{ return({'relations': [target_relation]}) }}
+  {% endif %}
 
   {% if old_relation %}
     {{ adapter.drop_relation(old_relation) }}
@@ -19,6 +29,9 @@
     {{ deltastream__create_deltastream_table_as(target_relation, sql, parameters) }}
   {%- endcall %}
 
+  {{ deltastream__wait_until_running(target_relation) }}
+  {{ adapter.record_deployment(model, target_relation, fingerprint) }}
+
   {{ run_hooks(post_hooks) }}
 
   {{ return({'relations': [target_relation]}) }}
@@ -0,0 +1,13 @@
+{% macro monitor_queries(output_path, format='jsonl', interval_seconds=60, iterations=1, describe=true, max_workers=none) %}
+{% if execute %}
+  {#- Queries are in scope when they write to a relation or schema of the project's models and sources -#}
+  {% set relations = [] %}
+  {% for node in graph.nodes.values() | list + graph.sources.values() | list %}
+    {% if node.resource_type in ('model', 'source') and node.config.materialized != 'ephemeral' %}
+      {% do relations.append([node.database, node.schema, node.identifier or node.alias]) %}
+    {% endif %}
+  {% endfor %}
+  {% set written = adapter.monitor_queries(relations, output_path, format, interval_seconds, iterations, describe, max_workers) %}
+  {{ log('Wrote ' ~ written ~ ' query samples to ' ~ output_path, info=True) }}
+{% endif %}
+{% endmacro %}
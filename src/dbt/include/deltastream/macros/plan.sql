@@ -0,0 +1,11 @@
+{% macro deltastream_plan(output_path=none) %}
+{% if execute %}
+  {#- Sources and models are planned together so that redeployed sources propagate to their children -#}
+  {%- set nodes = graph.sources.values() | list -%}
+  {%- for node in graph.nodes.values() if node.resource_type == 'model' -%}
+    {%- do nodes.append(node) -%}
+  {%- endfor -%}
+  {%- set plan = adapter.plan_deployment(nodes, output_path) -%}
+  {{ print(tojson(plan)) }}
+{% endif %}
+{% endmacro %}
@@ -10,3 +10,16 @@
 {% macro deltastream_get_relations() %}
   {{ return(deltastream__get_relations()) }}
 {% endmacro %}
+
+{% macro cascade_drop(database, schema, identifier=none, max_workers=none) %}
+{% if execute %}
+  {#- Drops a relation, or all relations of the schema, with the relations fed by them -#}
+  {% if identifier %}
+    {% set relation = api.Relation.create(database=database, schema=schema, identifier=identifier) %}
+    {% set dropped = adapter.cascade_drop_relations([relation], max_workers) %}
+  {% else %}
+    {% set dropped = adapter.cascade_drop_schema(database, schema, max_workers) %}
+  {% endif %}
+  {{ log('Dropped ' ~ (dropped | length) ~ ' relations: ' ~ (dropped | join(', ')), info=True) }}
+{% endif %}
+{% endmacro %}
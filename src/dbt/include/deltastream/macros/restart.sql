@@ -9,6 +9,10 @@
   {{ return(restart_result) }}
 {% endmacro %}
 
+{% macro restart_queries(state=none, compute_pool=none, relation=none, name_pattern=none, max_workers=none, wait=false, timeout_seconds=300) %}
+  {{ deltastream__bulk_query_action('restart', state, compute_pool, relation, name_pattern, max_workers, wait, timeout_seconds) }}
+{% endmacro %}
+
 {% macro describe_query(query_id) %}
   {% if not query_id %}
     {{ exceptions.raise_compiler_error("query_id is required") }}
@@ -4,19 +4,47 @@
   {{ log('Terminated query: ' ~ query_id, info = True) }}
 {% endmacro %}
 
-{% macro terminate_all_queries(state=None) %}
-  {% set sql = "LIST QUERIES;" %}
-  {% set result = run_query(sql) %}
-  {% set queries = result.rows %}
-  {% if state %}
-    {% set running_queries = queries | selectattr('ActualState', 'equalto', state) | list %}
+{% macro terminate_all_queries(state=None, max_workers=none, wait=false) %}
+  {{ terminate_queries(state=state, max_workers=max_workers, wait=wait) }}
+{% endmacro %}
+
+{% macro terminate_queries(state=none, compute_pool=none, relation=none, name_pattern=none, max_workers=none, wait=false, timeout_seconds=300) %}
+  {{ deltastream__bulk_query_action('terminate', state, compute_pool, relation, name_pattern, max_workers, wait, timeout_seconds) }}
+{% endmacro %}
+
+{% macro deltastream__bulk_query_action(action, state, compute_pool, relation, name_pattern, max_workers, wait, timeout_seconds) %}
+  {#- TERMINATE or RESTART the matching queries with bounded parallelism and log a summary table -#}
+  {% set summary = adapter.run_bulk_query_action(action, state, compute_pool, relation, name_pattern, max_workers, wait, timeout_seconds) %}
+  {% if summary.rows | length == 0 %}
+    {{ log('No queries to ' ~ action ~ '.', info=True) }}
   {% else %}
-    {% set running_queries = queries %}
+    {% set ns = namespace(failed=0) %}
+    {% set header = ' | '.join(summary.column_names) %}
+    {{ log('\n' + header, info=True) }}
+    {{ log('-' * header|length, info=True) }}
+    {% for row in summary.rows %}
+      {% if row['Result'] in ('failed', 'errored', 'timed out') %}{% set ns.failed = ns.failed + 1 %}{% endif %}
+      {% set values = [] %}
+      {% for value in row %}
+        {% do values.append(value if value is not none else '') %}
+      {% endfor %}
+      {{ log(values | join(' | '), info=True) }}
+    {% endfor %}
+    {% set done = {'terminate': 'terminated', 'restart': 'restarted'}[action] %}
+    {% if ns.failed > 0 %}
+      {{ exceptions.raise_compiler_error(ns.failed ~ ' of ' ~ (summary.rows | length) ~ ' queries could not be ' ~ done) }}
+    {% endif %}
+    {{ log((done | capitalize) ~ ' ' ~ (summary.rows | length) ~ ' queries.', info=True) }}
   {% endif %}
-  {% if running_queries|length == 0 %}
-    {{ log('No queries to terminate.' if not state else 'No queries with state ' ~ state ~ ' to terminate.', info=True) }}
+{% endmacro %}
+
+{% macro terminate_relation_queries(relation) %}
+  {#- Terminate the queries writing to a relation, e.g. before dropping it -#}
+  {% set writing_queries = adapter.get_queries_writing(relation) %}
+  {% if writing_queries|length == 0 %}
+    {{ log('No queries writing to ' ~ relation ~ ' to terminate.', info=True) }}
   {% else %}
-    {% for query in running_queries %}
+    {% for query in writing_queries %}
       {{ terminate_query(query['ID']) }}
     {% endfor %}
   {% endif %}
@@ -50,4 +78,4 @@
     {% endfor %}
 
   {% endif %}
-{% endmacro %}
\ No newline at end of file
+{% endmacro %}
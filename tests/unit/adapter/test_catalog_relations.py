@@ -1,5 +1,8 @@
 """Test the deltastream__get_catalog_relations macro and parallel method"""
 
+import json
+from datetime import datetime, timezone
+
 import pytest
 from unittest.mock import Mock
 from dbt.adapters.deltastream.impl import DeltastreamAdapter
@@ -165,3 +168,126 @@ class TestCatalogRelations:
         # All relations should still be processed
         assert isinstance(result, agate.Table)
         assert len(result.rows) == 10
+
+
+class TestIncrementalCatalogRelations:
+    """Test the incremental catalog mode"""
+
+    @pytest.fixture
+    def incremental_adapter(self, mock_adapter, tmp_path):
+        mock_adapter.config.project_target_path = str(tmp_path)
+        mock_adapter.config.threads = 1
+        return mock_adapter
+
+    def _relations(self):
+        return [
+            DeltastreamRelation(
+                Path(database="db", schema="schema", identifier=name),
+                type=DeltastreamRelationType.Table,
+            )
+            for name in ("unchanged", "changed", "new")
+        ]
+
+    def _write_previous_catalog(self, tmp_path):
+        def node(name, last_modified):
+            return {
+                "metadata": {
+                    "type": "STREAM",
+                    "schema": "schema",
+                    "name": name,
+                    "database": "db",
+                    "comment": None,
+                    "owner": "",
+                },
+                "columns": {
+                    "old_col": {
+                        "type": "VARCHAR",
+                        "index": 0,
+                        "name": "old_col",
+                        "comment": None,
+                    }
+                },
+                "stats": {
+                    "last_modified": {
+                        "id": "last_modified",
+                        "label": "Last Modified",
+                        "value": last_modified,
+                        "include": True,
+                        "description": "",
+                    }
+                },
+                "unique_id": f"model.project.{name}",
+            }
+
+        (tmp_path / "catalog.json").write_text(
+            json.dumps(
+                {
+                    "nodes": {
+                        "model.project.unchanged": node(
+                            "unchanged", "2025-01-01T00:00:00+00:00"
+                        ),
+                        "model.project.changed": node(
+                            "changed", "2025-01-01T00:00:00+00:00"
+                        ),
+                    },
+                    "sources": {},
+                }
+            )
+        )
+
+    def test_only_new_and_changed_relations_described(
+        self, incremental_adapter, tmp_path
+    ):
+        self._write_previous_catalog(tmp_path)
+        incremental_adapter.get_relations_last_modified.return_value = (
+            None,
+            agate.Table(
+                [
+                    ["schema", "unchanged", datetime(2025, 1, 1, tzinfo=timezone.utc)],
+                    ["schema", "changed", datetime(2025, 1, 2, tzinfo=timezone.utc)],
+                    ["schema", "new", datetime(2025, 1, 2, tzinfo=timezone.utc)],
+                ],
+                ["schema", "identifier", "last_modified"],
+            ),
+        )
+        described = Mock()
+        described.rows = [["new_col", "BIGINT", True, {}]]
+        incremental_adapter.connections.query.return_value = (None, described)
+
+        result = incremental_adapter.get_catalog_relations_parallel(
+            self._relations(), incremental=True
+        )
+
+        # One system catalog query for the database, no DESCRIBE for the unchanged relation
+        incremental_adapter.get_relations_last_modified.assert_called_once()
+        described_sql = [
+            c[0][0] for c in incremental_adapter.connections.query.call_args_list
+        ]
+        assert len(described_sql) == 2
+        assert not any('"unchanged"' in sql for sql in described_sql)
+
+        rows = {row["table_name"]: row for row in result.rows}
+        assert rows["unchanged"]["column_name"] == "old_col"
+        assert rows["unchanged"]["table_type"] == "STREAM"
+        assert rows["changed"]["column_name"] == "new_col"
+        assert rows["changed"]["stats:last_modified:value"] == (
+            "2025-01-02T00:00:00+00:00"
+        )
+
+    def test_without_previous_catalog_everything_is_described(
+        self, incremental_adapter
+    ):
+        incremental_adapter.get_relations_last_modified.side_effect = Exception(
+            "catalog unavailable"
+        )
+        described = Mock()
+        described.rows = [["col", "VARCHAR", True, {}]]
+        incremental_adapter.connections.query.return_value = (None, described)
+
+        result = incremental_adapter.get_catalog_relations_parallel(
+            self._relations(), incremental=True
+        )
+
+        assert incremental_adapter.connections.query.call_count == 3
+        assert len(result.rows) == 3
+        assert "stats:last_modified:include" in result.column_names
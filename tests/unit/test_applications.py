@@ -0,0 +1,176 @@
+"""Unit tests for deploying models as a single DeltaStream application."""
+
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import pytest
+
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.relation import DeltastreamRelation
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    config = MagicMock()
+    config.credentials.deploy_state_path = None
+    config.project_target_path = str(tmp_path)
+    config.on_run_end = ["{{ deltastream_submit_applications() }}"]
+    adapter_instance = DeltastreamAdapter(config, get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+    adapter_instance.cache = MagicMock()
+    return adapter_instance
+
+
+def _model(unique_id, depends_on=()):
+    return {
+        "unique_id": unique_id,
+        "package_name": "p",
+        "depends_on": {"nodes": list(depends_on)},
+    }
+
+
+def _relation(identifier):
+    return DeltastreamRelation.create(database="db", schema="s", identifier=identifier)
+
+
+def test_statements_buffered_per_application(adapter):
+    adapter.buffer_application_statement(
+        "app", _model("model.p.a"), _relation("a"), "create stream a as select 1;\n"
+    )
+    adapter.buffer_application_statement(
+        "app", _model("model.p.b"), _relation("b"), "create stream b as select 2;"
+    )
+    adapter.buffer_application_statement(
+        "other", _model("model.p.c"), _relation("c"), "create stream c as select 3;"
+    )
+
+    assert adapter.get_buffered_applications() == {
+        "app": ["create stream a as select 1", "create stream b as select 2"],
+        "other": ["create stream c as select 3"],
+    }
+    adapter.connections.query.assert_not_called()
+
+
+def test_resolve_application_of_parents(adapter):
+    adapter.buffer_application_statement(
+        "app", _model("model.p.a"), _relation("a"), "create stream a as select 1;"
+    )
+
+    assert (
+        adapter.resolve_application(_model("model.p.b", ["model.p.a"]), "app") == "app"
+    )
+    assert adapter.resolve_application(_model("model.p.c", ["model.p.x"])) is None
+    with pytest.raises(DbtRuntimeError, match="application 'app'"):
+        adapter.resolve_application(_model("model.p.d", ["model.p.a"]))
+    with pytest.raises(DbtRuntimeError, match="application 'app'"):
+        adapter.resolve_application(_model("model.p.e", ["model.p.a"]), "other")
+
+
+def test_applications_per_dag_layer(adapter):
+    for unique_id in ("model.p.a", "model.p.b"):
+        application_name = adapter.resolve_application(_model(unique_id), True)
+        assert application_name == "p_layer_1"
+        adapter.buffer_application_statement(
+            application_name, _model(unique_id), _relation(unique_id[8:]), "create"
+        )
+
+    child = _model("model.p.c", ["model.p.a", "model.p.x"])
+    assert adapter.resolve_application(child, True) == "p_layer_2"
+    adapter.buffer_application_statement("p_layer_2", child, _relation("c"), "create")
+    grandchild = _model("model.p.d", ["model.p.b", "model.p.c"])
+    assert adapter.resolve_application(grandchild, True) == "p_layer_3"
+    assert list(adapter.get_buffered_applications()) == ["p_layer_1", "p_layer_2"]
+
+
+def test_layer_application_cannot_follow_named_application(adapter):
+    adapter.buffer_application_statement(
+        "app", _model("model.p.a"), _relation("a"), "create stream a as select 1;"
+    )
+
+    with pytest.raises(DbtRuntimeError, match="application 'app'"):
+        adapter.resolve_application(_model("model.p.b", ["model.p.a"]), True)
+
+
+def test_buffering_requires_submit_hook(adapter):
+    adapter.config.on_run_end = []
+
+    with pytest.raises(DbtRuntimeError, match="deltastream_submit_applications"):
+        adapter.buffer_application_statement(
+            "app", _model("model.p.a"), _relation("a"), "create stream a as select 1;"
+        )
+    assert adapter.get_buffered_applications() == {}
+
+
+def test_complete_application_records_deployments(adapter):
+    model = _model("model.p.a")
+    adapter.buffer_application_statement(
+        "app", model, _relation("a"), "create stream a as select 1;", "fp"
+    )
+
+    assert adapter.complete_application("app") == 1
+
+    assert adapter.get_buffered_applications() == {}
+    assert adapter.resolve_application(_model("model.p.b", ["model.p.a"])) is None
+    assert adapter.is_deployment_unchanged(
+        model, _relation("a"), "fp", expect_running_query=False
+    )
+
+
+def test_replaced_relation_dropped_by_application(adapter):
+    adapter.buffer_application_statement(
+        "app",
+        _model("model.p.a"),
+        _relation("a"),
+        "create stream a as select 1;",
+        replaces=_relation("a"),
+    )
+
+    assert adapter.get_buffered_applications() == {
+        "app": ['DROP RELATION "db"."s"."a"', "create stream a as select 1"]
+    }
+    adapter.connections.query.assert_not_called()
+
+
+def test_submit_drops_replaced_relation_inside_application(adapter):
+    adapter.connections.execute.return_value = (MagicMock(), MagicMock())
+    adapter.buffer_application_statement(
+        "app",
+        _model("model.p.a"),
+        _relation("a"),
+        'create stream "db"."s"."a" as select 1;',
+        "fp",
+        replaces=_relation("a"),
+    )
+    adapter.buffer_application_statement(
+        "app",
+        _model("model.p.b", ["model.p.a"]),
+        _relation("b"),
+        'create stream "db"."s"."b" as select * from "db"."s"."a";',
+    )
+
+    assert adapter.submit_applications() == {"app": 2}
+
+    adapter.connections.execute.assert_called_once()
+    assert adapter.connections.execute.call_args.kwargs["sql"] == (
+        "BEGIN APPLICATION app\n"
+        '  DROP RELATION "db"."s"."a";\n'
+        '  create stream "db"."s"."a" as select 1;\n'
+        '  create stream "db"."s"."b" as select * from "db"."s"."a";\n'
+        "END APPLICATION;"
+    )
+    assert adapter.get_buffered_applications() == {}
+
+
+def test_cleanup_warns_about_unsubmitted_applications(adapter, monkeypatch):
+    warnings = []
+    monkeypatch.setattr("dbt.adapters.deltastream.impl.logger.warning", warnings.append)
+    adapter.buffer_application_statement(
+        "app", _model("model.p.a"), _relation("a"), "create stream a as select 1;"
+    )
+
+    adapter.cleanup_connections()
+
+    assert len(warnings) == 1
+    assert "app (1 models)" in warnings[0]
@@ -0,0 +1,57 @@
+"""Unit tests for blue/green producer lookups."""
+
+import agate
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.blue_green import (
+    active_color,
+    has_running_producer,
+    plan_blue_green,
+)
+from dbt.adapters.deltastream.queries import QueryIndex
+from dbt.adapters.deltastream.relation import DeltastreamRelation
+
+
+def _index(*rows):
+    return QueryIndex.from_table(
+        agate.Table(
+            [
+                [query_id, state, f'CREATE STREAM "db"."s"."{sink}" AS SELECT 1;']
+                for query_id, state, sink in rows
+            ],
+            ["ID", "ActualState", "Query"],
+        )
+    )
+
+
+def _relation(identifier):
+    return DeltastreamRelation.create(database="db", schema="s", identifier=identifier)
+
+
+@pytest.mark.parametrize("sink", ["a", "a__blue", "a__green"])
+def test_running_producer(sink):
+    assert has_running_producer(_index(("q1", "running", sink)), _relation("a"))
+    assert not has_running_producer(_index(("q1", "errored", sink)), _relation("a"))
+    assert not has_running_producer(_index(("q1", "running", sink)), _relation("b"))
+
+
+def test_active_color():
+    assert active_color(_index(), _relation("a")) is None
+    assert (
+        active_color(_index(("q1", "running", "a__green")), _relation("a")) == "green"
+    )
+    with pytest.raises(DbtRuntimeError, match="Both blue and green"):
+        active_color(
+            _index(("q1", "running", "a__blue"), ("q2", "running", "a__green")),
+            _relation("a"),
+        )
+
+
+def test_plan_alternates_colors():
+    index = _index(("q1", "running", "a__green"))
+    assert plan_blue_green(index, _relation("a"), _relation("a")) == {
+        "active": "green",
+        "next": "blue",
+        "migrating": False,
+    }
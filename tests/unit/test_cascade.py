@@ -0,0 +1,124 @@
+"""Unit tests for the cascade drop of relations."""
+
+import threading
+from contextlib import contextmanager
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+
+from dbt.adapters.deltastream.cascade import plan_cascade_drop
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.queries import QueryIndex
+from dbt.adapters.deltastream.relation import DeltastreamRelation
+
+COLUMNS = ["ID", "ActualState", "Query"]
+ROWS = [
+    [
+        "q1",
+        "running",
+        'INSERT INTO "db"."s"."Orders" SELECT * FROM "db"."raw"."orders";',
+    ],
+    [
+        "q2",
+        "running",
+        'CREATE STREAM "db"."s"."Enriched" AS SELECT * FROM "db"."s"."Orders";',
+    ],
+    [
+        "q3",
+        "running",
+        "CREATE CHANGELOG counts AS SELECT id, COUNT(*) FROM enriched GROUP BY id;",
+    ],
+    [
+        "q4",
+        "running",
+        'CREATE STREAM "db"."s"."audit" AS SELECT * FROM "db"."s"."Orders";',
+    ],
+    [
+        "q5",
+        "running",
+        'CREATE STREAM "db"."s"."other" AS SELECT * FROM "db"."s"."unrelated";',
+    ],
+]
+
+
+def _index():
+    return QueryIndex.from_table(agate.Table(ROWS, COLUMNS))
+
+
+def test_plan_cascade_drop():
+    plan = plan_cascade_drop([("db", "s", "Orders")], _index(), ("db", "s"))
+
+    assert sorted(plan.query_ids) == ["q1", "q2", "q3", "q4"]
+    assert plan.layers == [
+        [("db", "s", "audit"), ("db", "s", "counts")],
+        [("db", "s", "Enriched")],
+        [("db", "s", "Orders")],
+    ]
+
+
+def test_plan_without_dependents():
+    plan = plan_cascade_drop([("db", "s", "lonely")], _index(), ("db", "s"))
+    assert plan.query_ids == []
+    assert plan.layers == [[("db", "s", "lonely")]]
+
+
+def test_partial_sink_names_use_session_namespace():
+    plan = plan_cascade_drop([("db", "s", "Enriched")], _index(), ("db", "other"))
+
+    assert plan.layers == [[("db", "other", "counts")], [("db", "s", "Enriched")]]
+    assert plan.unresolved == []
+
+
+def test_partial_sink_names_without_session_namespace():
+    plan = plan_cascade_drop([("db", "s", "Enriched")], _index())
+
+    assert plan.query_ids == ["q2", "q3"]
+    assert plan.layers == [[("db", "s", "Enriched")]]
+    assert plan.unresolved == [("q3", "counts")]
+
+
+@pytest.fixture
+def adapter():
+    config = MagicMock()
+    config.threads = 4
+    config.credentials.database = "db"
+    config.credentials.schema = "s"
+    adapter_instance = DeltastreamAdapter(config, get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+    adapter_instance.connections.get_if_exists.return_value.name = "cascade_drop"
+
+    @contextmanager
+    def connection_named(name):
+        yield
+
+    adapter_instance.connection_named = connection_named
+    return adapter_instance
+
+
+def test_cascade_drop_relations(adapter):
+    statements = []
+    lock = threading.Lock()
+
+    def query(sql):
+        with lock:
+            statements.append(sql)
+        if sql == "LIST QUERIES;":
+            return None, agate.Table(ROWS, COLUMNS)
+        return None, agate.Table([], [])
+
+    adapter.connections.query.side_effect = query
+    relation = DeltastreamRelation.create(
+        database="db", schema="s", identifier="Orders"
+    )
+
+    dropped = adapter.cascade_drop_relations([relation])
+
+    assert dropped == ["db.s.audit", "db.s.counts", "db.s.Enriched", "db.s.Orders"]
+    drops = [sql for sql in statements if sql.startswith("DROP")]
+    terminates = [sql for sql in statements if sql.startswith("TERMINATE")]
+    assert len(terminates) == 4
+    # Every query is terminated before the first drop
+    assert statements.index(drops[0]) > max(statements.index(sql) for sql in terminates)
+    assert drops[-1] == 'DROP RELATION "db"."s"."Orders";'
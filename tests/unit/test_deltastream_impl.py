@@ -232,3 +232,95 @@ def test_standardize_grants_dict(adapter):
 def test_quote_and_date_function():
     assert DeltastreamAdapter.quote("some_id") == '"some_id"'
     assert DeltastreamAdapter.date_function() == "current_date()"
+
+
+def test_get_columns_in_relation_memoized(adapter, dummy_relation):
+    fake_agate = MagicMock()
+    fake_agate.rows = [["col1", "VARCHAR", True]]
+    adapter.connections.query.return_value = (None, fake_agate)
+    adapter.get_columns_in_relation(dummy_relation)
+    columns = adapter.get_columns_in_relation(
+        DeltastreamRelation.create(
+            database="DUMMY_DB", schema="dummy_schema", identifier="dummy_table"
+        )
+    )
+    adapter.connections.query.assert_called_once()
+    assert columns[0].column == "col1"
+
+
+def test_get_columns_in_relation_failure_not_memoized(adapter, dummy_relation):
+    adapter.connections.query.side_effect = Exception("fail")
+    assert adapter.get_columns_in_relation(dummy_relation) == []
+    adapter.connections.query.side_effect = None
+    fake_agate = MagicMock()
+    fake_agate.rows = [["col1", "VARCHAR", True]]
+    adapter.connections.query.return_value = (None, fake_agate)
+    assert len(adapter.get_columns_in_relation(dummy_relation)) == 1
+
+
+@pytest.mark.parametrize(
+    "invalidate",
+    [
+        lambda adapter, relation: adapter.drop_relation(relation),
+        lambda adapter, relation: adapter.truncate_relation(relation),
+        lambda adapter, relation: adapter.cache_added(relation),
+        lambda adapter, relation: adapter._on_ddl(
+            "CREATE", "STREAM", f"{relation} AS SELECT * FROM src"
+        ),
+    ],
+)
+def test_get_columns_in_relation_invalidated(adapter, dummy_relation, invalidate):
+    adapter._schema_is_cached = lambda db, sch: False
+    fake_agate = MagicMock()
+    fake_agate.rows = [["col1", "VARCHAR", True]]
+    adapter.connections.query.return_value = (None, fake_agate)
+    adapter.get_columns_in_relation(dummy_relation)
+
+    invalidate(adapter, dummy_relation)
+    adapter.connections.query.reset_mock()
+    adapter.get_columns_in_relation(dummy_relation)
+
+    adapter.connections.query.assert_called_once()
+
+
+def test_get_relation_miss_remembered(adapter):
+    adapter._schema_is_cached = lambda db, sch: False
+    error = SQLError("relation not found", SqlState.SQL_STATE_INVALID_RELATION, "dummy")
+    adapter.connections.query.side_effect = error
+    assert adapter.get_relation("dummy_db", "dummy_schema", "dummy_table") is None
+    assert adapter.get_relation("DUMMY_DB", "dummy_schema", "dummy_table") is None
+    adapter.connections.query.assert_called_once()
+
+
+def test_get_relation_other_error_not_remembered(adapter):
+    adapter._schema_is_cached = lambda db, sch: False
+    adapter.connections.query.side_effect = SQLError("fail", "XX000", "dummy")
+    with pytest.raises(SQLError):
+        adapter.get_relation("dummy_db", "dummy_schema", "dummy_table")
+    adapter.connections.query.side_effect = None
+    adapter.connections.query.return_value = (None, MagicMock())
+    assert adapter.get_relation("dummy_db", "dummy_schema", "dummy_table") is not None
+
+
+@pytest.mark.parametrize(
+    "create",
+    [
+        lambda adapter, relation: adapter.cache_added(relation),
+        lambda adapter, relation: adapter._on_ddl(
+            "CREATE", "CHANGELOG", f"{relation} AS SELECT * FROM src"
+        ),
+        lambda adapter, relation: adapter._on_ddl("BEGIN", "APPLICATION", "my_app;"),
+    ],
+)
+def test_get_relation_miss_cleared_on_create(adapter, dummy_relation, create):
+    adapter._schema_is_cached = lambda db, sch: False
+    error = SQLError("relation not found", SqlState.SQL_STATE_INVALID_RELATION, "dummy")
+    adapter.connections.query.side_effect = error
+    assert adapter.get_relation("dummy_db", "dummy_schema", "dummy_table") is None
+
+    create(adapter, dummy_relation)
+    adapter.connections.query.side_effect = None
+    adapter.connections.query.return_value = (None, MagicMock())
+
+    assert adapter.get_relation("dummy_db", "dummy_schema", "dummy_table") is not None
+    assert adapter.connections.query.call_count == 2
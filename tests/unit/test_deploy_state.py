@@ -0,0 +1,228 @@
+"""Unit tests for deployment fingerprints and the deploy state store."""
+
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.deploy_state import DeployStateStore, compute_fingerprint
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.relation import DeltastreamRelation
+
+
+def _fingerprint(**overrides):
+    arguments = {
+        "materialization": "stream",
+        "sql": "SELECT * FROM pageviews",
+        "parameters": {"topic": "pv"},
+        "columns": {},
+        "upstream_fingerprints": {},
+    }
+    arguments.update(overrides)
+    return compute_fingerprint(**arguments)
+
+
+class TestComputeFingerprint:
+    def test_stable_for_equivalent_definitions(self):
+        assert _fingerprint() == _fingerprint(sql="  SELECT *\n  FROM pageviews ")
+        assert _fingerprint(parameters={"a": 1, "b": 2}) == _fingerprint(
+            parameters={"b": 2, "a": 1}
+        )
+        # Documentation does not change the deployed relation
+        assert _fingerprint(
+            columns={"id": {"type": "BIGINT", "description": "one"}}
+        ) == _fingerprint(columns={"id": {"type": "BIGINT", "description": "two"}})
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"materialization": "changelog"},
+            {"sql": "SELECT id FROM pageviews"},
+            {"parameters": {"topic": "other"}},
+            {"columns": {"id": {"type": "BIGINT"}}},
+            {"upstream_fingerprints": {"model.p.upstream": "abc"}},
+            {"extra": {"primary_key": "id"}},
+        ],
+    )
+    def test_changes_with_definition(self, overrides):
+        assert _fingerprint(**overrides) != _fingerprint()
+
+
+class TestDeployStateStore:
+    def test_persisted_on_flush(self, tmp_path):
+        path = str(tmp_path / "state" / DeployStateStore.FILE_NAME)
+        store = DeployStateStore(path)
+        store.put("model.p.a", "db.s.a", "fp1", checksum="c1")
+        store.flush()
+
+        reloaded = DeployStateStore(path)
+        assert reloaded.fingerprint("model.p.a") == "fp1"
+        assert reloaded.get("model.p.a")["checksum"] == "c1"
+
+    def test_remove_relations(self, tmp_path):
+        store = DeployStateStore(str(tmp_path / DeployStateStore.FILE_NAME))
+        store.put("model.p.a", "db.s.a", "fp1")
+        store.put("model.p.b", "db.s.b", "fp2")
+        store.remove_relations(["DB.S.A"])
+        assert store.get("model.p.a") is None
+        assert store.fingerprint("model.p.b") == "fp2"
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    config = MagicMock()
+    config.credentials.deploy_state_path = None
+    config.project_target_path = str(tmp_path)
+    adapter_instance = DeltastreamAdapter(config, get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+    adapter_instance.connections.query.return_value = (None, _queries())
+    return adapter_instance
+
+
+def _queries(*rows):
+    return agate.Table(list(rows), ["ID", "ActualState", "Query"])
+
+
+def _model(unique_id, depends_on=()):
+    return {
+        "unique_id": unique_id,
+        "columns": {},
+        "depends_on": {"nodes": list(depends_on)},
+        "checksum": {"name": "sha256", "checksum": "abc"},
+    }
+
+
+def _relation(identifier):
+    return DeltastreamRelation.create(database="db", schema="s", identifier=identifier)
+
+
+class TestAdapterDeployState:
+    def test_unchanged_after_recorded_deployment(self, adapter):
+        model = _model("model.p.a")
+        fingerprint = adapter.get_deploy_fingerprint(model, "SELECT 1", {}, "stream")
+        assert not adapter.is_deployment_unchanged(model, _relation("a"), fingerprint)
+
+        adapter.record_deployment(model, _relation("a"), fingerprint)
+
+        assert adapter.is_deployment_unchanged(
+            model, _relation("a"), fingerprint, expect_running_query=False
+        )
+        # Deployed to another relation, e.g. after an alias change
+        assert not adapter.is_deployment_unchanged(model, _relation("b"), fingerprint)
+        assert not adapter.is_deployment_unchanged(
+            model,
+            _relation("a"),
+            adapter.get_deploy_fingerprint(model, "SELECT 2", {}, "stream"),
+        )
+
+    def test_unchanged_requires_running_query(self, adapter):
+        model = _model("model.p.a")
+        adapter.record_deployment(model, _relation("a"), "fp")
+        adapter.connections.query.return_value = (
+            None,
+            _queries(["q1", "failed", 'CREATE STREAM "db"."s"."a" AS SELECT 1;']),
+        )
+        assert not adapter.is_deployment_unchanged(model, _relation("a"), "fp")
+
+        adapter.connections.query.return_value = (
+            None,
+            _queries(
+                ["q2", "running", 'CREATE STREAM "db"."s"."a__blue" AS SELECT 1;']
+            ),
+        )
+        adapter._get_query_index(refresh=True)
+        assert adapter.is_deployment_unchanged(model, _relation("a"), "fp")
+
+    def test_upstream_redeploy_changes_downstream_fingerprint(self, adapter):
+        upstream = _model("model.p.up")
+        downstream = _model("model.p.down", depends_on=["model.p.up"])
+        adapter.record_deployment(upstream, _relation("up"), "fp1")
+        before = adapter.get_deploy_fingerprint(downstream, "SELECT 1", {}, "stream")
+
+        adapter.record_deployment(upstream, _relation("up"), "fp2")
+
+        assert (
+            adapter.get_deploy_fingerprint(downstream, "SELECT 1", {}, "stream")
+            != before
+        )
+
+    def test_blue_green_color_from_running_queries(self, adapter):
+        assert adapter.get_blue_green_color(_relation("a")) is None
+
+        # Recorded locally, but only the blue producer is running on the server
+        adapter.record_deployment(_model("model.p.a"), _relation("a"), "fp", "green")
+        adapter.connections.query.return_value = (
+            None,
+            _queries(
+                ["q1", "running", 'CREATE STREAM "db"."s"."a__blue" AS SELECT 1;'],
+                ["q2", "failed", 'CREATE STREAM "db"."s"."a__green" AS SELECT 1;'],
+            ),
+        )
+        assert adapter.get_blue_green_color(_relation("a")) == "blue"
+
+    def test_blue_green_both_running(self, adapter):
+        adapter.connections.query.return_value = (
+            None,
+            _queries(
+                ["q1", "running", 'CREATE STREAM "db"."s"."a__blue" AS SELECT 1;'],
+                ["q2", "running", 'CREATE STREAM "db"."s"."a__green" AS SELECT 1;'],
+            ),
+        )
+        with pytest.raises(DbtRuntimeError, match="Both blue and green"):
+            adapter.get_blue_green_color(_relation("a"))
+
+    def test_blue_green_first_deploy_migration(self, adapter, caplog):
+        # The relation is still written to by the query of its CREATE STREAM AS SELECT
+        adapter.connections.query.return_value = (
+            None,
+            _queries(["q1", "running", 'CREATE STREAM "db"."s"."a" AS SELECT 1;']),
+        )
+        with pytest.raises(DbtRuntimeError, match="blue_green_migrate"):
+            adapter.get_blue_green_plan(_relation("a"), _relation("a"))
+
+        plan = adapter.get_blue_green_plan(_relation("a"), _relation("a"), migrate=True)
+        assert plan == {"active": None, "next": "blue", "migrating": True}
+        assert "Migrating" in caplog.text
+        assert "twice" in caplog.text
+
+    def test_blue_green_plan_without_migration(self, adapter, caplog):
+        assert adapter.get_blue_green_plan(_relation("a"), None) == {
+            "active": None,
+            "next": "blue",
+            "migrating": False,
+        }
+        assert "twice" not in caplog.text
+
+        # <name> is the definition over the topic, the blue producer is running
+        adapter.connections.query.return_value = (
+            None,
+            _queries(
+                ["q1", "running", 'CREATE STREAM "db"."s"."a__blue" AS SELECT 1;']
+            ),
+        )
+        plan = adapter.get_blue_green_plan(_relation("a"), _relation("a"))
+        assert plan == {"active": "blue", "next": "green", "migrating": False}
+        assert "twice" in caplog.text
+
+    def test_drop_forgets_deployment(self, adapter, tmp_path):
+        model = _model("model.p.a")
+        adapter.record_deployment(model, _relation("a"), "fp")
+
+        adapter._on_ddl("DROP", "RELATION", '"db"."s"."a";')
+
+        assert not adapter.is_deployment_unchanged(model, _relation("a"), "fp")
+        adapter.cleanup_connections()
+        assert (
+            DeployStateStore(str(tmp_path / DeployStateStore.FILE_NAME)).get(
+                "model.p.a"
+            )
+            is None
+        )
+
+    def test_disabled_without_target_path(self):
+        adapter_instance = DeltastreamAdapter(MagicMock(), get_context("spawn"))
+        model = _model("model.p.a")
+        adapter_instance.record_deployment(model, _relation("a"), "fp")
+        assert not adapter_instance.is_deployment_unchanged(model, _relation("a"), "fp")
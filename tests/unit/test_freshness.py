@@ -0,0 +1,287 @@
+"""Unit tests for source freshness support in DeltastreamAdapter."""
+
+import asyncio
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from unittest.mock import MagicMock, Mock
+
+import agate
+import pytest
+from dbt.adapters.capability import Capability, Support
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.connections import DeltastreamConnectionManager
+from dbt.adapters.deltastream.freshness import to_utc_datetime
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.relation import DeltastreamRelation
+
+
+class DummyConfig:
+    def __init__(self):
+        self.credentials = MagicMock(database="dummy_db", schema="dummy_schema")
+        self.log_cache_events = False
+
+
+@pytest.fixture
+def adapter():
+    adapter_instance = DeltastreamAdapter(DummyConfig(), get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+    adapter_instance.cache = MagicMock()
+    return adapter_instance
+
+
+def _relation(schema, identifier):
+    return DeltastreamRelation.create(
+        database="dummy_db", schema=schema, identifier=identifier
+    )
+
+
+class TestToUtcDatetime:
+    def test_naive_datetime_is_utc(self):
+        value = datetime(2025, 1, 1, 12, 0, 0)
+        assert to_utc_datetime(value) == datetime(
+            2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc
+        )
+
+    def test_iso_string(self):
+        assert to_utc_datetime("2025-01-01T12:00:00Z") == datetime(
+            2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc
+        )
+
+    def test_epoch_seconds_and_milliseconds(self):
+        expected = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        assert to_utc_datetime(1735689600) == expected
+        assert to_utc_datetime(1735689600000) == expected
+        assert to_utc_datetime("1735689600000") == expected
+
+    def test_empty_and_invalid_values(self):
+        assert to_utc_datetime(None) is None
+        assert to_utc_datetime("") is None
+        assert to_utc_datetime("not a date") is None
+
+
+def test_metadata_freshness_is_unsupported():
+    capabilities = DeltastreamAdapter.capabilities()
+    assert (
+        capabilities[Capability.TableLastModifiedMetadata].support
+        == Support.Unsupported
+    )
+    assert (
+        capabilities[Capability.TableLastModifiedMetadataBatch].support
+        == Support.Unsupported
+    )
+
+
+class TestGetRelationsLastModified:
+    def test_single_batched_query_filters_requested_pairs(self, adapter):
+        catalog = Mock()
+        catalog.rows = [
+            ["s1", "orders", "2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z"],
+            ["s1", "users", "2025-01-01T00:00:00Z", None],
+            # Matches the cross product of the filter but was not requested
+            ["s2", "orders", "2025-01-01T00:00:00Z", None],
+        ]
+        adapter.connections.query.return_value = (None, catalog)
+
+        _, table = adapter.get_relations_last_modified(
+            "dummy_db",
+            [_relation("s1", "orders"), _relation("s1", "users"), _relation("s2", "x")],
+        )
+
+        adapter.connections.query.assert_called_once()
+        sql = adapter.connections.query.call_args[0][0]
+        assert 'deltastream.sys."relations"' in sql
+        assert "database_name = 'dummy_db'" in sql
+        assert list(table.column_names) == [
+            "schema",
+            "identifier",
+            "last_modified",
+            "snapshotted_at",
+        ]
+        assert [(row[0], row[1]) for row in table.rows] == [
+            ("s1", "orders"),
+            ("s1", "users"),
+        ]
+        # updated_at is preferred, created_at is the fallback
+        assert table.rows[0][2] == datetime(2025, 1, 2, tzinfo=timezone.utc)
+        assert table.rows[1][2] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def test_no_relations(self, adapter):
+        _, table = adapter.get_relations_last_modified("dummy_db", [])
+        assert len(table.rows) == 0
+        adapter.connections.query.assert_not_called()
+
+
+class TestCollectFreshnessBounded:
+    def test_returns_greatest_loaded_at(self, adapter):
+        rows = Mock()
+        rows.rows = [
+            ["2025-01-01T00:00:00Z"],
+            [None],
+            ["2025-01-03T00:00:00Z"],
+            ["2025-01-02T00:00:00Z"],
+        ]
+        adapter.connections.query_bounded.return_value = (None, rows)
+
+        _, table = adapter.collect_freshness_bounded(
+            _relation("s1", "pageviews"),
+            "event_time",
+            "region = 'us'",
+            timeout_seconds=5,
+            max_rows=10,
+        )
+
+        sql, timeout, max_rows = adapter.connections.query_bounded.call_args[0]
+        assert sql.startswith("SELECT event_time AS loaded_at FROM")
+        assert "'starting.position' = 'timestamp'" in sql
+        assert sql.endswith("WHERE region = 'us';")
+        # The 5 second budget is shared by the five reads of a 24 hour lookback
+        assert 0 < timeout <= 1
+        assert max_rows == 10
+        assert list(table.column_names) == ["max_loaded_at", "snapshotted_at"]
+        assert len(table.rows) == 1
+        assert table.rows[0][0] == datetime(2025, 1, 3, tzinfo=timezone.utc)
+        assert table.rows[0][1] is not None
+
+    def test_reads_from_the_tail_first(self, adapter):
+        rows = Mock()
+        rows.rows = [["2025-01-03T00:00:00Z"]]
+        adapter.connections.query_bounded.return_value = (None, rows)
+
+        before_ms = datetime.now(timezone.utc).timestamp() * 1000
+        adapter.collect_freshness_bounded(
+            _relation("s1", "pageviews"), "event_time", lookback_hours=24
+        )
+
+        assert adapter.connections.query_bounded.call_count == 1
+        sql = adapter.connections.query_bounded.call_args[0][0]
+        starting_ms = int(re.search(r"'starting.timestamp.ms' = (\d+)", sql).group(1))
+        assert before_ms - starting_ms <= 5 * 60 * 1000 + 1000
+
+    def test_widens_window_until_records_found(self, adapter):
+        empty, found = Mock(), Mock()
+        empty.rows = []
+        found.rows = [["2025-01-03T00:00:00Z"]]
+        adapter.connections.query_bounded.side_effect = [
+            (None, empty),
+            (None, empty),
+            (None, found),
+        ]
+
+        _, table = adapter.collect_freshness_bounded(
+            _relation("s1", "pageviews"), "event_time", lookback_hours=24
+        )
+
+        starts = [
+            int(re.search(r"'starting.timestamp.ms' = (\d+)", call[0][0]).group(1))
+            for call in adapter.connections.query_bounded.call_args_list
+        ]
+        assert starts[0] > starts[1] > starts[2]
+        assert table.rows[0][0] == datetime(2025, 1, 3, tzinfo=timezone.utc)
+
+    def test_no_records_in_lookback_is_an_error(self, adapter):
+        rows = Mock()
+        rows.rows = []
+        adapter.connections.query_bounded.return_value = (None, rows)
+
+        with pytest.raises(DbtRuntimeError, match="No data in window"):
+            adapter.collect_freshness_bounded(
+                _relation("s1", "pageviews"),
+                "event_time",
+                timeout_seconds=6,
+                lookback_hours=1,
+            )
+
+        # 5 minutes, 30 minutes, then the whole hour, each read given its share of the budget
+        timeouts = [
+            call[0][1] for call in adapter.connections.query_bounded.call_args_list
+        ]
+        assert len(timeouts) == 3
+        assert timeouts[0] == pytest.approx(2, abs=0.1)
+
+    def test_total_time_is_capped(self, adapter):
+        rows = Mock()
+        rows.rows = []
+
+        def slow_read(sql, timeout_seconds, max_rows):
+            time.sleep(timeout_seconds)
+            return None, rows
+
+        adapter.connections.query_bounded.side_effect = slow_read
+
+        started = time.monotonic()
+        with pytest.raises(DbtRuntimeError):
+            adapter.collect_freshness_bounded(
+                _relation("s1", "pageviews"), "event_time", timeout_seconds=0.2
+            )
+        assert time.monotonic() - started < 0.5
+
+
+class TestQueryBounded:
+    def test_stops_reading_after_timeout(self):
+        class DummyColumn:
+            def __init__(self, name):
+                self.name = name
+
+        class EndlessRows:
+            def columns(self):
+                return [DummyColumn("loaded_at")]
+
+            closed = False
+
+            async def __aiter__(self):
+                yield ["2025-01-01T00:00:00Z"]
+                while True:
+                    await asyncio.sleep(1)
+
+            async def close(self):
+                self.closed = True
+
+        rows = EndlessRows()
+
+        async def mock_query(sql):
+            return rows
+
+        manager = DeltastreamConnectionManager(profile="test", mp_context=threading)
+        connection = Mock()
+        connection.handle.query = mock_query
+        manager.get_thread_connection = lambda: connection
+
+        _, table = manager.query_bounded("SELECT 1;", timeout_seconds=0.1)
+
+        assert isinstance(table, agate.Table)
+        assert list(table.column_names) == ["loaded_at"]
+        assert len(table.rows) == 1
+        # The continuous query stops streaming once its reader gives up
+        assert rows.closed
+
+    def test_stops_reading_at_row_limit(self):
+        class DummyColumn:
+            def __init__(self, name):
+                self.name = name
+
+        class ManyRows:
+            def columns(self):
+                return [DummyColumn("col1")]
+
+            async def __aiter__(self):
+                for i in range(100):
+                    yield [i]
+
+            async def close(self):
+                pass
+
+        async def mock_query(sql):
+            return ManyRows()
+
+        manager = DeltastreamConnectionManager(profile="test", mp_context=threading)
+        connection = Mock()
+        connection.handle.query = mock_query
+        manager.get_thread_connection = lambda: connection
+
+        _, table = manager.query_bounded("SELECT 1;", timeout_seconds=5, max_rows=3)
+
+        assert len(table.rows) == 3
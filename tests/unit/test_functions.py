@@ -0,0 +1,123 @@
+"""Unit tests for function signature parsing and the function index."""
+
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+
+from dbt.adapters.deltastream.functions import (
+    FunctionIndex,
+    make_signature,
+    normalize_type,
+    parse_signature,
+    signature_from_parameters,
+    split_top_level,
+)
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+
+
+class TestSignatureParsing:
+    @pytest.mark.parametrize(
+        "data_type,expected",
+        [
+            ("int", "INTEGER"),
+            ("  varchar ", "VARCHAR"),
+            ("array< double >", "ARRAY<DOUBLE>"),
+            ("DECIMAL( 10 ,2 )", "DECIMAL(10, 2)"),
+            ("map<string,int>", "MAP<VARCHAR, INTEGER>"),
+        ],
+    )
+    def test_normalize_type(self, data_type, expected):
+        assert normalize_type(data_type) == expected
+
+    def test_split_top_level_ignores_nested_separators(self):
+        assert split_top_level("a INT, b MAP<VARCHAR, INT>, c DECIMAL(10, 2)") == [
+            "a INT",
+            "b MAP<VARCHAR, INT>",
+            "c DECIMAL(10, 2)",
+        ]
+        assert split_top_level("") == []
+
+    def test_parse_signature_with_return_type(self):
+        assert parse_signature(
+            "weighted_avg(vals ARRAY<DOUBLE>, weights ARRAY<DOUBLE>) RETURNS DOUBLE"
+        ) == make_signature("weighted_avg", ["ARRAY<DOUBLE>", "ARRAY<DOUBLE>"])
+
+    def test_parse_signature_ignores_argument_names_and_aliases(self):
+        assert parse_signature("f(a INT)") == parse_signature("F(b integer)")
+
+    def test_parse_signature_does_not_match_prefixes(self):
+        assert parse_signature("f(a VARCHAR)") != parse_signature(
+            "f(a VARCHAR, b INTEGER)"
+        )
+        assert parse_signature("f(a VARCHAR)") != parse_signature("f2(a VARCHAR)")
+
+    def test_parse_signature_from_create_statement(self):
+        assert parse_signature(
+            "my_func\n    (\n      a INT, b VARCHAR\n    )\n  returns VARCHAR"
+        ) == make_signature("my_func", ["INTEGER", "VARCHAR"])
+
+    def test_parse_invalid_signature(self):
+        assert parse_signature("not a signature") is None
+        assert parse_signature("f(a INT") is None
+
+    def test_signature_from_parameters(self):
+        assert signature_from_parameters(
+            "f", {"args": [{"name": "a", "type": "int"}, {"name": "b"}]}
+        ) == make_signature("f", ["INTEGER", "VARCHAR"])
+        assert signature_from_parameters("f", {}) == make_signature("f", [])
+
+
+class TestFunctionIndex:
+    def test_from_agate_table(self):
+        table = agate.Table(
+            [["f(a INTEGER) RETURNS VARCHAR"], ["g() RETURNS INTEGER"]],
+            ["Signature"],
+        )
+        index = FunctionIndex.from_table(table)
+        assert len(index) == 2
+        assert make_signature("f", ["INT"]) in index
+        assert make_signature("g", []) in index
+        assert make_signature("f", []) not in index
+
+    def test_add_and_discard(self):
+        index = FunctionIndex()
+        signature = make_signature("f", ["INTEGER"])
+        index.add(signature)
+        assert signature in index
+        index.discard(signature)
+        assert signature not in index
+
+
+@pytest.fixture
+def adapter():
+    adapter_instance = DeltastreamAdapter(MagicMock(), get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+    adapter_instance.connections.query.return_value = (
+        None,
+        agate.Table([["f(a INTEGER) RETURNS VARCHAR"]], ["Signature"]),
+    )
+    return adapter_instance
+
+
+class TestAdapterFunctionIndex:
+    def test_functions_listed_once(self, adapter):
+        for _ in range(3):
+            assert (
+                adapter.get_function("f", {"args": [{"name": "x", "type": "INT"}]})
+                is not None
+            )
+            assert adapter.get_function("f", {"args": []}) is None
+        adapter.connections.query.assert_called_once_with("LIST FUNCTIONS;")
+
+    def test_index_follows_create_and_drop(self, adapter):
+        parameters = {"args": [{"name": "x", "type": "VARCHAR"}]}
+        assert adapter.get_function("f", parameters) is None
+
+        adapter._on_ddl("CREATE", "FUNCTION", "f (x VARCHAR) returns VARCHAR")
+        assert adapter.get_function("f", parameters) is not None
+
+        adapter._on_ddl("DROP", "FUNCTION", "f (x VARCHAR);")
+        assert adapter.get_function("f", parameters) is None
+        adapter.connections.query.assert_called_once()
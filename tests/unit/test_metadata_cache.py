@@ -0,0 +1,194 @@
+"""Unit tests for the on-disk metadata cache."""
+
+import json
+import os
+import threading
+from multiprocessing import get_context
+from unittest.mock import MagicMock, Mock
+
+import agate
+import pytest
+
+from dbt.adapters.deltastream.connections import (
+    DeltastreamConnectionManager,
+    is_query,
+    parse_ddl_statement,
+    parse_qualified_name,
+)
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.metadata_cache import DeltastreamMetadataCache
+from dbt.adapters.deltastream.relation import DeltastreamRelation
+
+
+class TestDeltastreamMetadataCache:
+    def test_put_get_and_persist(self, tmp_path):
+        cache = DeltastreamMetadataCache(str(tmp_path), "org", ttl_seconds=60)
+        cache.put("relations", ["a", "b"], "db", "schema")
+        cache.flush()
+
+        reloaded = DeltastreamMetadataCache(str(tmp_path), "org", ttl_seconds=60)
+        assert reloaded.get("relations", "db", "schema") == ["a", "b"]
+        # Scopes are keyed by organization
+        other_org = DeltastreamMetadataCache(str(tmp_path), "other", ttl_seconds=60)
+        assert other_org.get("relations", "db", "schema") is None
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        cache = DeltastreamMetadataCache(str(tmp_path), "org", ttl_seconds=-1)
+        cache.put("list:FUNCTIONS", {"columns": [], "rows": []})
+        assert cache.get("list:FUNCTIONS") is None
+
+    def test_refresh_discards_persisted_entries(self, tmp_path):
+        cache = DeltastreamMetadataCache(str(tmp_path), "org", ttl_seconds=60)
+        cache.put("relations", ["a"], "db", "schema")
+        cache.flush()
+
+        refreshed = DeltastreamMetadataCache(
+            str(tmp_path), "org", ttl_seconds=60, refresh=True
+        )
+        assert refreshed.get("relations", "db", "schema") is None
+        refreshed.flush()
+        with open(refreshed.path) as f:
+            assert json.load(f)["scopes"] == {}
+
+    def test_invalidate(self, tmp_path):
+        cache = DeltastreamMetadataCache(str(tmp_path), "org", ttl_seconds=60)
+        cache.put("relations", ["a"], "db", "schema")
+        cache.put("columns:a", [["id", "BIGINT", "NULLABLE"]], "db", "schema")
+        cache.put("columns:b", [], "db", "other")
+
+        cache.invalidate("relations", "db", "schema")
+        assert cache.get("relations", "db", "schema") is None
+        assert cache.get("columns:a", "db", "schema") is not None
+
+        cache.invalidate_kind_everywhere("columns:")
+        assert cache.get("columns:a", "db", "schema") is None
+        assert cache.get("columns:b", "db", "other") is None
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        with open(os.path.join(tmp_path, DeltastreamMetadataCache.FILE_NAME), "w") as f:
+            f.write("not json")
+        cache = DeltastreamMetadataCache(str(tmp_path), "org", ttl_seconds=60)
+        assert cache.get("relations", "db", "schema") is None
+
+
+class TestDdlParsing:
+    def test_parse_ddl_statement(self):
+        assert parse_ddl_statement('/* dbt */ create stream "db"."s"."x" as select 1')[
+            :2
+        ] == ("CREATE", "STREAM")
+        assert parse_ddl_statement('create materialized view "db"."s"."x" as')[:2] == (
+            "CREATE",
+            "MATERIALIZED VIEW",
+        )
+        assert parse_ddl_statement("select * from x;") is None
+        assert parse_ddl_statement("LIST FUNCTIONS;") is None
+
+    def test_is_query(self):
+        assert is_query("select * from x")
+        assert is_query("/* dbt */\n-- model\n  (SELECT 1) UNION (SELECT 2)")
+        assert is_query("with a as (select 1) select * from a")
+        assert not is_query("")
+        assert not is_query("-- selected_at is the event time")
+        assert not is_query("selected_at BIGINT")
+        assert not is_query('create stream "s" as select 1')
+
+    def test_parse_qualified_name(self):
+        assert parse_qualified_name('"db"."s"."x" with (a)') == ["db", "s", "x"]
+        assert parse_qualified_name("my_func(a INT)") == ["my_func"]
+        assert parse_qualified_name('"a""b".c') == ['a"b', "c"]
+
+    def test_listeners_notified_after_ddl(self):
+        manager = DeltastreamConnectionManager(profile="test", mp_context=threading)
+        listener = Mock()
+        manager.add_ddl_listener(listener)
+
+        manager._notify_ddl('DROP RELATION "db"."s"."x";')
+        manager._notify_ddl("SELECT 1;")
+
+        listener.assert_called_once_with("DROP", "RELATION", '"db"."s"."x";')
+
+
+@pytest.fixture
+def cached_adapter(tmp_path):
+    config = MagicMock()
+    config.credentials.metadata_cache = True
+    config.credentials.metadata_cache_refresh = False
+    config.credentials.metadata_cache_ttl_seconds = 300
+    config.credentials.organization_id = "org"
+    config.project_target_path = str(tmp_path)
+    adapter = DeltastreamAdapter(config, get_context("spawn"))
+    adapter.connections = MagicMock()
+    return adapter
+
+
+class TestAdapterMetadataCache:
+    def test_disabled_by_default(self):
+        config = MagicMock()
+        adapter = DeltastreamAdapter(config, get_context("spawn"))
+        assert adapter._get_metadata_cache() is None
+
+    def test_refresh_flag(self, cached_adapter):
+        cache = cached_adapter._get_metadata_cache()
+        cache.put("relations", ["a"], "db", "s")
+        cache.flush()
+
+        config = cached_adapter.config
+        config.credentials.metadata_cache_refresh = True
+        refreshed = DeltastreamAdapter(config, get_context("spawn"))
+        assert refreshed._get_metadata_cache().get("relations", "db", "s") is None
+
+    def test_list_relations_served_from_cache(self, cached_adapter):
+        table = Mock()
+        table.rows = [['"t1"'], ["t2"]]
+        cached_adapter.connections.query.return_value = (None, table)
+        schema = DeltastreamRelation.create(database="db", schema="s")
+
+        first = cached_adapter.list_relations_without_caching(schema)
+        second = cached_adapter.list_relations_without_caching(schema)
+
+        cached_adapter.connections.query.assert_called_once()
+        assert [r.identifier for r in first] == ["t1", "t2"]
+        assert [r.identifier for r in second] == ["t1", "t2"]
+
+    def test_columns_invalidated_by_ddl(self, cached_adapter):
+        table = Mock()
+        table.rows = [["id", "BIGINT", True]]
+        cached_adapter.connections.query.return_value = (None, table)
+        relation = DeltastreamRelation.create(database="db", schema="s", identifier="t")
+
+        cached_adapter.get_columns_in_relation(relation)
+        cached_adapter.get_columns_in_relation(relation)
+        assert cached_adapter.connections.query.call_count == 1
+
+        cached_adapter._on_ddl("DROP", "RELATION", '"db"."s"."t";')
+        columns = cached_adapter.get_columns_in_relation(relation)
+        assert cached_adapter.connections.query.call_count == 2
+        assert columns[0].column == "id"
+        assert columns[0].mode == "NULLABLE"
+
+    def test_list_statements_cached_and_invalidated(self, cached_adapter):
+        table = agate.Table([["f1(a INTEGER)"]], ["Signature"])
+        cached_adapter.connections.query.return_value = (None, table)
+
+        cached_adapter._query_list("FUNCTIONS")
+        cached = cached_adapter._query_list("FUNCTIONS")
+        assert cached_adapter.connections.query.call_count == 1
+        assert cached.rows[0]["Signature"] == "f1(a INTEGER)"
+
+        cached_adapter._on_ddl("CREATE", "FUNCTION", "f2(a VARCHAR)")
+        cached_adapter._query_list("FUNCTIONS")
+        assert cached_adapter.connections.query.call_count == 2
+
+    def test_flushed_on_cleanup(self, cached_adapter, tmp_path):
+        table = Mock()
+        table.rows = [["t1"]]
+        cached_adapter.connections.query.return_value = (None, table)
+        cached_adapter.list_relations_without_caching(
+            DeltastreamRelation.create(database="db", schema="s")
+        )
+
+        cached_adapter.cleanup_connections()
+
+        assert os.path.exists(
+            os.path.join(tmp_path, DeltastreamMetadataCache.FILE_NAME)
+        )
@@ -0,0 +1,114 @@
+"""Unit tests for the query health monitor."""
+
+import json
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.monitor import format_prometheus, in_scope, query_metrics
+
+COLUMNS = ["ID", "Name", "ActualState", "Query"]
+ROWS = [
+    [
+        "q1",
+        "enriched",
+        "running",
+        'CREATE STREAM "db"."s"."enriched" AS SELECT * FROM "db"."s"."pv";',
+    ],
+    [
+        "q2",
+        "counts",
+        "errored",
+        "CREATE CHANGELOG counts AS SELECT id, COUNT(*) FROM enriched GROUP BY id;",
+    ],
+    [
+        "q3",
+        "other",
+        "running",
+        'CREATE STREAM "db"."elsewhere"."x" AS SELECT * FROM "db"."s"."pv";',
+    ],
+]
+
+
+def test_in_scope():
+    schemas = {("db", "s")}
+    relations = {("db", "s", "counts"), ("db", "s", "enriched")}
+    assert in_scope(("db", "s", "new_stream"), schemas, relations)
+    assert in_scope(("counts",), schemas, relations)
+    assert not in_scope(("db", "elsewhere", "x"), schemas, relations)
+    assert not in_scope(None, schemas, relations)
+
+
+def test_query_metrics():
+    rows = [
+        ["state", "running"],
+        ["records.in.per.sec", "120.5"],
+        ["Consumer Lag", 42],
+        ["version", "3"],
+        ["error", None],
+    ]
+    assert query_metrics(rows) == {"records_in_per_sec": 120.5, "consumer_lag": 42.0}
+
+
+def test_format_prometheus():
+    text = format_prometheus(
+        [
+            {
+                "timestamp": 1700000000.0,
+                "query_id": "q1",
+                "name": 'we"ird',
+                "state": "running",
+                "compute_pool": None,
+                "sink": "db.s.enriched",
+                "metrics": {"consumer_lag": 42.0},
+            }
+        ]
+    )
+    assert (
+        'deltastream_query_state{query_id="q1",name="we\\"ird",state="running",sink="db.s.enriched"} 1'
+        in text
+    )
+    assert (
+        '# TYPE deltastream_query_consumer_lag gauge\ndeltastream_query_consumer_lag{query_id="q1",name="we\\"ird"} 42.0'
+        in text
+    )
+    assert text.endswith("deltastream_query_sample_timestamp_seconds 1700000000.0\n")
+
+
+@pytest.fixture
+def adapter():
+    adapter_instance = DeltastreamAdapter(MagicMock(), get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+
+    def query(sql):
+        if sql == "LIST QUERIES;":
+            return None, agate.Table(ROWS, COLUMNS)
+        return None, agate.Table([["lag", "7"]], ["Property", "Value"])
+
+    adapter_instance.connections.query.side_effect = query
+    return adapter_instance
+
+
+def test_monitor_queries_jsonl(adapter, tmp_path, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    output_path = str(tmp_path / "samples.jsonl")
+
+    written = adapter.monitor_queries(
+        [["db", "s", "enriched"], ["db", "s", "counts"]], output_path, iterations=2
+    )
+
+    assert written == 4
+    with open(output_path) as f:
+        samples = [json.loads(line) for line in f]
+    assert [(s["query_id"], s["state"], s["metrics"]) for s in samples[:2]] == [
+        ("q1", "running", {"lag": 7.0}),
+        ("q2", "errored", {"lag": 7.0}),
+    ]
+
+
+def test_unsupported_format(adapter, tmp_path):
+    with pytest.raises(Exception, match="Unsupported monitoring format"):
+        adapter.monitor_queries([], str(tmp_path / "out"), "csv")
@@ -0,0 +1,220 @@
+"""Unit tests for the deployment plan."""
+
+import json
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+
+from dbt.adapters.deltastream.functions import FunctionIndex, make_signature
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.plan import ExistingState, compute_plan
+from dbt.adapters.deltastream.relation import DeltastreamRelation
+from dbt.adapters.deltastream.resource_parameters import parameter_digests
+
+
+def _source(name, materialized, parameters=None):
+    return {
+        "unique_id": f"source.p.s.{name}",
+        "resource_type": "source",
+        "identifier": name,
+        "database": "db",
+        "schema": "s",
+        "config": {"materialized": materialized, "parameters": parameters or {}},
+    }
+
+
+def _model(name, materialized="stream", depends_on=(), compiled_code=None):
+    return {
+        "unique_id": f"model.p.{name}",
+        "resource_type": "model",
+        "alias": name,
+        "database": "db",
+        "schema": "s",
+        "package_name": "p",
+        "original_file_path": f"models/{name}.sql",
+        "compiled_code": compiled_code,
+        "columns": {},
+        "depends_on": {"nodes": list(depends_on)},
+        "config": {"materialized": materialized, "skip_unchanged": True},
+    }
+
+
+def _record(name, fingerprint="fp"):
+    return {"relation": f"db.s.{name}", "fingerprint": fingerprint}
+
+
+def _actions(entries):
+    return {entry["unique_id"]: entry["action"] for entry in entries}
+
+
+class TestComputePlan:
+    def test_resources(self):
+        state = ExistingState(
+            resources={"store": {"kafka"}, "function_source": {"jar"}},
+            entities={"kafka": {"topic"}},
+            functions=FunctionIndex([make_signature("udf", ["VARCHAR"])]),
+        )
+        nodes = [
+            _source("kafka", "store"),
+            _source("pool", "compute_pool"),
+            _source("topic", "entity", {"store": "kafka"}),
+            _source("jar", "function_source"),
+            _source("udf", "function", {"args": [{"type": "VARCHAR"}]}),
+            _source("other_udf", "function", {"args": [{"type": "INTEGER"}]}),
+        ]
+        assert _actions(compute_plan(nodes, state)) == {
+            "source.p.s.kafka": "update",
+            "source.p.s.pool": "create",
+            "source.p.s.topic": "update",
+            "source.p.s.jar": "recreate",
+            "source.p.s.udf": "recreate",
+            "source.p.s.other_udf": "create",
+        }
+
+    def test_resource_with_unchanged_parameters(self):
+        parameters = {"uris": "broker:9092"}
+        state = ExistingState(
+            resources={"store": {"kafka"}},
+            deployments={
+                "source.p.s.kafka": {
+                    "relation": "store:kafka",
+                    "parameters": parameter_digests(parameters),
+                }
+            },
+        )
+        entries = compute_plan([_source("kafka", "store", parameters)], state)
+        assert _actions(entries) == {"source.p.s.kafka": "no-op"}
+        # Resource records are not relations and never reported as orphans
+        assert _actions(compute_plan([], state)) == {}
+
+    def test_models(self):
+        state = ExistingState(
+            relations={
+                ("db", "s", name) for name in ("pv", "a", "b", "c", "d", "gone")
+            },
+            deployments={
+                "model.p.a": _record("a"),
+                "model.p.b": _record("b"),
+                "model.p.c": _record("c", fingerprint="old"),
+                "model.p.d": _record("d"),
+                "model.p.removed": _record("gone"),
+                "model.p.removed_dropped": _record("already_dropped"),
+            },
+        )
+        nodes = [
+            _model("d", depends_on=["model.p.c"]),
+            _source("pv", "stream"),
+            _model("a", depends_on=["source.p.s.pv"]),
+            _model("b"),
+            _model("c"),
+            _model("new"),
+            _model("inlined", materialized="ephemeral"),
+        ]
+        fingerprints = {f"model.p.{name}": "fp" for name in "abcd"}
+        fingerprints["model.p.new"] = "fp"
+        assert _actions(compute_plan(nodes, state, fingerprints)) == {
+            "source.p.s.pv": "recreate",
+            "model.p.a": "recreate",
+            "model.p.b": "no-op",
+            "model.p.c": "recreate",
+            "model.p.d": "recreate",
+            "model.p.new": "create",
+            "model.p.removed": "drop-orphan",
+        }
+
+    def test_models_redeployed_by_run(self):
+        state = ExistingState(
+            relations={("db", "s", name) for name in ("a", "b", "c", "d")},
+            deployments={
+                f"model.p.{name}": _record(name) for name in ("a", "b", "c", "d")
+            },
+            stopped={("db", "s", "d")},
+        )
+        not_skipped = _model("b")
+        not_skipped["config"]["skip_unchanged"] = False
+        nodes = [_model("a"), not_skipped, _model("c"), _model("d")]
+        fingerprints = {"model.p.a": "fp", "model.p.b": "fp", "model.p.d": "fp"}
+
+        entries = {
+            entry["unique_id"]: entry
+            for entry in compute_plan(nodes, state, fingerprints)
+        }
+
+        assert entries["model.p.a"]["action"] == "no-op"
+        assert entries["model.p.b"]["reason"] == "skip_unchanged is not enabled"
+        assert entries["model.p.c"]["reason"].startswith("compiled SQL not found")
+        assert entries["model.p.d"]["reason"] == (
+            "no query writing to the relation is running"
+        )
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    config = MagicMock()
+    config.credentials.deploy_state_path = None
+    config.credentials.metadata_cache = False
+    config.project_target_path = str(tmp_path)
+    adapter_instance = DeltastreamAdapter(config, get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+
+    def query(sql):
+        if sql == "LIST STORES;":
+            return None, agate.Table([['"kafka"']], ["Name"])
+        if sql.startswith("select schema_name"):
+            return None, agate.Table([["s", "b", None, None]], ["a", "b", "c", "d"])
+        if sql == "LIST QUERIES;":
+            return None, agate.Table(
+                [["q1", "running", 'CREATE STREAM "db"."s"."b" AS SELECT * FROM a;']],
+                ["ID", "ActualState", "Query"],
+            )
+        return None, agate.Table([], ["Name"])
+
+    adapter_instance.connections.query.side_effect = query
+    return adapter_instance
+
+
+def test_plan_deployment_batches_metadata(adapter, tmp_path):
+    # Compiled by the last dbt run, which recorded the fingerprint of its compiled SQL
+    compiled_path = tmp_path / "compiled" / "p" / "models" / "b.sql"
+    compiled_path.parent.mkdir(parents=True)
+    compiled_path.write_text("SELECT *\nFROM a\n")
+    adapter.record_deployment(
+        _model("b"),
+        DeltastreamRelation.create(database="db", schema="s", identifier="b"),
+        adapter.get_deploy_fingerprint(_model("b"), "SELECT * FROM a", {}, "stream"),
+    )
+    nodes = [_source("kafka", "store")] + [_model(name) for name in ("a", "b")]
+    output_path = str(tmp_path / "plan.json")
+
+    plan = adapter.plan_deployment(nodes, output_path)
+
+    assert _actions(plan["actions"]) == {
+        "source.p.s.kafka": "update",
+        "model.p.a": "create",
+        "model.p.b": "no-op",
+    }
+    assert plan["summary"]["no-op"] == 1
+    statements = [call.args[0] for call in adapter.connections.query.call_args_list]
+    assert statements[0] == "LIST STORES;"
+    assert statements[-1] == "LIST QUERIES;"
+    assert len(statements) == 3
+    with open(output_path) as f:
+        assert json.load(f)["actions"] == plan["actions"]
+
+
+def test_plan_deployment_uses_run_fingerprint(adapter):
+    model = _model("b", compiled_code="SELECT * FROM a")
+    adapter.record_deployment(
+        model,
+        DeltastreamRelation.create(database="db", schema="s", identifier="b"),
+        adapter.get_deploy_fingerprint(model, "SELECT * FROM a", {}, "stream"),
+    )
+    changed = _model("b", compiled_code="SELECT * FROM a WHERE x > 1")
+
+    plan = adapter.plan_deployment([changed])
+
+    assert (
+        plan["actions"][0]["reason"] == "definition changed since the last deployment"
+    )
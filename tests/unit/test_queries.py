@@ -0,0 +1,269 @@
+"""Unit tests for the LIST QUERIES index."""
+
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.queries import QueryIndex, parse_query_relations
+from dbt.adapters.deltastream.relation import DeltastreamRelation
+
+COLUMNS = ["ID", "Name", "ActualState", "Query"]
+ROWS = [
+    [
+        "q1",
+        "orders_enriched",
+        "running",
+        'CREATE STREAM "db"."s"."orders_enriched" AS SELECT * FROM "db"."s"."orders" o '
+        'JOIN "db"."s"."users" u ON o.uid = u.id;',
+    ],
+    [
+        "q2",
+        "order_counts",
+        "errored",
+        "CREATE CHANGELOG order_counts WITH ('compute_pool' = 'pool_a') AS "
+        "SELECT uid, COUNT(*) FROM orders_enriched GROUP BY uid;",
+    ],
+    [
+        "q3",
+        "backfill",
+        "running",
+        'INSERT INTO "db"."s"."orders" SELECT * FROM "db"."other"."orders";',
+    ],
+]
+
+
+def _table():
+    return agate.Table(ROWS, COLUMNS)
+
+
+def _ids(queries):
+    return sorted(q.query_id if hasattr(q, "query_id") else q["ID"] for q in queries)
+
+
+class TestParseQueryRelations:
+    def test_sink_and_sources(self):
+        sink, sources = parse_query_relations(ROWS[0][3])
+        assert sink == ("db", "s", "orders_enriched")
+        assert sources == (("db", "s", "orders"), ("db", "s", "users"))
+
+    def test_insert_into(self):
+        sink, sources = parse_query_relations(ROWS[2][3])
+        assert sink == ("db", "s", "orders")
+        assert sources == (("db", "other", "orders"),)
+
+    def test_subquery_and_empty(self):
+        sink, sources = parse_query_relations(
+            "SELECT * FROM (SELECT a FROM x) WHERE a > 1;"
+        )
+        assert sink is None
+        assert sources == (("x",),)
+        assert parse_query_relations(None) == (None, ())
+
+
+class TestQueryIndex:
+    def test_lookups(self):
+        index = QueryIndex.from_table(_table())
+
+        assert _ids(index.writing("db", "s", "orders_enriched")) == ["q1"]
+        assert _ids(index.writing("db", "s", "orders")) == ["q3"]
+        # Partially qualified names match any database and schema
+        assert _ids(index.writing("DB", "S", "ORDER_COUNTS")) == ["q2"]
+        assert _ids(index.reading("db", "s", "orders")) == ["q1"]
+        assert _ids(index.reading("db", "other", "orders")) == ["q3"]
+        assert _ids(index.reading("db", "s", "orders_enriched")) == ["q2"]
+        assert _ids(index.in_state("RUNNING")) == ["q1", "q3"]
+        assert _ids(index.in_state()) == ["q1", "q2", "q3"]
+        assert _ids(index.on_compute_pool("pool_a")) == ["q2"]
+        assert index.writing("db", "s", "unknown") == []
+
+    def test_select(self):
+        index = QueryIndex.from_table(_table())
+
+        assert _ids(index.select()) == ["q1", "q2", "q3"]
+        assert _ids(index.select(state="running", relation=("db", "s", "orders"))) == [
+            "q1",
+            "q3",
+        ]
+        assert _ids(index.select(compute_pool="POOL_A", state="running")) == []
+        assert _ids(index.select(name_pattern="ORDER*")) == ["q1", "q2"]
+
+
+@pytest.fixture
+def adapter():
+    adapter_instance = DeltastreamAdapter(MagicMock(), get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+    adapter_instance.connections.query.return_value = (None, _table())
+    return adapter_instance
+
+
+class TestAdapterQueryIndex:
+    def test_queries_listed_once(self, adapter):
+        relation = DeltastreamRelation.create(
+            database="db", schema="s", identifier="orders"
+        )
+        assert _ids(adapter.get_queries("running")) == ["q1", "q3"]
+        assert _ids(adapter.get_queries_writing(relation)) == ["q3"]
+        assert _ids(adapter.get_queries_reading(relation)) == ["q1"]
+        assert _ids(adapter.get_queries_on_compute_pool("POOL_A")) == ["q2"]
+        adapter.connections.query.assert_called_once_with("LIST QUERIES;")
+        assert adapter.get_queries("errored")[0]["Name"] == "order_counts"
+
+    @pytest.mark.parametrize(
+        "verb,object_type,remainder",
+        [
+            ("TERMINATE", "QUERY", "q1;"),
+            ("RESTART", "QUERY", "q2;"),
+            ("CREATE", "STREAM", '"db"."s"."x" AS SELECT * FROM y;'),
+            ("DROP", "RELATION", '"db"."s"."x";'),
+        ],
+    )
+    def test_snapshot_refreshed_after_ddl(self, adapter, verb, object_type, remainder):
+        adapter.get_queries()
+        adapter._on_ddl(verb, object_type, remainder)
+        adapter.get_queries()
+        assert adapter.connections.query.call_count == 2
+
+    def test_snapshot_kept_for_unrelated_ddl(self, adapter):
+        adapter.get_queries()
+        adapter._on_ddl("CREATE", "STORE", "my_store WITH ('type' = KAFKA);")
+        adapter.get_queries(refresh=False)
+        adapter.connections.query.assert_called_once()
+        adapter.get_queries(refresh=True)
+        assert adapter.connections.query.call_count == 2
+
+
+class TestWaitForQueriesRunning:
+    def _relation(self):
+        return DeltastreamRelation.create(
+            database="db", schema="s", identifier="orders_enriched__blue"
+        )
+
+    def _snapshot(self, state):
+        return (
+            None,
+            agate.Table(
+                [
+                    [
+                        "q9",
+                        "orders_enriched__blue",
+                        state,
+                        'CREATE STREAM "db"."s"."orders_enriched__blue" AS SELECT * FROM orders;',
+                    ]
+                ],
+                COLUMNS,
+            ),
+        )
+
+    def test_waits_until_running(self, adapter, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        adapter.connections.query.side_effect = [
+            (None, agate.Table([], COLUMNS)),
+            self._snapshot("starting"),
+            self._snapshot("running"),
+        ]
+        queries = adapter.wait_for_queries_running(self._relation())
+        assert [q["ID"] for q in queries] == ["q9"]
+        assert adapter.connections.query.call_count == 3
+
+    def test_fails_when_query_errored(self, adapter):
+        adapter.connections.query.side_effect = [
+            self._snapshot("errored"),
+            (
+                None,
+                agate.Table(
+                    [["state", "errored"], ["error", "bad"]], ["Property", "Value"]
+                ),
+            ),
+        ]
+        with pytest.raises(DbtRuntimeError, match="q9 writing to .* is errored: bad"):
+            adapter.wait_for_queries_running(self._relation())
+        adapter.connections.query.assert_called_with("DESCRIBE QUERY q9;")
+
+    def test_times_out(self, adapter):
+        adapter.connections.query.return_value = self._snapshot("starting")
+        with pytest.raises(DbtRuntimeError, match="Timed out"):
+            adapter.wait_for_queries_running(self._relation(), timeout_seconds=0)
+
+    def test_waits_until_stopped(self, adapter, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        adapter.connections.query.side_effect = [
+            self._snapshot("running"),
+            self._snapshot("terminated"),
+        ]
+        adapter.wait_for_queries_stopped(self._relation())
+        assert adapter.connections.query.call_count == 2
+
+    def test_stop_times_out(self, adapter):
+        adapter.connections.query.return_value = self._snapshot("running")
+        with pytest.raises(DbtRuntimeError, match="to stop .*q9"):
+            adapter.wait_for_queries_stopped(self._relation(), timeout_seconds=0)
+
+    def test_backoff_between_polls(self, adapter, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        adapter.connections.query.side_effect = [self._snapshot("starting")] * 4 + [
+            self._snapshot("running")
+        ]
+        adapter.wait_for_queries_running(
+            self._relation(), initial_interval_seconds=1, max_interval_seconds=4
+        )
+        assert sleeps == [1, 2, 4, 4]
+
+    def test_recent_snapshot_shared(self, adapter):
+        adapter.connections.query.return_value = self._snapshot("running")
+        first = adapter._get_query_index()
+        # Another thread refreshed the snapshot after this one started waiting
+        assert adapter._get_query_index(newer_than=first.created_at - 1) is first
+        adapter.connections.query.assert_called_once()
+
+
+class TestBulkQueryAction:
+    def _statements(self, adapter):
+        return [call.args[0] for call in adapter.connections.query.call_args_list]
+
+    def test_terminates_selected_queries(self, adapter):
+        summary = adapter.run_bulk_query_action("terminate", state="running")
+
+        statements = self._statements(adapter)
+        assert statements[0] == "LIST QUERIES;"
+        assert sorted(statements[1:]) == ["TERMINATE QUERY q1;", "TERMINATE QUERY q3;"]
+        assert sorted(row["Result"] for row in summary.rows) == ["submitted"] * 2
+
+    def test_restart_waits_for_running(self, adapter, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        running = [list(row) for row in ROWS]
+        running[1][2] = "running"
+        adapter.connections.query.side_effect = [
+            (None, _table()),
+            (None, None),
+            (None, agate.Table(running, COLUMNS)),
+        ]
+
+        summary = adapter.run_bulk_query_action(
+            "restart", relation="db.s.orders_enriched", state="errored", wait=True
+        )
+
+        assert [(row["ID"], row["State"], row["Result"]) for row in summary.rows] == [
+            ("q2", "running", "done")
+        ]
+        assert self._statements(adapter)[1] == "RESTART QUERY q2;"
+
+    def test_failures_reported(self, adapter):
+        def query(sql):
+            if sql.startswith("TERMINATE"):
+                raise Exception("boom")
+            return None, _table()
+
+        adapter.connections.query.side_effect = query
+        summary = adapter.run_bulk_query_action("terminate", name_pattern="backfill")
+        assert [(row["ID"], row["Result"], row["Error"]) for row in summary.rows] == [
+            ("q3", "failed", "boom")
+        ]
+
+    def test_unsupported_action(self, adapter):
+        with pytest.raises(DbtRuntimeError, match="Unsupported query action"):
+            adapter.run_bulk_query_action("pause")
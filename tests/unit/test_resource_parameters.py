@@ -0,0 +1,95 @@
+"""Unit tests for the parameter diff of updatable resources."""
+
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.resource_parameters import (
+    diff_parameters,
+    parameter_digests,
+    properties_from_rows,
+)
+
+
+class TestDiffParameters:
+    def test_compared_with_described_properties(self):
+        described = properties_from_rows(
+            ["Name", "Type", "KafkaSaslUsername", "Uris"],
+            [["kafka", "KAFKA", "'admin'", "broker:9092"]],
+        )
+        parameters = {
+            "type": "CONFLUENT_KAFKA",
+            "kafka.sasl.username": "admin",
+            "uris": "broker:9093",
+        }
+        # The type cannot be updated and the username is unchanged
+        assert diff_parameters("store", parameters, described) == {
+            "uris": "broker:9093"
+        }
+
+    def test_property_value_rows(self):
+        described = properties_from_rows(
+            ["Property", "Value"], [["topic.partitions", "3"], ["compacted", "false"]]
+        )
+        assert (
+            diff_parameters(
+                "entity",
+                {"store": "kafka", "topic.partitions": 3, "compacted": False},
+                described,
+            )
+            == {}
+        )
+
+    def test_undescribed_parameters_compared_with_applied_digests(self):
+        parameters = {"kafka.sasl.password": "secret", "size": "small"}
+        applied = parameter_digests({"kafka.sasl.password": "secret"})
+        assert diff_parameters("store", parameters, {}, applied) == {"size": "small"}
+        assert diff_parameters("store", parameters, {}) == parameters
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    config = MagicMock()
+    config.credentials.deploy_state_path = None
+    config.credentials.metadata_cache = False
+    config.project_target_path = str(tmp_path)
+    adapter_instance = DeltastreamAdapter(config, get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+    adapter_instance.connections.query.return_value = (
+        None,
+        agate.Table([["kafka", "broker:9092"]], ["Name", "Uris"]),
+    )
+    return adapter_instance
+
+
+def test_changes_after_recorded_parameters(adapter):
+    node = {"unique_id": "source.p.s.kafka"}
+    parameters = {"uris": "broker:9092", "kafka.sasl.password": "secret"}
+
+    assert adapter.get_resource_parameter_changes(
+        node, "store", "kafka", parameters
+    ) == {"kafka.sasl.password": "secret"}
+
+    adapter.record_resource_parameters(node, "store", "kafka", parameters)
+
+    assert (
+        adapter.get_resource_parameter_changes(node, "store", "kafka", parameters) == {}
+    )
+    assert (
+        adapter.get_resource_parameter_changes(
+            node, "store", "kafka", parameters, force=True
+        )
+        == parameters
+    )
+    adapter.connections.query.assert_called_with('DESCRIBE STORE "kafka";')
+
+
+def test_missing_resource(adapter):
+    adapter.connections.query.return_value = (None, agate.Table([], ["Name"]))
+    assert (
+        adapter.get_resource_parameter_changes({}, "store", "kafka", {"uris": "x"})
+        is None
+    )
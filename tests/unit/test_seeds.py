@@ -0,0 +1,558 @@
+"""Unit tests for the seed record encoding and concurrent inserts."""
+
+import asyncio
+import json
+import os
+import threading
+from multiprocessing import get_context
+from unittest.mock import MagicMock, Mock
+
+import agate
+import pytest
+from dbt_common.clients.agate_helper import Integer, from_csv
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream import seeds
+from dbt.adapters.deltastream.connections import DeltastreamConnectionManager
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.seeds import (
+    SeedDelta,
+    SeedStateStore,
+    encode_table_records,
+    infer_csv_types,
+    insert_statements,
+    partition_by_key,
+    profile_column_types,
+    read_csv_chunks,
+)
+
+
+def _values(count):
+    return [json.dumps({"id": i, "name": f"user_{i}"}) for i in range(count)]
+
+
+def test_one_record_per_statement():
+    statements = insert_statements("users", "kafka", _values(2))
+    assert statements == [
+        'INSERT INTO ENTITY "users" IN STORE "kafka" VALUE(\'{"id": 0, "name": "user_0"}\');',
+        'INSERT INTO ENTITY "users" IN STORE "kafka" VALUE(\'{"id": 1, "name": "user_1"}\');',
+    ]
+
+
+def test_no_store_and_quotes_escaped():
+    statements = insert_statements("users", None, ['{"name": "O\'Brien"}'])
+    assert statements == [
+        'INSERT INTO ENTITY "users" VALUE(\'{"name": "O\'\'Brien"}\');'
+    ]
+
+
+def test_empty_seed():
+    assert insert_statements("users", None, []) == []
+
+
+@pytest.fixture
+def adapter():
+    return DeltastreamAdapter(MagicMock(), get_context("spawn"))
+
+
+def test_encode_table_records():
+    table = agate.Table(
+        [
+            ["1", "1.50", "true", "2024-01-02", "2024-01-02 03:04:05", "a'b"],
+            ["", "", "", "", "", ""],
+        ],
+        ["id", "amount", "active", "day", "at", "name"],
+        [
+            agate.Number(),
+            agate.Number(),
+            agate.Boolean(),
+            agate.Date(),
+            agate.DateTime(),
+            agate.Text(),
+        ],
+    )
+    records = [json.loads(record) for record in encode_table_records(table)]
+    assert records == [
+        {
+            "id": 1,
+            "amount": 1.5,
+            "active": 1,
+            "day": "2024-01-02",
+            "at": "2024-01-02 03:04:05",
+            "name": "a'b",
+        },
+        {
+            "id": None,
+            "amount": None,
+            "active": None,
+            "day": None,
+            "at": None,
+            "name": None,
+        },
+    ]
+    assert list(records[0]) == ["id", "amount", "active", "day", "at", "name"]
+
+
+def test_encode_json_booleans():
+    table = agate.Table([["true"], ["false"]], ["active"], [agate.Boolean()])
+    assert encode_table_records(table) == ['{"active": 1}', '{"active": 0}']
+    assert encode_table_records(table, json_booleans=True) == [
+        '{"active": true}',
+        '{"active": false}',
+    ]
+
+
+def test_encode_seed_records(adapter):
+    table = agate.Table([["7"]], ["id"], [agate.Number()])
+    assert adapter.encode_seed_records(table) == ['{"id": 7}']
+
+
+def _typed_table():
+    return agate.Table(
+        [
+            [1, "2", "true", "2024-01-02", "2024-01-02 03:04:05", "a", "3"],
+            [2, "2.5", "", "", "", "", "4.0"],
+        ],
+        ["id", "amount", "active", "day", "at", "name", "count"],
+        [
+            Integer(),
+            agate.Number(),
+            agate.Boolean(),
+            agate.Date(),
+            agate.DateTime(),
+            agate.Text(),
+            agate.Number(),
+        ],
+    )
+
+
+def test_profile_column_types():
+    table = _typed_table()
+    assert profile_column_types(table) == [
+        "BIGINT",
+        "DOUBLE",
+        "BOOLEAN",
+        "DATE",
+        "TIMESTAMP",
+        "VARCHAR",
+        "BIGINT",
+    ]
+
+
+def test_profile_column_types_memoized(monkeypatch):
+    table = _typed_table()
+    calls = []
+    has_fraction = seeds._has_fraction
+    monkeypatch.setattr(
+        seeds, "_has_fraction", lambda value: calls.append(value) or has_fraction(value)
+    )
+    first = profile_column_types(table)
+    scanned = len(calls)
+    first.append("mutated")
+    assert profile_column_types(table) == first[:-1]
+    assert len(calls) == scanned
+
+
+def test_convert_type_hooks_use_profile():
+    table = _typed_table()
+    assert DeltastreamAdapter.convert_type(table, 0) == "BIGINT"
+    assert DeltastreamAdapter.convert_type(table, 1) == "DOUBLE"
+    assert DeltastreamAdapter.convert_type(table, 6) == "BIGINT"
+
+
+def test_profiled_columns_encoded_consistently():
+    records = [json.loads(record) for record in encode_table_records(_typed_table())]
+    assert [record["amount"] for record in records] == [2.0, 2.5]
+    assert isinstance(records[0]["amount"], float)
+    assert [record["count"] for record in records] == [3, 4]
+
+
+def test_partition_by_key_keeps_key_order():
+    values = [json.dumps({"key": i % 3, "seq": i}) for i in range(30)]
+    keys = [i % 3 for i in range(30)]
+    partitions = partition_by_key(values, keys, 8)
+    assert sum(len(partition) for partition in partitions) == 30
+    for partition in partitions:
+        records = [json.loads(value) for value in partition]
+        for key in {record["key"] for record in records}:
+            sequence = [record["seq"] for record in records if record["key"] == key]
+            assert sequence == sorted(sequence)
+    assert partition_by_key(values, keys, 8) == partitions
+
+
+def test_insert_seed_records_without_keys(adapter):
+    adapter.connections = MagicMock()
+    adapter.connections.execute_pipelined.return_value = 3
+
+    result = adapter.insert_seed_records("users", None, _values(3), max_in_flight=4)
+
+    lanes, max_in_flight = adapter.connections.execute_pipelined.call_args[0]
+    assert [len(lane) for lane in lanes] == [1, 1, 1]
+    assert max_in_flight == 4
+    assert result["rows"] == 3
+    assert result["statements"] == 3
+
+
+def test_insert_seed_records_with_keys(adapter):
+    adapter.connections = MagicMock()
+    adapter.connections.execute_pipelined.return_value = 2
+
+    adapter.insert_seed_records(
+        "users", None, _values(4), max_in_flight=2, keys=["a", "a", "a", "a"]
+    )
+
+    lanes, _ = adapter.connections.execute_pipelined.call_args[0]
+    assert len(lanes) == 1
+    assert [f"user_{i}" in statement for i, statement in enumerate(lanes[0])] == [
+        True
+    ] * 4
+
+
+def test_insert_seed_records_failure(adapter):
+    adapter.connections = MagicMock()
+    adapter.connections.execute_pipelined.side_effect = Exception("boom")
+    with pytest.raises(DbtRuntimeError, match="users: boom"):
+        adapter.insert_seed_records("users", None, _values(1))
+
+    with pytest.raises(DbtRuntimeError, match="one key per seed record"):
+        adapter.insert_seed_records("users", None, _values(2), keys=["a"])
+
+
+def _write_csv(tmp_path, text):
+    path = tmp_path / "seed.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_read_csv_chunks(tmp_path):
+    path = _write_csv(
+        tmp_path,
+        "\ufeffid,code,note,at\n1,007,,2024-01-02 03:04:05\n2,008,,\n3,009,late,\n",
+    )
+    chunks = list(read_csv_chunks(path, chunk_size=2, text_columns=["code"]))
+    assert [len(chunk.rows) for chunk in chunks] == [2, 1]
+    records = [json.loads(r) for chunk in chunks for r in encode_table_records(chunk)]
+    assert records[0] == {
+        "id": 1,
+        "code": "007",
+        "note": None,
+        "at": "2024-01-02 03:04:05",
+    }
+    # A column empty in the first chunk is typed from the whole file
+    assert records[2]["note"] == "late"
+
+
+def test_read_csv_chunks_typed_from_whole_file(tmp_path):
+    path = _write_csv(
+        tmp_path, "id,flag\n1,true\n2,false\nabc,2\n4,3\n5,true\n6,false\n"
+    )
+    chunks = list(read_csv_chunks(path, chunk_size=2))
+    assert {type(chunk.column_types[0]).__name__ for chunk in chunks} == {"Text"}
+    assert {type(chunk.column_types[1]).__name__ for chunk in chunks} == {"Text"}
+    records = [json.loads(r) for chunk in chunks for r in encode_table_records(chunk)]
+    assert [record["id"] for record in records] == ["1", "2", "abc", "4", "5", "6"]
+    assert [record["flag"] for record in records] == [
+        "true",
+        "false",
+        "2",
+        "3",
+        "true",
+        "false",
+    ]
+
+
+def test_read_csv_chunks_profiled_from_whole_file(tmp_path):
+    path = _write_csv(tmp_path, "id,amount\n1,1\n2,2.5\n3,3\n4,\n")
+    chunks = list(read_csv_chunks(path, chunk_size=1))
+    assert [profile_column_types(chunk)[1] for chunk in chunks] == ["DOUBLE"] * 4
+    records = [json.loads(r) for chunk in chunks for r in encode_table_records(chunk)]
+    assert [record["amount"] for record in records] == [1.0, 2.5, 3.0, None]
+    assert [type(record["amount"]) for record in records[:3]] == [float] * 3
+    assert [type(record["id"]) for record in records] == [int] * 4
+
+
+def test_infer_csv_types(tmp_path):
+    path = _write_csv(
+        tmp_path, "id,code,amount,ok,at\n1,007,1,true,2024-01-02\n2,008,,false,x\n"
+    )
+    column_names, data_types, profile = infer_csv_types(path, text_columns=["code"])
+    # The types dbt infers when it loads the whole file
+    table = from_csv(path, ["code"])
+    assert column_names == list(table.column_names)
+    assert [type(t) for t in data_types] == [type(t) for t in table.column_types]
+    assert profile == profile_column_types(table)
+    assert profile == ["BIGINT", "VARCHAR", "BIGINT", "BOOLEAN", "VARCHAR"]
+
+
+def test_read_csv_chunks_empty(tmp_path):
+    assert list(read_csv_chunks(_write_csv(tmp_path, ""))) == []
+
+
+def test_insert_seed_file(adapter, tmp_path):
+    path = _write_csv(
+        tmp_path, "id,name\n" + "".join(f"{i},user_{i}\n" for i in range(5))
+    )
+    adapter.connections = MagicMock()
+    adapter.connections.execute_pipelined.side_effect = lambda lanes, _: sum(
+        len(lane) for lane in lanes
+    )
+
+    result = adapter.insert_seed_file(
+        path, "users", "kafka", chunk_size=3, ordering_key="id"
+    )
+
+    assert result["rows"] == 5
+    assert adapter.connections.execute_pipelined.call_count == 2
+    assert result["statements"] == 5
+
+
+@pytest.mark.parametrize("json_booleans", [False, True])
+def test_streamed_seed_matches_full_load(adapter, tmp_path, json_booleans):
+    path = _write_csv(
+        tmp_path,
+        "id,amount,flag,mixed,note\n"
+        "1,10,true,true,\n"
+        "2,20,false,false,a\n"
+        "3,7.5,true,3,\n"
+        "4,,false,4.5,b\n"
+        "5,2,,true,\n",
+    )
+    adapter.connections = MagicMock()
+    adapter.connections.execute_pipelined.side_effect = lambda lanes, _: sum(
+        len(lane) for lane in lanes
+    )
+
+    adapter.insert_seed_file(
+        path, "users", None, chunk_size=2, json_booleans=json_booleans
+    )
+    streamed = [
+        statement
+        for call in adapter.connections.execute_pipelined.call_args_list
+        for lane in call[0][0]
+        for statement in lane
+    ]
+    adapter.connections.execute_pipelined.reset_mock()
+    table = from_csv(path, [])
+    adapter.insert_seed_records(
+        "users", None, adapter.encode_seed_records(table, json_booleans)
+    )
+    loaded = [
+        statement
+        for lane in adapter.connections.execute_pipelined.call_args[0][0]
+        for statement in lane
+    ]
+
+    assert streamed == loaded
+    records = [json.loads(statement[statement.index("{") : -3]) for statement in loaded]
+    assert [record["amount"] for record in records] == [10.0, 20.0, 7.5, None, 2.0]
+    assert {type(record["amount"]) for record in records} == {float, type(None)}
+    assert [record["mixed"] for record in records] == [
+        "true",
+        "false",
+        "3",
+        "4.5",
+        "true",
+    ]
+
+
+def test_insert_seed_file_errors(adapter, tmp_path):
+    adapter.connections = MagicMock()
+    with pytest.raises(DbtRuntimeError, match="not found"):
+        adapter.insert_seed_file(str(tmp_path / "missing.csv"), "users", None)
+    path = _write_csv(tmp_path, "id\n1\n")
+    with pytest.raises(DbtRuntimeError, match="ordering_key"):
+        adapter.insert_seed_file(path, "users", None, ordering_key="key")
+
+
+def _table(rows):
+    return agate.Table(
+        rows, ["code", "name"], [agate.Text(), agate.Text(cast_nulls=False)]
+    )
+
+
+def test_seed_delta_by_key():
+    first = SeedDelta({}, ["code"])
+    assert len(first.changed(_table([["fr", "France"], ["de", "Germany"]])).rows) == 2
+
+    second = SeedDelta(first.hashes, ["code"])
+    table = _table([["fr", "France"], ["de", "Deutschland"], ["it", "Italy"]])
+    assert [list(row) for row in second.changed(table).rows] == [
+        ["de", "Deutschland"],
+        ["it", "Italy"],
+    ]
+
+
+def test_seed_delta_duplicate_key():
+    table = _table([["fr", "France"], ["de", "Germany"], ["fr", "République"]])
+    with pytest.raises(DbtRuntimeError, match='not unique.*\\["fr"\\]'):
+        SeedDelta({}, ["code"]).changed(table)
+
+
+def test_seed_delta_keeps_seed_types():
+    table = agate.Table(
+        [["a", "1"], ["b", "2.5"]], ["code", "amount"], [agate.Text(), agate.Number()]
+    )
+    previous = SeedDelta({}, ["code"])
+    previous.changed(
+        agate.Table([["b", "2.5"]], table.column_names, table.column_types)
+    )
+
+    changed = SeedDelta(previous.hashes, ["code"]).changed(table)
+
+    assert [json.loads(r) for r in encode_table_records(changed)] == [
+        {"code": "a", "amount": 1.0}
+    ]
+    assert isinstance(json.loads(encode_table_records(changed)[0])["amount"], float)
+
+
+def test_seed_delta_without_key():
+    first = SeedDelta({}, None)
+    first.changed(_table([["fr", "France"]]))
+    second = SeedDelta(first.hashes, None)
+    changed = second.changed(_table([["fr", "France"], ["fr", "République"]]))
+    assert [list(row) for row in changed.rows] == [["fr", "République"]]
+    with pytest.raises(DbtRuntimeError, match="missing"):
+        SeedDelta({}, ["missing"]).changed(changed)
+
+
+def test_seed_state_store(tmp_path):
+    path = str(tmp_path / SeedStateStore.FILE_NAME)
+    store = SeedStateStore(path)
+    store.put("seed.p.countries", "kafka.countries", {"k": "h"})
+    store.flush()
+
+    reloaded = SeedStateStore(path)
+    assert reloaded.rows("seed.p.countries", "kafka.countries") == {"k": "h"}
+    assert reloaded.rows("seed.p.countries", "other.countries") == {}
+
+
+def test_seed_delta_recorded_after_load(tmp_path):
+    config = MagicMock()
+    config.project_target_path = str(tmp_path)
+    adapter = DeltastreamAdapter(config, get_context("spawn"))
+    table = _table([["fr", "France"], ["de", "Germany"]])
+
+    assert len(adapter.seed_delta("seed.p.c", "c", "kafka", table, "code").rows) == 2
+    # Not recorded until the seed is loaded
+    assert len(adapter.seed_delta("seed.p.c", "c", "kafka", table, "code").rows) == 2
+    adapter.record_seed_delta("seed.p.c")
+    assert len(adapter.seed_delta("seed.p.c", "c", "kafka", table, "code").rows) == 0
+    assert (
+        len(
+            adapter.seed_delta(
+                "seed.p.c", "c", "kafka", table, "code", full_refresh=True
+            ).rows
+        )
+        == 2
+    )
+
+    adapter.record_seed_delta("seed.p.c")
+    changed = adapter.seed_delta(
+        "seed.p.c", "c", "kafka", _table([["fr", "France"]]), "code"
+    )
+    # A removed row is not loaded
+    assert changed.rows == []
+
+    adapter._seed_state.flush()
+    assert os.path.exists(tmp_path / SeedStateStore.FILE_NAME)
+
+
+class EmptyRows:
+    def __init__(self):
+        self.closed = False
+
+    def columns(self):
+        return []
+
+    async def __aiter__(self):
+        for row in ():
+            yield row
+
+    async def close(self):
+        self.closed = True
+
+
+def _manager(query, monkeypatch):
+    """A connection manager whose thread connection and in-flight slot clients run `query(client, sql)`"""
+    clients = []
+
+    def open_client(credentials=None):
+        client = Mock()
+
+        async def run(sql):
+            return await query(client, sql)
+
+        client.query = run
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(
+        "dbt.adapters.deltastream.connections.create_deltastream_client", open_client
+    )
+    manager = DeltastreamConnectionManager(profile="test", mp_context=threading)
+    connection = Mock()
+    connection.handle = open_client()
+    manager.get_thread_connection = lambda: connection
+    return manager, clients
+
+
+class TestExecutePipelined:
+    def test_bounded_in_flight_and_lane_order(self, monkeypatch):
+        in_flight = 0
+        peak = 0
+        executed = []
+
+        async def query(client, sql):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            executed.append(sql)
+            return EmptyRows()
+
+        manager, _ = _manager(query, monkeypatch)
+        lanes = [[f"{lane}-{i}" for i in range(3)] for lane in range(5)]
+        assert manager.execute_pipelined(lanes, 2) == 15
+        assert peak == 2
+        for lane in range(5):
+            positions = [executed.index(f"{lane}-{i}") for i in range(3)]
+            assert positions == sorted(positions)
+
+    def test_one_client_per_in_flight_slot(self, monkeypatch):
+        busy = set()
+        shared = []
+        results = []
+
+        async def query(client, sql):
+            if id(client) in busy:
+                shared.append(sql)
+            busy.add(id(client))
+            await asyncio.sleep(0.01)
+            busy.discard(id(client))
+            results.append(EmptyRows())
+            return results[-1]
+
+        manager, clients = _manager(query, monkeypatch)
+        lanes = [[f"{lane}-{i}" for i in range(2)] for lane in range(6)]
+        assert manager.execute_pipelined(lanes, 3) == 12
+        # The thread connection and one client for each other slot
+        assert len(clients) == 3
+        assert shared == []
+        assert all(rows.closed for rows in results)
+
+    def test_failure_stops_lanes(self, monkeypatch):
+        executed = []
+
+        async def query(client, sql):
+            await asyncio.sleep(0)
+            if sql == "0-0":
+                raise RuntimeError("insert failed")
+            executed.append(sql)
+            return EmptyRows()
+
+        manager, _ = _manager(query, monkeypatch)
+        lanes = [[f"{lane}-{i}" for i in range(3)] for lane in range(4)]
+        with pytest.raises(RuntimeError, match="insert failed"):
+            manager.execute_pipelined(lanes, 1)
+        assert executed == []
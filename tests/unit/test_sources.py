@@ -0,0 +1,89 @@
+"""Unit tests for the dependency-aware parallel source deployment."""
+
+import threading
+from contextlib import contextmanager
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.deltastream.impl import DeltastreamAdapter
+from dbt.adapters.deltastream.sources import plan_source_layers
+
+
+def _node(identifier, materialized):
+    return {"identifier": identifier, "config": {"materialized": materialized}}
+
+
+NODES = [
+    _node("pageviews", "stream"),
+    _node("users", "changelog"),
+    _node("kafka", "store"),
+    _node("topic_entity", "entity"),
+    _node("udf", "function"),
+    _node("jar", "function_source"),
+    _node("protos", "descriptor_source"),
+    _node("plain", None),
+]
+
+
+def test_plan_source_layers():
+    layers = [
+        sorted(node["identifier"] for node in layer)
+        for layer in plan_source_layers(NODES)
+    ]
+    assert layers == [
+        ["jar", "protos"],
+        ["kafka", "udf"],
+        ["topic_entity"],
+        ["pageviews", "plain", "users"],
+    ]
+
+
+@pytest.fixture
+def adapter():
+    config = MagicMock()
+    config.threads = 4
+    adapter_instance = DeltastreamAdapter(config, get_context("spawn"))
+    adapter_instance.connections = MagicMock()
+
+    @contextmanager
+    def connection_named(name):
+        yield
+
+    adapter_instance.connection_named = connection_named
+    return adapter_instance
+
+
+def test_layers_created_in_order(adapter):
+    created = []
+    lock = threading.Lock()
+
+    def execute_macro(name, kwargs):
+        with lock:
+            created.append(kwargs["node"]["identifier"])
+
+    adapter.execute_macro = execute_macro
+
+    assert adapter.create_sources_parallel(NODES) == len(NODES)
+    position = {identifier: index for index, identifier in enumerate(created)}
+    assert position["kafka"] < position["topic_entity"] < position["pageviews"]
+    assert position["jar"] < position["udf"]
+    assert position["protos"] < position["users"]
+
+
+def test_failure_stops_later_layers(adapter):
+    created = []
+
+    def execute_macro(name, kwargs):
+        if kwargs["node"]["identifier"] == "kafka":
+            raise Exception("store failed")
+        created.append(kwargs["node"]["identifier"])
+
+    adapter.execute_macro = execute_macro
+
+    with pytest.raises(DbtRuntimeError, match="kafka: store failed"):
+        adapter.create_sources_parallel(NODES, max_workers=2)
+    assert "pageviews" not in created
+    assert "udf" in created
@@ -0,0 +1,59 @@
+"""Unit tests for the JSON state files kept across invocations."""
+
+import json
+
+from dbt.adapters.deltastream.state_file import JsonStateFile
+
+
+class RecordsFile(JsonStateFile):
+    SECTION = "records"
+    DESCRIPTION = "test records"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.records = self._read()
+
+    def _snapshot(self):
+        return self.records
+
+
+def test_flush_and_read(tmp_path):
+    path = str(tmp_path / "nested" / "records.json")
+    state = RecordsFile(path)
+    assert state.records == {}
+    state.flush()
+    assert not (tmp_path / "nested").exists()
+
+    state.records["a"] = 1
+    state._dirty = True
+    state.flush()
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"version": 1, "records": {"a": 1}}
+    assert RecordsFile(path).records == {"a": 1}
+
+
+def test_other_version_and_unreadable_files_are_ignored(tmp_path):
+    path = tmp_path / "records.json"
+    path.write_text(json.dumps({"version": 2, "records": {"a": 1}}))
+    assert RecordsFile(str(path)).records == {}
+    path.write_text("{not json")
+    assert RecordsFile(str(path)).records == {}
+
+
+def test_write_failure_keeps_changes(tmp_path, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(
+        "dbt.adapters.deltastream.state_file.logger.warning", warnings.append
+    )
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    state = RecordsFile(str(blocker / "records.json"))
+    state.records["a"] = 1
+    state._dirty = True
+
+    state.flush()
+
+    assert len(warnings) == 1
+    assert "test records" in warnings[0]
+    assert state._dirty